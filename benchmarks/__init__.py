@@ -0,0 +1,17 @@
+"""
+Benchmark suite for SimplyConvertFile.
+
+The suite measures the conversion pipeline hot paths (format detection,
+target lookup, rule resolution, template building, command sanitizing and
+subprocess overhead) as well as end-to-end batch throughput per converter
+type on synthetic fixtures generated locally.
+
+Benchmarks follow the asv naming conventions (classes with ``setup`` and
+``time_*``/``track_*`` methods, optional ``params``) and are run with the
+bundled runner, which stores one JSON result file per git commit so
+regressions are visible between commits:
+
+    python -m benchmarks                      # run everything
+    python -m benchmarks -k hotpaths          # filter by name
+    python -m benchmarks --compare HEAD~1     # compare against a stored run
+"""
@@ -0,0 +1,60 @@
+"""
+End-to-end batch throughput benchmarks per converter type.
+
+Each benchmark converts a batch of synthetic fixtures through the real
+ConverterFactory/Converter path in batch mode (no dialogs). Benchmarks whose
+tool or GTK bindings are unavailable are skipped.
+"""
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.fixtures import get_fixtures
+
+BATCH_SIZE = 8
+
+# (converter type, fixture extension, target format, required tool)
+CASES = [
+    ("image", "png", "JPEG", "convert"),
+    ("video", "mp4", "WEBM", "ffmpeg"),
+    ("audio", "wav", "MP3", "ffmpeg"),
+    ("office", "rtf", "PDF", "libreoffice"),
+    ("spreadsheet", "csv", "ODS", "libreoffice"),
+    ("markup", "md", "HTML", "pandoc"),
+    ("data", "json", "YAML", "python3"),
+    ("archive", "zip", "7Z", "7z"),
+]
+
+
+class BatchThroughput:
+    """Files converted per second for a batch of identical inputs."""
+
+    params = CASES
+    param_names = ["case"]
+    unit = "files/s"
+
+    def setup(self, case: tuple) -> None:
+        _, extension, _, tool = case
+        if not shutil.which(tool):
+            raise NotImplementedError(f"{tool} is not installed")
+        from simplyconvertfile.core.factory import ConverterFactory
+
+        self.factory = ConverterFactory
+        self.files = get_fixtures(extension, BATCH_SIZE)
+        self.output_dir = Path(tempfile.mkdtemp(prefix="scf_bench_"))
+
+    def teardown(self, case: tuple) -> None:
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def track_files_per_second(self, case: tuple) -> float:
+        target_format = case[2]
+        start = time.perf_counter()
+        for file in self.files:
+            converter = self.factory.create_converter(
+                file, target_format, batch_mode=True, output_dir=self.output_dir
+            )
+            if not converter or not converter.convert():
+                raise RuntimeError(f"conversion of {file.name} failed")
+        return round(len(self.files) / (time.perf_counter() - start), 3)
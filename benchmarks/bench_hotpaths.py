@@ -0,0 +1,251 @@
+"""
+Benchmarks for the conversion pipeline hot paths.
+
+These run for every file of a batch, so their per-call cost multiplies with
+the batch size: format detection, target lookup, rule resolution, template
+building, command sanitizing and subprocess spawn overhead.
+"""
+
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.fixtures import synthetic_paths
+
+SOURCE_FORMATS = ["JPEG", "MP4", "FLAC", "DOCX", "XLSX", "MD", "JSON", "TAR.GZ"]
+
+
+class FormatDetection:
+    """FileValidator.get_file_format over many distinct paths."""
+
+    def setup(self) -> None:
+        from simplyconvertfile.utils.validation import FileValidator
+
+        self.validator = FileValidator
+        self.paths = synthetic_paths(2000)
+
+    def time_get_file_format(self) -> None:
+        self.validator._get_extension_format.cache_clear()
+        for path in self.paths:
+            self.validator.get_file_format(path)
+
+    def time_get_base_name_and_extension(self) -> None:
+        self.validator.get_base_name_and_extension.cache_clear()
+        for path in self.paths:
+            self.validator.get_base_name_and_extension(path)
+
+
+class FormatLookup:
+    """Target format and rule lookups in FormatConfiguration."""
+
+    params = SOURCE_FORMATS
+    param_names = ["source_format"]
+
+    def setup(self, source_format: str) -> None:
+        from simplyconvertfile.config import format_config
+
+        self.config = format_config
+        self.targets = format_config.get_available_formats(source_format)
+
+    def time_get_available_formats_uncached(self, source_format: str) -> None:
+        self.config.get_available_formats.cache_clear()
+        self.config.get_available_formats(source_format)
+
+    def time_get_conversion_rule(self, source_format: str) -> None:
+        for target in self.targets:
+            self.config.get_conversion_rule(source_format, target)
+
+    def time_get_default_converter_type(self, source_format: str) -> None:
+        for target in self.targets:
+            self.config.get_default_converter_type(source_format, target)
+
+
+
+class RoutePlanning:
+    """Multi-hop route planning over the whole format graph."""
+
+    def setup(self) -> None:
+        from simplyconvertfile.config import format_config
+
+        self.config = format_config
+        self.config.get_route_planner()
+
+    def time_build_route_planner(self) -> None:
+        self.config.get_route_planner.cache_clear()
+        self.config.get_route_planner()
+
+    def time_get_reachable_formats(self) -> None:
+        self.config.get_routed_formats.cache_clear()
+        self.config.get_reachable_formats.cache_clear()
+        for source_format in SOURCE_FORMATS:
+            self.config.get_reachable_formats(source_format)
+
+    def track_routed_targets(self) -> int:
+        return sum(
+            len(self.config.get_routed_formats(source_format))
+            for source_format in self.config.get_route_planner().routes
+        )
+
+
+class RuleSelection:
+    """Cost model predictions made for each file when selecting a rule."""
+
+    def setup(self) -> None:
+        from simplyconvertfile.utils.rule_timings import RuleTimings
+
+        self.timings = RuleTimings()
+        self.keys = ["DOCX>TXT:office", "DOCX>TXT:pandoc", "DOCX>TXT:custom"]
+        self.timings._get_samples().update(
+            {
+                key: [[size * 1000, 0.1 + size * index / 1000] for size in range(50)]
+                for index, key in enumerate(self.keys, start=1)
+            }
+        )
+
+    def time_predict_candidates(self) -> None:
+        for size in range(0, 10_000_000, 100_000):
+            for key in self.keys:
+                self.timings.predict(key, size)
+
+class TemplateBuild:
+    """TemplateProcessor.build_command_from_template per converter type."""
+
+    params = [
+        ("image", "PNG", "photo.jpg"),
+        ("video", "MKV", "clip.mp4"),
+        ("audio", "MP3", "track.flac"),
+        ("office", "PDF", "report.docx"),
+        ("archive", "7Z", "bundle.zip"),
+        ("special", "YAML", "data.json"),
+    ]
+    param_names = ["case"]
+
+    def setup(self, case: tuple) -> None:
+        from simplyconvertfile.converters.helpers.template_processor import (
+            TemplateProcessor,
+        )
+
+        converter_type, target_format, name = case
+        self.processor = TemplateProcessor(converter_type, target_format)
+        self.input_file = Path("/benchmarks/input") / name
+        self.output_file = self.input_file.with_suffix("." + target_format.lower())
+
+    def time_build_command(self, case: tuple) -> None:
+        result = self.processor.build_command_from_template(
+            input_file=self.input_file, output_file=self.output_file
+        )
+        temp_manager = result[4]
+        if temp_manager and hasattr(temp_manager, "__exit__"):
+            temp_manager.__exit__(None, None, None)
+
+
+class Sanitizer:
+    """CommandSanitizer.check_command on typical conversion commands."""
+
+    params = [
+        "ffmpeg -i '/home/user/Videos/clip.mp4' -codec:v libx265 -crf 23 "
+        "'/home/user/Videos/clip.mkv'",
+        "7z x '/home/user/a.zip' -o'/tmp/scf_x/' -bb0 && cd '/tmp/scf_x' && "
+        "tar -cf - . | lzma -c > '/home/user/a.tar.lzma'",
+    ]
+    param_names = ["command"]
+
+    def setup(self, command: str) -> None:
+        from simplyconvertfile.converters.helpers.sanitizer import CommandSanitizer
+
+        self.sanitizer = CommandSanitizer()
+
+    def time_check_command(self, command: str) -> None:
+        self.sanitizer.check_command(command)
+
+
+class BatchSanitizer:
+    """Safety checks of one template's commands across a 1000-file batch."""
+
+    template = (
+        "ffmpeg -i '{input}' -codec:v libx265 -crf 23 '{output}' "
+        "&& test -f '{output}'"
+    )
+
+    def setup(self) -> None:
+        from simplyconvertfile.converters.helpers.commands import CommandParser
+        from simplyconvertfile.converters.helpers.sanitizer import CommandSanitizer
+
+        self.sanitizer = CommandSanitizer()
+        self.commands = [
+            CommandParser.format_template(
+                self.template,
+                input_file=path,
+                output_file=path.with_suffix(".mkv"),
+            )
+            for path in synthetic_paths(1000)
+        ]
+
+    def time_check_each_command(self) -> None:
+        for command in self.commands:
+            self.sanitizer.check_command(command)
+
+    def time_check_with_template(self) -> None:
+        for command in self.commands:
+            self.sanitizer.check_command(command, self.template)
+
+
+class DisabledLogging:
+    """Per-file debug calls of a 10k-file batch with debug logging off."""
+
+    def setup(self) -> None:
+        from simplyconvertfile.utils.logging import Logger
+
+        self.logger = Logger(enabled=False)
+        self.paths = synthetic_paths(10000)
+
+    def time_debug_calls(self) -> None:
+        log = self.logger
+        for path in self.paths:
+            log.debug("Validating single file: {}", path)
+            log.debug("Getting file format for: {}", path)
+            log.debug("Format recognized: {}", "JPG")
+            log.debug("Creating converter for {} -> {}", "JPG", "PNG")
+            log.debug("Executing single command: {}, shell: {}", path, False)
+
+
+class SubprocessOverhead:
+    """Spawn overhead of run_cancellable_command against a bare subprocess."""
+
+    def setup(self) -> None:
+        from simplyconvertfile.converters.helpers.execution import CommandExecutor
+
+        self.executor = CommandExecutor
+
+    def time_subprocess_run_baseline(self) -> None:
+        subprocess.run(["true"], capture_output=True)
+
+    def time_run_cancellable_command(self) -> None:
+        self.executor.run_cancellable_command(["true"], cancel_check=lambda: False)
+
+
+class CancellationLatency:
+    """Time from a cancel request to a shell pipeline being fully stopped."""
+
+    unit = "ms"
+
+    def setup(self) -> None:
+        from simplyconvertfile.converters.helpers.execution import CommandExecutor
+
+        self.executor = CommandExecutor
+
+    def track_cancel_shell_pipeline(self) -> float:
+        cancel = threading.Event()
+        cancelled_at = []
+
+        def request_cancel() -> None:
+            time.sleep(0.1)
+            cancelled_at.append(time.perf_counter())
+            cancel.set()
+
+        threading.Thread(target=request_cancel).start()
+        self.executor.run_cancellable_command(
+            "yes | gzip -1 > /dev/null", shell=True, cancel_check=cancel.is_set
+        )
+        return round((time.perf_counter() - cancelled_at[0]) * 1000, 2)
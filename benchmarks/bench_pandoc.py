@@ -0,0 +1,56 @@
+"""
+Markup conversion throughput with and without the warm pandoc server.
+
+Converts 1,000 small Markdown files to HTML, either running one ``pandoc``
+process per file or sending them to a single ``pandoc server``. Skipped when
+pandoc is not installed; the server case also needs pandoc 3 (``pandoc
+server``).
+"""
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.fixtures import get_fixtures
+
+FILE_COUNT = 1000
+
+
+class PandocThroughput:
+    """Markdown files converted to HTML per second."""
+
+    params = ["process", "server"]
+    param_names = ["mode"]
+    unit = "files/s"
+
+    def setup(self, mode: str) -> None:
+        if not shutil.which("pandoc"):
+            raise NotImplementedError("pandoc is not installed")
+        from simplyconvertfile.converters.helpers.execution import CommandExecutor
+        from simplyconvertfile.converters.helpers.pandoc_server import PandocServer
+
+        self.executor = CommandExecutor
+        self.server = PandocServer()
+        self.files = get_fixtures("md", FILE_COUNT)
+        self.output_dir = Path(tempfile.mkdtemp(prefix="scf_bench_"))
+        # Start the server before timing, as a running batch would have
+        if mode == "server" and not self.server.start():
+            raise NotImplementedError("pandoc server is not available")
+
+    def teardown(self, mode: str) -> None:
+        self.server.stop()
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def track_files_per_second(self, mode: str) -> float:
+        start = time.perf_counter()
+        for file in self.files:
+            output = self.output_dir / f"{file.stem}.html"
+            command = ["pandoc", str(file), "-o", str(output)]
+            if mode == "server":
+                result = self.server.run_step(command)
+                if result != (0, ""):
+                    raise RuntimeError(f"conversion of {file.name} failed")
+            elif not self.executor.run_cancellable_command(command).success:
+                raise RuntimeError(f"conversion of {file.name} failed")
+        return round(len(self.files) / (time.perf_counter() - start), 3)
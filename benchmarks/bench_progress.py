@@ -0,0 +1,85 @@
+"""
+Progress dialog update benchmarks.
+
+Worker threads hammer a ProgressModel while the main thread refreshes a
+ProgressDisplay as often as the dialog timeout would. The number of widget
+calls per second must stay bounded by ProgressDisplay.MAX_FPS (two calls per
+frame: fraction and message) whatever the number of jobs.
+"""
+
+import threading
+import time
+
+DURATION = 0.5
+# Dialog timeout used by BatchStateManager (PROGRESS_UPDATE_TIMEOUT_MS)
+TICK_INTERVAL = 0.01
+
+
+class _FakeProgressBar:
+    """Counts the calls a GTK progress bar would receive."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def set_fraction(self, fraction: float) -> None:
+        self.calls += 1
+
+    def pulse(self) -> None:
+        self.calls += 1
+
+
+class _FakeWindow:
+    """Minimal stand-in for ProgressbarDialogWindow."""
+
+    def __init__(self) -> None:
+        self.progressbar = _FakeProgressBar()
+        self.messages = 0
+
+    def set_message(self, message: str) -> None:
+        self.messages += 1
+
+
+class ProgressUpdates:
+    """GTK calls per second made by the progress display."""
+
+    params = [1, 8, 64]
+    param_names = ["jobs"]
+    unit = "calls/s"
+
+    def setup(self, jobs: int) -> None:
+        from simplyconvertfile.utils.progress import ProgressDisplay, ProgressModel
+
+        self.model = ProgressModel(total=jobs)
+        self.window = _FakeWindow()
+        self.display = ProgressDisplay(self.window, self.model)
+
+    def _work(self, job_id: int, stop: threading.Event) -> None:
+        self.model.start_job(job_id, f"file{job_id}.mp4")
+        step = 0
+        while not stop.is_set():
+            step += 1
+            self.model.update_job(job_id, (step % 1000) / 1000)
+            if step % 64 == 0:
+                time.sleep(0)
+
+    def track_gtk_calls_per_second(self, jobs: int) -> float:
+        stop = threading.Event()
+        workers = [
+            threading.Thread(target=self._work, args=(job_id, stop))
+            for job_id in range(jobs)
+        ]
+        for worker in workers:
+            worker.start()
+
+        start = time.perf_counter()
+        while time.perf_counter() - start < DURATION:
+            self.display.refresh()
+            time.sleep(TICK_INTERVAL)
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        for worker in workers:
+            worker.join()
+
+        calls = self.window.progressbar.calls + self.window.messages
+        return round(calls / elapsed, 1)
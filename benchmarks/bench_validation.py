@@ -0,0 +1,52 @@
+"""
+Benchmarks for validating the files selected by the user.
+
+A large selection (tens of thousands of files) is validated before the format
+dialog appears, so this path dominates the time to first dialog.
+"""
+
+from benchmarks.fixtures import get_file_tree, get_fixtures
+
+
+class FileListValidation:
+    """FileValidator.validate_file_list on a synthetic file tree."""
+
+    params = [1000, 100000]
+    param_names = ["files"]
+
+    def setup(self, files: int) -> None:
+        from simplyconvertfile.utils.validation import FileValidator
+
+        self.validator = FileValidator
+        self.paths = get_file_tree(files)
+
+    def time_validate_file_list(self, files: int) -> None:
+        self.validator._get_extension_format.cache_clear()
+        self.validator.validate_file_list(self.paths)
+
+    def time_validate_single_files(self, files: int) -> None:
+        self.validator._get_extension_format.cache_clear()
+        for path in self.paths:
+            self.validator.validate_single_file(path)
+
+
+class ContentSniffing:
+    """Magic-byte sniffing of real files, cold and from the inode cache."""
+
+    def setup(self) -> None:
+        from simplyconvertfile.utils.sniffer import ContentSniffer
+
+        self.sniffer_class = ContentSniffer
+        self.paths = get_fixtures("png", 200) + get_fixtures("zip", 200)
+        self.warm_sniffer = ContentSniffer()
+        for path in self.paths:
+            self.warm_sniffer.sniff(path)
+
+    def time_sniff_cold(self) -> None:
+        sniffer = self.sniffer_class()
+        for path in self.paths:
+            sniffer.sniff(path)
+
+    def time_sniff_cached(self) -> None:
+        for path in self.paths:
+            self.warm_sniffer.sniff(path)
@@ -0,0 +1,198 @@
+"""
+Synthetic fixtures for the benchmark suite.
+
+All fixtures are generated locally (pure Python where possible, the
+conversion tools themselves otherwise) into ``.benchmarks/fixtures`` and
+reused between runs. Nothing is downloaded.
+"""
+
+import json
+import shutil
+import struct
+import subprocess
+import tarfile
+import wave
+import zipfile
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from benchmarks.runner import RESULTS_DIR
+
+FIXTURES_DIR = RESULTS_DIR / "fixtures"
+
+
+def _write_png(path: Path, width: int = 320, height: int = 240) -> None:
+    """Write an RGB gradient PNG."""
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    rows = b"".join(
+        b"\x00"
+        + bytes(
+            channel
+            for x in range(width)
+            for channel in (x * 255 // width, y * 255 // height, 128)
+        )
+        for y in range(height)
+    )
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    path.write_bytes(
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _write_wav(path: Path, seconds: float = 1.0, rate: int = 44100) -> None:
+    """Write a silent mono 16-bit WAV file."""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\x00\x00" * int(seconds * rate))
+
+
+def _write_csv(path: Path, rows: int = 200) -> None:
+    """Write a small CSV table."""
+    lines = ["id,name,value"]
+    lines += [f"{i},item{i},{i * 1.5}" for i in range(rows)]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def _write_json(path: Path, items: int = 200) -> None:
+    """Write a small JSON document."""
+    path.write_text(
+        json.dumps({"items": [{"id": i, "name": f"item{i}"} for i in range(items)]})
+    )
+
+
+def _write_markdown(path: Path, sections: int = 10) -> None:
+    """Write a small Markdown document."""
+    parts = [f"## Section {i}\n\nSome *text* with a [link](https://example.com).\n"
+             for i in range(sections)]
+    path.write_text("# Benchmark\n\n" + "\n".join(parts))
+
+
+def _write_rtf(path: Path, paragraphs: int = 20) -> None:
+    """Write a small RTF document."""
+    body = "".join(f"Paragraph {i}.\\par\n" for i in range(paragraphs))
+    path.write_text("{\\rtf1\\ansi\\deff0 {\\fonttbl {\\f0 Times;}}\n" + body + "}")
+
+
+def _write_tar(path: Path) -> None:
+    """Write a small uncompressed TAR archive."""
+    source = path.with_suffix(".txt")
+    source.write_text("benchmark payload\n" * 1000)
+    with tarfile.open(path, "w") as archive:
+        archive.add(source, arcname=source.name)
+    source.unlink()
+
+
+def _write_zip(path: Path) -> None:
+    """Write a small ZIP archive."""
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("payload.txt", "benchmark payload\n" * 1000)
+
+
+def _write_mp4(path: Path) -> None:
+    """Write a one second test-pattern MP4 (requires ffmpeg)."""
+    if not shutil.which("ffmpeg"):
+        raise NotImplementedError("ffmpeg is not installed")
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error", "-y",
+            "-f", "lavfi", "-i", "testsrc=size=320x240:rate=25:duration=1",
+            "-pix_fmt", "yuv420p", str(path),
+        ],
+        check=True,
+    )
+
+
+GENERATORS: Dict[str, Callable[[Path], None]] = {
+    "png": _write_png,
+    "wav": _write_wav,
+    "csv": _write_csv,
+    "json": _write_json,
+    "md": _write_markdown,
+    "rtf": _write_rtf,
+    "tar": _write_tar,
+    "zip": _write_zip,
+    "mp4": _write_mp4,
+}
+
+
+def get_fixtures(extension: str, count: int = 1) -> List[Path]:
+    """Return ``count`` fixture files with the given extension.
+
+    Files are generated on first use and reused afterwards.
+
+    Raises:
+        NotImplementedError: If the fixture cannot be generated here.
+    """
+    directory = FIXTURES_DIR / extension
+    directory.mkdir(parents=True, exist_ok=True)
+    generator = GENERATORS[extension]
+
+    paths = []
+    for index in range(count):
+        path = directory / f"sample_{index:04d}.{extension}"
+        if not path.exists():
+            if index == 0:
+                generator(path)
+            else:
+                shutil.copyfile(directory / f"sample_0000.{extension}", path)
+        paths.append(path)
+    return paths
+
+
+def synthetic_paths(count: int) -> List[Path]:
+    """Return ``count`` distinct, non-existent paths across all format groups.
+
+    Useful for benchmarking pure lookups without touching the filesystem.
+    """
+    extensions = [
+        "jpg", "png", "tar.gz", "mp4", "mkv", "flac", "mp3", "docx", "pdf",
+        "xlsx", "pptx", "md", "json", "yaml", "tar.bz2", "webm", "unknown",
+    ]
+    return [
+        Path(f"/benchmarks/dir{i % 50}/file_{i}.{extensions[i % len(extensions)]}")
+        for i in range(count)
+    ]
+
+
+def get_file_tree(count: int, files_per_directory: int = 1000) -> List[Path]:
+    """Return ``count`` empty files spread over subdirectories.
+
+    The tree is generated on first use and reused afterwards. Files cycle
+    through the same extensions as synthetic_paths(), so some of them are
+    unsupported, and every directory also contains one subdirectory whose
+    path is included as an invalid selection.
+    """
+    extensions = [
+        "jpg", "png", "tar.gz", "mp4", "mkv", "flac", "mp3", "docx", "pdf",
+        "xlsx", "pptx", "md", "json", "yaml", "tar.bz2", "webm", "unknown",
+    ]
+    root = FIXTURES_DIR / f"tree_{count}"
+    marker = root / ".complete"
+
+    paths = []
+    for index in range(count):
+        directory = root / f"dir_{index // files_per_directory:04d}"
+        if index % files_per_directory == 0:
+            paths.append(directory / "subdir.jpg")
+        paths.append(
+            directory / f"file_{index:06d}.{extensions[index % len(extensions)]}"
+        )
+
+    if not marker.exists():
+        for path in paths:
+            if path.name == "subdir.jpg":
+                path.mkdir(parents=True, exist_ok=True)
+            else:
+                path.touch()
+        marker.touch()
+    return paths
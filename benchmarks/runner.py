@@ -0,0 +1,259 @@
+"""
+Minimal asv-compatible benchmark runner.
+
+Discovers benchmark classes in ``benchmarks/bench_*.py``, times their
+``time_*`` methods, records their ``track_*`` values and stores the results
+as JSON keyed by git commit under ``.benchmarks/``. Stored runs can be
+compared to spot regressions between commits.
+
+A benchmark ``setup`` raising ``NotImplementedError`` marks the benchmark as
+skipped (e.g. when a conversion tool is unavailable), matching asv. An
+``ImportError`` in ``setup`` (e.g. missing GTK bindings) is treated the same.
+"""
+
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCHMARKS_DIR.parent
+RESULTS_DIR = REPO_ROOT / ".benchmarks"
+
+# Minimum wall time for a single timing sample and number of samples taken
+MIN_SAMPLE_TIME = 0.2
+REPEAT = 5
+# Ratio above which a benchmark is reported as a regression
+DEFAULT_REGRESSION_FACTOR = 1.2
+# Units where a smaller value is better; rates ("files/s") are the opposite
+DURATION_UNITS = {"s", "ms"}
+
+
+def _ensure_importable() -> None:
+    """Make the in-tree package importable when it is not installed."""
+    try:
+        import simplyconvertfile  # noqa: F401
+    except ImportError:
+        sys.path.insert(0, str(REPO_ROOT / "src"))
+
+
+def _git(*args: str) -> Optional[str]:
+    """Run a git command in the repository and return its stripped output."""
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _discover(keyword: Optional[str]) -> Iterator[Tuple[str, type, str]]:
+    """Yield (benchmark_name, class, method_name) for all matching benchmarks."""
+    for module_path in sorted(BENCHMARKS_DIR.glob("bench_*.py")):
+        module = importlib.import_module(f"benchmarks.{module_path.stem}")
+        for class_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            for method_name in sorted(vars(cls)):
+                if not method_name.startswith(("time_", "track_")):
+                    continue
+                name = f"{module_path.stem}.{class_name}.{method_name}"
+                if keyword and keyword not in name:
+                    continue
+                yield name, cls, method_name
+
+
+def _param_combinations(cls: type) -> List[Tuple[Any, ...]]:
+    """Expand the asv-style ``params`` attribute into argument tuples."""
+    params = getattr(cls, "params", None)
+    if params is None:
+        return [()]
+    if len(getattr(cls, "param_names", ())) > 1:
+        return list(itertools.product(*params))
+    return [(p,) for p in params]
+
+
+def _time_call(func, args: Tuple[Any, ...]) -> float:
+    """Return the median per-call time of ``func(*args)`` in seconds."""
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    number = max(1, int(MIN_SAMPLE_TIME / elapsed)) if elapsed > 0 else 1000
+
+    samples = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*args)
+        samples.append((time.perf_counter() - start) / number)
+    return statistics.median(samples)
+
+
+def _run_one(cls: type, method_name: str, args: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Run a single benchmark for one parameter combination."""
+    instance = cls()
+    try:
+        if hasattr(instance, "setup"):
+            instance.setup(*args)
+    except (NotImplementedError, ImportError) as e:
+        return {"status": "skipped", "reason": str(e)}
+    except Exception as e:  # noqa: BLE001 - report failures, keep running
+        return {"status": "failed", "reason": f"{type(e).__name__}: {e}"}
+
+    try:
+        method = getattr(instance, method_name)
+        if method_name.startswith("time_"):
+            return {"status": "ok", "value": _time_call(method, args), "unit": "s"}
+        value = method(*args)
+        return {
+            "status": "ok",
+            "value": value,
+            "unit": getattr(method, "unit", getattr(cls, "unit", "")),
+        }
+    except Exception as e:  # noqa: BLE001 - report failures, keep running
+        return {"status": "failed", "reason": f"{type(e).__name__}: {e}"}
+    finally:
+        if hasattr(instance, "teardown"):
+            instance.teardown(*args)
+
+
+def _format_value(value: Any, unit: str) -> str:
+    """Format a benchmark value for display."""
+    if unit != "s" or not isinstance(value, (int, float)):
+        return f"{value} {unit}".strip()
+    for scale, suffix in ((1, "s"), (1e-3, "ms"), (1e-6, "us")):
+        if value >= scale:
+            return f"{value / scale:.3f} {suffix}"
+    return f"{value / 1e-9:.1f} ns"
+
+
+def run(keyword: Optional[str]) -> Dict[str, Any]:
+    """Run all matching benchmarks and return the result document."""
+    _ensure_importable()
+    results: Dict[str, Dict[str, Any]] = {}
+
+    for name, cls, method_name in _discover(keyword):
+        for args in _param_combinations(cls):
+            key = f"{name}({', '.join(map(repr, args))})" if args else name
+            result = _run_one(cls, method_name, args)
+            results[key] = result
+            if result["status"] == "ok":
+                print(f"{key:<78} {_format_value(result['value'], result['unit'])}")
+            else:
+                print(f"{key:<78} {result['status']}: {result['reason']}")
+
+    return {
+        "commit": _git("rev-parse", "HEAD") or "unknown",
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def _result_path(commit: str) -> Path:
+    """Return the results file for a commit."""
+    return RESULTS_DIR / f"{commit[:12]}.json"
+
+
+def save(document: Dict[str, Any]) -> Path:
+    """Store a result document keyed by its commit."""
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    path = _result_path(document["commit"])
+    path.write_text(json.dumps(document, indent=2, sort_keys=True))
+    return path
+
+
+def _get_slowdown(value: float, previous: float, unit: str) -> Optional[float]:
+    """Get how many times worse a value is than a previous one.
+
+    Durations regress when they grow, rates (units ending in ``/s``) when
+    they drop. Values in other units are not compared.
+
+    Returns:
+        Optional[float]: The slowdown ratio, or None for other units.
+    """
+    if unit in DURATION_UNITS:
+        return value / previous
+    if unit.endswith("/s") and value:
+        return previous / value
+    return None
+
+
+def compare(
+    document: Dict[str, Any], reference: str, factor: float
+) -> List[str]:
+    """Compare a run against a stored reference run.
+
+    Durations and rates are shown as slowdowns (above 1 is worse); values in
+    other units as plain ratios.
+
+    Returns:
+        List[str]: Names of benchmarks that regressed by more than ``factor``.
+    """
+    commit = _git("rev-parse", reference) or reference
+    path = _result_path(commit)
+    if not path.exists():
+        print(f"No stored results for {reference} ({path.name})")
+        return []
+
+    baseline = json.loads(path.read_text())["results"]
+    regressions = []
+    print(f"\nComparison against {reference} ({commit[:12]}):")
+    for key, result in document["results"].items():
+        previous = baseline.get(key)
+        if not previous or result["status"] != "ok" or previous["status"] != "ok":
+            continue
+        if not isinstance(result["value"], (int, float)) or not previous["value"]:
+            continue
+        slowdown = None
+        if result["unit"] == previous["unit"]:
+            slowdown = _get_slowdown(
+                result["value"], previous["value"], result["unit"]
+            )
+        ratio = result["value"] / previous["value"] if slowdown is None else slowdown
+        marker = ""
+        if slowdown is not None and slowdown > factor:
+            marker = "  REGRESSED"
+            regressions.append(key)
+        print(f"{key:<78} {ratio:6.2f}x{marker}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for ``python -m benchmarks``."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", dest="keyword", help="only run matching benchmarks")
+    parser.add_argument(
+        "--compare", metavar="REF", help="compare against stored results of REF"
+    )
+    parser.add_argument(
+        "--factor",
+        type=float,
+        default=DEFAULT_REGRESSION_FACTOR,
+        help="slowdown ratio reported as a regression (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-save", action="store_true", help="do not store the results"
+    )
+    args = parser.parse_args(argv)
+
+    document = run(args.keyword)
+    if not args.no_save:
+        print(f"\nResults stored in {save(document)}")
+    if args.compare:
+        return 1 if compare(document, args.compare, args.factor) else 0
+    return 0
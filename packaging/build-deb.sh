@@ -60,6 +60,7 @@ mkdir -p "$PKG_DIR/$PYTHON_SITE/$APP_NAME"
 mkdir -p "$PKG_DIR/usr/bin"
 mkdir -p "$PKG_DIR/usr/share/applications"
 mkdir -p "$PKG_DIR/usr/share/icons/hicolor/48x48/apps"
+mkdir -p "$PKG_DIR/usr/lib/systemd/user"
 mkdir -p "$PKG_DIR/usr/share/doc/$APP_NAME"
 
 # --- Copy application files ---
@@ -98,6 +99,10 @@ cp "$PROJECT_DIR/packaging/simplyconvertfile.desktop" \
 cp "$PROJECT_DIR/src/$APP_NAME/resources/icon.png" \
    "$PKG_DIR/usr/share/icons/hicolor/48x48/apps/$APP_NAME.png"
 
+cp "$PROJECT_DIR/packaging/systemd/$APP_NAME.socket" \
+   "$PROJECT_DIR/packaging/systemd/$APP_NAME.service" \
+   "$PKG_DIR/usr/lib/systemd/user/"
+
 # --- Create documentation ---
 cp "$PROJECT_DIR/README.md" "$PKG_DIR/usr/share/doc/$APP_NAME/"
 
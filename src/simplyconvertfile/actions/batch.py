@@ -9,7 +9,7 @@ and processing conversions asynchronously.
 """
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from simplyconvertfile.actions import BaseAction
 from simplyconvertfile.converters.base import Converter
@@ -23,6 +23,7 @@ from .batch_helpers import (
     BatchFileProcessor,
     BatchStateManager,
     FormatValidator,
+    LibreOfficeChunk,
     OutputManager,
 )
 
@@ -37,7 +38,8 @@ class BatchAction(BaseAction):
     1. File validation and format compatibility checking
     2. Target format selection for all files
     3. Output directory creation and management
-    4. Asynchronous conversion processing with progress tracking
+    4. Asynchronous conversion processing with progress tracking, office
+       files sharing a LibreOffice invocation per chunk
     5. Error aggregation and reporting
     6. Completion notifications and cleanup
 
@@ -49,6 +51,7 @@ class BatchAction(BaseAction):
         file_processor: Handles asynchronous file conversion processing.
         state_manager: Tracks conversion progress and state.
         output_manager: Manages output directory creation and cleanup.
+        chunks: LibreOffice chunks not started yet, by their first file.
 
     Examples:
         >>> action = BatchAction(["file1.jpg", "file2.png", "file3.bmp"])
@@ -78,6 +81,7 @@ class BatchAction(BaseAction):
         self.file_processor = BatchFileProcessor()
         self.state_manager: Optional[BatchStateManager] = None
         self.output_manager: Optional[OutputManager] = None
+        self.chunks: Dict[Path, LibreOfficeChunk] = {}
 
     def run(self) -> bool:
         """Execute the complete batch conversion workflow.
@@ -125,6 +129,8 @@ class BatchAction(BaseAction):
 
         finally:
             self.file_processor.shutdown()
+            for chunk in self.chunks.values():
+                chunk.cleanup()
 
     def _validate_files(self) -> bool:
         """Validate all files and ensure format group compatibility.
@@ -257,9 +263,13 @@ class BatchAction(BaseAction):
         if not self.valid_files or not self.target_format:
             return
 
+        self._plan_libreoffice_chunks()
         self.state_manager = BatchStateManager(self.valid_files, self.target_format)
         self.state_manager.set_cancel_callback(self._handle_cancellation)
         self.state_manager.set_progress_update_callback(self._handle_progress_update)
+        self.state_manager.set_cancellation_complete_check(
+            self.file_processor.is_cancellation_complete
+        )
 
         notification.notify_batch_started(
             extension=self.target_format, total=len(self.valid_files)
@@ -273,6 +283,33 @@ class BatchAction(BaseAction):
 
         self._show_completion_results()
 
+    def _plan_libreoffice_chunks(self) -> None:
+        """Group office files converted by LibreOffice into chunks.
+
+        Chunked files are moved to the front of the batch, each chunk's files
+        next to each other: their targets were chosen before any conversion,
+        so they must be written before the other files pick theirs.
+
+        Returns:
+            None
+        """
+        chunks = LibreOfficeChunk.plan(
+            self.valid_files,
+            self.target_format or "",
+            self.output_manager.get_output_directory() if self.output_manager else None,
+            self._is_cancelled,
+        )
+        chunked = [file for chunk in chunks for file in chunk.files]
+        chunked_set = set(chunked)
+        self.valid_files = chunked + [
+            file for file in self.valid_files if file not in chunked_set
+        ]
+        self.chunks = {chunk.files[0]: chunk for chunk in chunks}
+
+    def _is_cancelled(self) -> bool:
+        """Check whether the user cancelled the batch conversion."""
+        return self.state_manager.is_cancelled() if self.state_manager else False
+
     def _handle_cancellation(self) -> None:
         """Handle user cancellation of the batch conversion.
 
@@ -298,10 +335,10 @@ class BatchAction(BaseAction):
             return
 
         if self.file_processor.is_conversion_complete():
-            result = self.file_processor.get_conversion_result()
-            if result:
-                success, converter = result
+            for success, converter in self.file_processor.get_conversion_results():
                 self._process_conversion_result(success, converter)
+            if not self.state_manager.is_complete():
+                self._start_next_conversion()
         elif (
             not self.file_processor.current_future
             and not self.state_manager.is_complete()
@@ -314,7 +351,7 @@ class BatchAction(BaseAction):
         """Process the result of a completed individual file conversion.
 
         Updates success/failure counts, sends notifications, and advances
-        to the next file in the batch.
+        to the next file in the batch, without starting its conversion.
 
         Args:
             success: True if the conversion succeeded, False otherwise.
@@ -341,14 +378,12 @@ class BatchAction(BaseAction):
 
         self.state_manager.move_to_next_file()
 
-        if not self.state_manager.is_complete():
-            self._start_next_conversion()
-
     def _start_next_conversion(self) -> None:
         """Start conversion of the next file in the batch.
 
         Retrieves the next file from the state manager and initiates
-        its conversion asynchronously.
+        its conversion asynchronously, along with the rest of its
+        LibreOffice chunk if it starts one.
 
         Returns:
             None
@@ -360,18 +395,21 @@ class BatchAction(BaseAction):
         if not next_file:
             return
 
-        def cancel_check() -> bool:
-            return self.state_manager.is_cancelled() if self.state_manager else False
+        chunk = self.chunks.pop(next_file, None)
+        for file in chunk.files if chunk else [next_file]:
+            notification.notify_batch_step_start(
+                file_name=file.name, extension=self.target_format
+            )
 
-        notification.notify_batch_step_start(
-            file_name=next_file.name, extension=self.target_format
-        )
+        if chunk:
+            self.file_processor.start_chunk_conversion(chunk)
+            return
 
         self.file_processor.start_conversion(
             next_file,
             self.target_format,
             self.output_manager.get_output_directory() if self.output_manager else None,
-            cancel_check,
+            self._is_cancelled,
         )
 
     def _record_conversion_error(
@@ -8,6 +8,7 @@ This package contains specialized components for batch file conversion operation
 from .error_handler import BatchErrorHandler
 from .file_processor import BatchFileProcessor
 from .format_validator import FormatValidator
+from .libreoffice_chunk import LibreOfficeChunk
 from .output_manager import OutputManager
 from .state_manager import BatchStateManager
 
@@ -15,6 +16,7 @@ __all__ = [
     "BatchErrorHandler",
     "BatchFileProcessor",
     "FormatValidator",
+    "LibreOfficeChunk",
     "OutputManager",
     "BatchStateManager",
 ]
@@ -9,11 +9,13 @@ operations using a simplified threading model.
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
 from pathlib import Path
-from typing import Callable, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 from simplyconvertfile.converters.base import Converter
 from simplyconvertfile.core import ConverterFactory
 
+from .libreoffice_chunk import LibreOfficeChunk
+
 
 class BatchFileProcessor:
     """Handles individual file conversion logic for batch operations.
@@ -29,6 +31,7 @@ class BatchFileProcessor:
         executor: ThreadPoolExecutor instance for asynchronous processing.
         current_future: Currently executing conversion future.
         current_converter: Currently active converter instance.
+        current_chunk: Currently converted LibreOffice chunk, if any.
 
     Examples:
         >>> processor = BatchFileProcessor()
@@ -68,6 +71,8 @@ class BatchFileProcessor:
         )
         self.current_future: Optional[Future] = None
         self.current_converter: Optional[Converter] = None
+        self.current_chunk: Optional[LibreOfficeChunk] = None
+        self._cancelled_future: Optional[Future] = None
 
     def __del__(self) -> None:
         """Clean up the thread pool executor.
@@ -127,6 +132,40 @@ class BatchFileProcessor:
             self._convert_file, self.current_converter
         )
 
+    def start_chunk_conversion(self, chunk: LibreOfficeChunk) -> None:
+        """Start asynchronous conversion of a LibreOffice chunk.
+
+        Cancels any currently running conversion before starting the chunk.
+        Its results are read with get_conversion_results.
+
+        Args:
+            chunk: Files to convert with a single LibreOffice.
+
+        Examples:
+            >>> processor = BatchFileProcessor()
+            >>> chunk = LibreOfficeChunk.plan(files, "PDF")[0]
+            >>> processor.start_chunk_conversion(chunk)
+        """
+        self.cancel_current_conversion()
+
+        self.current_chunk = chunk
+        self.current_converter = chunk.converters[0]
+        self.current_future = self.executor.submit(self._convert_chunk, chunk)
+
+    def _convert_chunk(self, chunk: LibreOfficeChunk) -> List[Tuple[bool, Converter]]:
+        """Convert a LibreOffice chunk synchronously.
+
+        Args:
+            chunk: Files to convert with a single LibreOffice.
+
+        Returns:
+            List[Tuple[bool, Converter]]: Success and converter of each file.
+        """
+        try:
+            return chunk.convert()
+        except Exception:
+            return [(False, converter) for converter in chunk.converters]
+
     def _convert_file(self, converter: Converter) -> Tuple[bool, Converter]:
         """Convert a single file synchronously.
 
@@ -209,6 +248,37 @@ class BatchFileProcessor:
             self.current_future = None
             self.current_converter = None
 
+    def get_conversion_results(self) -> List[Tuple[bool, Optional[Converter]]]:
+        """Get the result of each file of the completed conversion.
+
+        Like get_conversion_result, for a single file or a LibreOffice chunk.
+
+        Returns:
+            List[Tuple[bool, Optional[Converter]]]: Success and converter of
+                each converted file, in order. Empty if no conversion is
+                complete.
+
+        Examples:
+            >>> if processor.is_conversion_complete():
+            ...     for success, converter in processor.get_conversion_results():
+            ...         print(f"{converter.file.name}: {success}")
+        """
+        chunk = self.current_chunk
+        if not chunk:
+            result = self.get_conversion_result()
+            return [result] if result else []
+        if not self.is_conversion_complete() or not self.current_future:
+            return []
+
+        try:
+            return self.current_future.result(timeout=0.1)
+        except Exception:
+            return [(False, converter) for converter in chunk.converters]
+        finally:
+            self.current_future = None
+            self.current_converter = None
+            self.current_chunk = None
+
     def cancel_current_conversion(self) -> None:
         """Cancel the currently running conversion.
 
@@ -225,10 +295,26 @@ class BatchFileProcessor:
                 self.current_converter.cancel()
 
         if self.current_future and not self.current_future.done():
-            self.current_future.cancel()
+            if not self.current_future.cancel():
+                self._cancelled_future = self.current_future
 
         self.current_future = None
         self.current_converter = None
+        self.current_chunk = None
+
+    def is_cancellation_complete(self) -> bool:
+        """Check whether a cancelled conversion has stopped running.
+
+        Returns:
+            bool: True once the worker of the last cancelled conversion has
+                  returned (its processes are terminated by then).
+
+        Examples:
+            >>> processor.cancel_current_conversion()
+            >>> processor.is_cancellation_complete()
+            True
+        """
+        return self._cancelled_future is None or self._cancelled_future.done()
 
     def shutdown(self) -> None:
         """Shutdown the processor and clean up resources.
@@ -99,7 +99,7 @@ class FormatValidator:
             return ()
 
         all_available_formats = [
-            set(format_config.get_available_formats(fmt)) for fmt in source_formats
+            set(format_config.get_reachable_formats(fmt)) for fmt in source_formats
         ]
 
         common_formats = (
@@ -144,7 +144,7 @@ class FormatValidator:
 
         all_producible_formats = set()
         for fmt in source_formats:
-            all_producible_formats.update(format_config.get_available_formats(fmt))
+            all_producible_formats.update(format_config.get_reachable_formats(fmt))
 
         return source_set & all_producible_formats
 
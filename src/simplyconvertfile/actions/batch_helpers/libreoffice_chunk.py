@@ -0,0 +1,288 @@
+#!/usr/bin/python3
+"""
+LibreOffice chunks for batch conversions.
+
+Starting LibreOffice takes longer than converting a typical document, and
+``soffice --convert-to pdf --outdir DIR a.docx b.docx ...`` converts many
+files in a single startup. Batch conversions therefore group the files
+whose command is a LibreOffice conversion into a temporary directory
+followed by a move of the result (the office, spreadsheet and presentation
+templates) into chunks sharing the same LibreOffice options. Each chunk runs
+one LibreOffice into a shared temporary directory, then moves every output
+to the target of its source file; a missing output fails that file only.
+"""
+
+import shlex
+import shutil
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from simplyconvertfile.config import format_config, settings_manager
+from simplyconvertfile.converters.base import Converter
+from simplyconvertfile.converters.helpers import (
+    CommandExecutionResult,
+    TempFileManager,
+)
+from simplyconvertfile.core import ConverterFactory
+from simplyconvertfile.utils import text
+from simplyconvertfile.utils.logging import logger
+from simplyconvertfile.utils.validation import FileValidator
+
+LIBREOFFICE_TOOLS = {"libreoffice", "soffice"}
+# Format groups converted by the LibreOffice templates
+OFFICE_GROUPS = {"OFFICE", "SPREADSHEET", "PRESENTATION"}
+
+
+class LibreOfficeStep(NamedTuple):
+    """LibreOffice conversion of one file, as found in its chained command.
+
+    Attributes:
+        options: Command up to ``--outdir``, identical within a chunk.
+        output_name: Name of the file LibreOffice writes in the directory.
+    """
+
+    options: Tuple[str, ...]
+    output_name: str
+
+
+class LibreOfficeChunk:
+    """Files of a batch converted by a single LibreOffice invocation.
+
+    Attributes:
+        converters: Converters of the files, whose commands are replaced by
+                   the chunk's; each keeps its own target and errors.
+        steps: LibreOffice step of each converter.
+        command: LibreOffice command of the chunk, once run.
+
+    Examples:
+        >>> chunks = LibreOfficeChunk.plan(files, "PDF", output_dir)
+        >>> for success, converter in chunks[0].convert():
+        ...     print(converter.file.name, success)
+    """
+
+    def __init__(
+        self, converters: Sequence[Converter], steps: Sequence[LibreOfficeStep]
+    ) -> None:
+        """Initialize a chunk.
+
+        Args:
+            converters: Converters of the files, at least one.
+            steps: LibreOffice step of each converter, sharing their options.
+        """
+        self.converters = list(converters)
+        self.steps = list(steps)
+        self.command: List[str] = []
+
+    @property
+    def files(self) -> List[Path]:
+        """Source files of the chunk, in conversion order."""
+        return [converter.file for converter in self.converters]
+
+    @staticmethod
+    def get_step(converter: Converter) -> Optional[LibreOfficeStep]:
+        """Get the LibreOffice step of a converter, if it can join a chunk.
+
+        The chained command must be ``libreoffice ... --outdir TEMP INPUT``,
+        an optional ``test -f`` of the output, and ``mv TEMP/NAME TARGET``.
+
+        Args:
+            converter: Converter of a batch file.
+
+        Returns:
+            Optional[LibreOfficeStep]: The step, or None for other commands.
+        """
+        commands = converter.chained_commands
+        if len(commands) not in (2, 3) or not commands[0]:
+            return None
+        convert, move = commands[0], commands[-1]
+        if (
+            Path(convert[0]).name not in LIBREOFFICE_TOOLS
+            or len(convert) < 4
+            or convert[-3] != "--outdir"
+            or convert[-1] != str(converter.file)
+        ):
+            return None
+        output = Path(move[1]) if len(move) == 3 else None
+        if (
+            move[0] != "mv"
+            or not output
+            or output.parent != Path(convert[-2])
+            or move[2] != str(converter.target_file)
+        ):
+            return None
+        if len(commands) == 3 and commands[1] != ["test", "-f", move[1]]:
+            return None
+        return LibreOfficeStep(tuple(convert[:-3]), output.name)
+
+    @classmethod
+    def plan(
+        cls,
+        files: Sequence[Path],
+        target_format: str,
+        output_dir: Optional[Path] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+    ) -> List["LibreOfficeChunk"]:
+        """Group the files of a batch into LibreOffice chunks.
+
+        Files join a chunk when their LibreOffice options and process limits
+        match, up to ``libreoffice_batch.chunk_size`` files, and when no other
+        file of the chunk produces an output of the same name.
+
+        Args:
+            files: Files of the batch, in order.
+            target_format: Target format of the batch.
+            output_dir: Output directory of the batch, if any.
+            cancel_check: Cancellation check passed to the converters.
+
+        Returns:
+            List[LibreOfficeChunk]: Chunks of at least two files; the other
+                                   files are left to regular conversions.
+        """
+        settings = settings_manager.get("libreoffice_batch", {})
+        chunk_size = int(settings.get("chunk_size", 20))
+        if not settings.get("enabled", True) or chunk_size < 2:
+            return []
+
+        groups: Dict[tuple, List[LibreOfficeChunk]] = {}
+        unused: List[Converter] = []
+        for file in files:
+            source_format = FileValidator.get_file_format(file)
+            if format_config.get_format_group(source_format or "") not in OFFICE_GROUPS:
+                continue
+            converter = ConverterFactory.create_converter(
+                file,
+                target_format,
+                batch_mode=True,
+                output_dir=output_dir,
+                cancel_check=cancel_check,
+            )
+            step = cls.get_step(converter) if converter else None
+            if not converter or not step:
+                if converter:
+                    unused.append(converter)
+                continue
+
+            chunks = groups.setdefault((step.options, converter.process_limits), [])
+            for chunk in chunks:
+                names = {chunk_step.output_name for chunk_step in chunk.steps}
+                if len(chunk.converters) < chunk_size and step.output_name not in names:
+                    chunk.converters.append(converter)
+                    chunk.steps.append(step)
+                    break
+            else:
+                chunks.append(cls([converter], [step]))
+
+        planned = []
+        for chunk in (chunk for chunks in groups.values() for chunk in chunks):
+            if len(chunk.converters) > 1:
+                planned.append(chunk)
+            else:
+                unused.extend(chunk.converters)
+        # Files left out are converted later by converters of their own
+        for converter in unused:
+            converter.file_manager.cleanup_temp_files()
+
+        logger.debug(
+            "Planned {} LibreOffice chunks for {} files",
+            len(planned),
+            sum(len(chunk.converters) for chunk in planned),
+        )
+        return planned
+
+    def convert(self) -> List[Tuple[bool, Converter]]:
+        """Run LibreOffice once for the chunk and move each output to its target.
+
+        Returns:
+            List[Tuple[bool, Converter]]: Success and converter of each file,
+                                         in order; failed converters hold
+                                         the error of their file.
+        """
+        try:
+            with TempFileManager(is_dir=True) as output_dir:
+                result = self._run_libreoffice(output_dir)
+                return [
+                    (self._move_output(converter, step, output_dir, result), converter)
+                    for converter, step in zip(self.converters, self.steps)
+                ]
+        finally:
+            self.cleanup()
+
+    def _run_libreoffice(self, output_dir: Path) -> CommandExecutionResult:
+        """Convert every file of the chunk into a directory.
+
+        Args:
+            output_dir: Directory receiving the outputs.
+
+        Returns:
+            CommandExecutionResult: Result of the LibreOffice command.
+        """
+        lead = self.converters[0]
+        self.command = [
+            *self.steps[0].options,
+            "--outdir",
+            str(output_dir),
+            *(str(file) for file in self.files),
+        ]
+        validation_error = lead.conversion_manager.validate_tools(self.command, [])
+        if validation_error:
+            return CommandExecutionResult(
+                success=False, error_message=validation_error
+            )
+
+        logger.info("Converting {} files with one LibreOffice", len(self.converters))
+        return lead.conversion_manager.execute_conversion(
+            self.command,
+            [],
+            False,
+            ", ".join(file.name for file in self.files),
+            lead.format,
+            lead.progress_tracker.create_cancel_callback(),
+            process_limits=lead.process_limits,
+        )
+
+    def _move_output(
+        self,
+        converter: Converter,
+        step: LibreOfficeStep,
+        output_dir: Path,
+        result: CommandExecutionResult,
+    ) -> bool:
+        """Move the output of one file to its target, or record its error.
+
+        Args:
+            converter: Converter of the file.
+            step: LibreOffice step of the file.
+            output_dir: Directory LibreOffice wrote the outputs to.
+            result: Result of the LibreOffice command.
+
+        Returns:
+            bool: True if the file was converted, False otherwise.
+        """
+        command = shlex.join(self.command)
+        output = output_dir / step.output_name
+        if result.cancelled:
+            return False
+        if not output.is_file():
+            error = text.Errors.LIBREOFFICE_OUTPUT_MISSING_MESSAGE.format(
+                file=converter.file.name
+            )
+            if result.error_message:
+                error += f"\n\n{result.error_message}"
+            converter.error_manager.set_error(error, command)
+            return False
+
+        # Targets were chosen before any output of the batch existed
+        converter.target_file = converter.file_manager.ensure_unique_filename(
+            converter.target_file
+        )
+        try:
+            shutil.move(str(output), str(converter.target_file))
+        except OSError as e:
+            converter.error_manager.set_error(str(e), command)
+            return False
+        return True
+
+    def cleanup(self) -> None:
+        """Delete the temporary files of the chunk's converters."""
+        for converter in self.converters:
+            converter.file_manager.cleanup_temp_files()
@@ -6,7 +6,6 @@ This module provides consolidated state tracking and progress UI management
 for batch file conversion operations.
 """
 
-import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, List, Optional
@@ -14,6 +13,11 @@ from typing import Callable, List, Optional
 from simplyconvertfile.ui import Gtk, ProgressbarDialogWindow
 from simplyconvertfile.utils import text
 from simplyconvertfile.utils.logging import logger
+from simplyconvertfile.utils.progress import (
+    ProgressDisplay,
+    ProgressModel,
+    ProgressSnapshot,
+)
 
 
 @dataclass
@@ -49,6 +53,10 @@ class BatchStateManager:
     cohesive component for batch file conversion operations. Handles progress
     updates, cancellation detection, and UI responsiveness during batch processing.
 
+    Progress is recorded in a ProgressModel (one job per file) and pushed to
+    the dialog by a ProgressDisplay, which only redraws changed values at a
+    capped frame rate instead of on every timeout tick.
+
     Attributes:
         CANCELLING_TIMEOUT_COUNTER: Initial value for cancellation timeout counter.
         MAX_CANCELLING_TIMEOUTS: Maximum timeouts to wait during cancellation.
@@ -56,6 +64,7 @@ class BatchStateManager:
         valid_files: List of files being processed in the batch.
         target_format: Target format for all conversions.
         state: Current batch conversion state.
+        progress: Progress model, one job per file.
         _progress_window: GTK progress dialog window instance.
 
     Examples:
@@ -85,13 +94,18 @@ class BatchStateManager:
         self.valid_files = valid_files
         self.target_format = target_format
         self.state = BatchConversionState()
+        self.progress = ProgressModel(len(valid_files))
+        if valid_files:
+            self.progress.start_job(0, valid_files[0].name)
         self._progress_window: Optional[ProgressbarDialogWindow] = None
+        self._progress_display: Optional[ProgressDisplay] = None
         self._cancelling_timeout_counter = self.CANCELLING_TIMEOUT_COUNTER
         self._max_cancelling_timeouts = self.MAX_CANCELLING_TIMEOUTS
         self._progress_update_timeout_ms = self.PROGRESS_UPDATE_TIMEOUT_MS
 
         self._on_cancel_callback: Optional[Callable[[], None]] = None
         self._on_progress_update_callback: Optional[Callable[[], None]] = None
+        self._cancellation_complete_check: Optional[Callable[[], bool]] = None
 
     def set_cancel_callback(self, callback: Callable[[], None]) -> None:
         """Set callback to be called when conversion is cancelled.
@@ -121,6 +135,22 @@ class BatchStateManager:
         """
         self._on_progress_update_callback = callback
 
+    def set_cancellation_complete_check(self, callback: Callable[[], bool]) -> None:
+        """Set the check telling when a cancelled conversion has stopped.
+
+        While cancelling, the dialog closes as soon as the check returns True
+        instead of waiting MAX_CANCELLING_TIMEOUTS ticks.
+
+        Args:
+            callback: Function returning True once nothing is running anymore.
+
+        Examples:
+            >>> manager.set_cancellation_complete_check(
+            ...     processor.is_cancellation_complete
+            ... )
+        """
+        self._cancellation_complete_check = callback
+
     def create_progress_dialog(self) -> None:
         """Create and configure the progress dialog.
 
@@ -150,6 +180,9 @@ class BatchStateManager:
 
         if self._progress_window:
             self._progress_window.progressbar.set_fraction(0.0)
+            self._progress_display = ProgressDisplay(
+                self._progress_window, self.progress
+            )
             self._setup_dialog_event_handlers()
             logger.debug("Progress dialog created and configured")
 
@@ -241,7 +274,8 @@ class BatchStateManager:
         """Handle timeout during cancellation.
 
         Manages the waiting period during cancellation to allow running
-        conversions to complete gracefully before forcing cleanup.
+        conversions to stop before closing the dialog. Stops waiting as soon
+        as the cancellation complete check reports that nothing is running.
 
         Returns:
             bool: True to continue waiting, False to force completion.
@@ -252,7 +286,10 @@ class BatchStateManager:
         """
         self._cancelling_timeout_counter += 1
 
-        if self._cancelling_timeout_counter >= self._max_cancelling_timeouts:
+        if (
+            self._cancellation_complete_check
+            and self._cancellation_complete_check()
+        ) or self._cancelling_timeout_counter >= self._max_cancelling_timeouts:
             if self._progress_window:
                 self._progress_window.dialog.emit("response", Gtk.ResponseType.CANCEL)
             return False
@@ -279,12 +316,6 @@ class BatchStateManager:
         """
         self._update_progress_display(progress_window)
 
-        if (
-            hasattr(self, "_on_progress_update_callback")
-            and self._on_progress_update_callback
-        ):
-            progress_window.progressbar.pulse()
-
         if self._on_progress_update_callback:
             self._on_progress_update_callback()
 
@@ -313,8 +344,8 @@ class BatchStateManager:
     def _update_progress_display(self, progress_window) -> None:
         """Update progress bar and message.
 
-        Updates the GTK progress bar fraction and message text to reflect
-        current conversion progress.
+        Pushes the progress model to the dialog; values are only sent to GTK
+        when they changed, at most ProgressDisplay.MAX_FPS times per second.
 
         Args:
             progress_window: The progress dialog window instance.
@@ -326,24 +357,29 @@ class BatchStateManager:
             >>> # Called to refresh progress display
             >>> manager._update_progress_display(window)
         """
-        progress_fraction = self.state.current_index / len(self.valid_files)
-        progress_window.progressbar.set_fraction(progress_fraction)
-        progress_window.set_message(
-            text.Conversion.BATCH_CONVERSION_PROGRESS_MESSAGE.format(
-                file=self.valid_files[self.state.current_index].name,
-                extension=self.target_format,
-                current=self.state.current_index + 1,
-                total=len(self.valid_files),
-            )
-        )
-
-        while Gtk.events_pending():
-            Gtk.main_iteration()
-        time.sleep(0.1)
+        if self._progress_display is None:
+            self._progress_display = ProgressDisplay(progress_window, self.progress)
+        self._progress_display.refresh(self._format_progress_message)
 
         if self.state.cancelled:
             raise Exception(text.Operations.BATCH_CONVERSION_CANCELLED_MESSAGE)
 
+    def _format_progress_message(self, snapshot: ProgressSnapshot) -> str:
+        """Build the dialog message from a progress snapshot.
+
+        Args:
+            snapshot: Current values of the progress model.
+
+        Returns:
+            str: Message naming the file being converted.
+        """
+        return text.Conversion.BATCH_CONVERSION_PROGRESS_MESSAGE.format(
+            file=snapshot.message or "",
+            extension=self.target_format,
+            current=min(snapshot.finished + 1, snapshot.total),
+            total=snapshot.total,
+        )
+
     def _handle_cancellation_ui(self) -> None:
         """Update UI to show cancellation is in progress.
 
@@ -406,7 +442,13 @@ class BatchStateManager:
             >>> manager.move_to_next_file()
             >>> next_file = manager.get_current_file()
         """
+        self.progress.finish_job(self.state.current_index)
         self.state.current_index += 1
+        if self.state.current_index < len(self.valid_files):
+            self.progress.start_job(
+                self.state.current_index,
+                self.valid_files[self.state.current_index].name,
+            )
         logger.debug("Moved to next file, current index: {}", self.state.current_index)
 
     def get_current_file(self) -> Optional[Path]:
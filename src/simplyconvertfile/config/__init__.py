@@ -1,12 +1,16 @@
 from .formats import FormatConfiguration, format_config
+from .routing import ConversionRoute, RoutePlanner
 from .settings import SettingsManager, settings_manager
-from .types import ConversionRule, ConverterType, FormatGroup
+from .types import ConversionRule, ConverterType, FormatGroup, RuleCandidate
 
 __all__ = [
+    "ConversionRoute",
     "ConversionRule",
     "ConverterType",
     "FormatConfiguration",
     "FormatGroup",
+    "RoutePlanner",
+    "RuleCandidate",
     "format_config",
     "SettingsManager",
     "settings_manager",
@@ -8,16 +8,24 @@ This module provides a comprehensive format management system that handles:
 - Default converter selection based on format compatibility
 - Format alias resolution and canonical format handling
 - Intelligent conversion path finding with restrictions
+- Multi-hop routes to formats without a direct conversion
 """
 
 import contextlib
+import time
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from simplyconvertfile.utils.logging import logger
 
-from .settings import settings_manager
-from .types import ConversionRule, ConverterType, FormatGroup
+from .routing import (
+    DEFAULT_INTERMEDIATES,
+    DEFAULT_ROUTE_COSTS,
+    ConversionRoute,
+    RoutePlanner,
+)
+from .settings import get_converter_template, settings_manager
+from .types import ConversionRule, ConverterType, FormatGroup, RuleCandidate
 
 
 class FormatConfiguration:
@@ -379,24 +387,53 @@ class FormatConfiguration:
             if rule.from_format.upper() == source_format:
                 available_formats.add(rule.to_format.upper())
 
+        available_formats -= self._get_excluded_targets(source_format)
+
+        use_canonical: bool = settings_manager.get("use_canonical_formats", True)
+        if not use_canonical:
+            result = tuple(sorted(available_formats))
+            logger.debug("Available formats (non-canonical): {} formats", len(result))
+            return result
+
+        canonical_formats = self.normalize_format_set(available_formats)
+
+        canonical_source = self.get_canonical_format(source_format)
+        canonical_formats.discard(canonical_source)
+
+        result = tuple(sorted(canonical_formats))
+        logger.debug("Available formats (canonical): {} formats", len(result))
+        return result
+
+    def _get_excluded_targets(self, source_format: str) -> Set[str]:
+        """Get the target formats that must not be offered for a source format.
+
+        Output-restricted formats and ``conversion_exclusions`` are excluded,
+        unless a user special rule explicitly converts the source to them.
+
+        Args:
+            source_format: Source file format (uppercase).
+
+        Returns:
+            Set[str]: Uppercase target formats to exclude.
+        """
         output_restricted_formats = settings_manager.get_output_restricted_formats()
 
         user_special_rules = settings_manager.get_special_rules()
+        # Entries without from/to are comments (``_COMMENT_``)
         user_allowed_targets = {
             rule["to"].upper()
             for rule in user_special_rules
-            if rule.get("from", "").upper() == source_format
+            if rule.get("to") and rule.get("from", "").upper() == source_format
         }
 
-        formats_to_exclude = output_restricted_formats - user_allowed_targets
-        available_formats -= formats_to_exclude
+        excluded_targets = output_restricted_formats - user_allowed_targets
 
         conversion_exclusions = settings_manager.get("conversion_exclusions", [])
         for exclusion in conversion_exclusions:
             if exclusion.get("from", "").upper() == source_format:
                 excluded_target = exclusion.get("to", "").upper()
                 if excluded_target not in user_allowed_targets:
-                    available_formats.discard(excluded_target)
+                    excluded_targets.add(excluded_target)
                     logger.debug(
                         "Excluded conversion: {} -> {} (reason: {})",
                         source_format,
@@ -404,20 +441,201 @@ class FormatConfiguration:
                         exclusion.get("reason", "Not specified"),
                     )
 
-        use_canonical: bool = settings_manager.get("use_canonical_formats", True)
-        if not use_canonical:
-            result = tuple(sorted(available_formats))
-            logger.debug("Available formats (non-canonical): {} formats", len(result))
-            return result
+        return excluded_targets
 
-        canonical_formats = self.normalize_format_set(available_formats)
+    @lru_cache(maxsize=1)
+    def get_route_planner(self) -> Optional[RoutePlanner]:
+        """Get the planner of multi-hop conversion routes.
+
+        The graph has one node per canonical format and one edge per direct
+        conversion offered by get_available_formats. An edge costs the
+        ``cost`` of its special rule if set, otherwise the ``routing.costs``
+        entry of its converter type (DEFAULT_ROUTE_COSTS if not set). All
+        routes are computed on the first call.
+
+        Returns:
+            Optional[RoutePlanner]: The planner, or None if routing is disabled.
+        """
+        routing = settings_manager.get("routing", {})
+        if not routing.get("enabled", True):
+            return None
+
+        start = time.perf_counter()
+        formats = {
+            self.get_canonical_format(format_name)
+            for group in self._format_groups.values()
+            for format_name in group.formats
+        }
+        for rule in self._conversion_rules:
+            formats.add(self.get_canonical_format(rule.from_format))
+            formats.add(self.get_canonical_format(rule.to_format))
+
+        costs = routing.get("costs", DEFAULT_ROUTE_COSTS)
+        edges: Dict[str, Dict[str, float]] = {}
+        for source_format in formats:
+            targets = {
+                self.get_canonical_format(target)
+                for target in self.get_available_formats(source_format)
+            }
+            targets.discard(source_format)
+            edges[source_format] = {
+                target: self._get_route_cost(source_format, target, costs)
+                for target in targets
+            }
+
+        planner = RoutePlanner(
+            edges, routing.get("max_hops", 2), self._get_route_intermediates()
+        )
+        logger.debug(
+            "Planned routes between {} formats in {:.3f}s",
+            len(edges),
+            time.perf_counter() - start,
+        )
+        return planner
+
+    def _get_route_intermediates(self) -> Set[str]:
+        """Get the canonical formats routes may pass through.
+
+        Returns:
+            Set[str]: ``routing.intermediates`` (DEFAULT_INTERMEDIATES if not
+                     set) and the targets of special rules marked
+                     ``"intermediate": true``.
+        """
+        routing = settings_manager.get("routing", {})
+        intermediates = {
+            self.get_canonical_format(str(format_name).upper())
+            for format_name in routing.get("intermediates", DEFAULT_INTERMEDIATES)
+        }
+        for rule in settings_manager.get_special_rules():
+            if rule.get("intermediate") and rule.get("to"):
+                intermediates.add(self.get_canonical_format(rule["to"].upper()))
+        return intermediates
+
+    def _get_route_cost(
+        self, from_format: str, to_format: str, costs: Dict[str, float]
+    ) -> float:
+        """Get the routing cost of a direct conversion.
+
+        Args:
+            from_format: Canonical source format.
+            to_format: Canonical target format.
+            costs: ``routing.costs`` settings, by converter type.
 
+        Returns:
+            float: The special rule's ``cost``, or the cost of the converter
+                  type (1.0 if it has none).
+        """
+        converter_type = self.get_default_converter_type(from_format, to_format)
+        cost = costs.get(converter_type.value, 1.0) if converter_type else 1.0
+        if converter_type is ConverterType.SPECIAL:
+            rule_data = settings_manager.find_special_rule(from_format, to_format)
+            if rule_data and rule_data.get("cost") is not None:
+                cost = rule_data["cost"]
+        try:
+            return max(float(cost), 0.0)
+        except (TypeError, ValueError):
+            logger.warning(
+                "Ignoring invalid routing cost for {} -> {}: {}",
+                from_format,
+                to_format,
+                cost,
+            )
+            return 1.0
+
+    @lru_cache(maxsize=256)
+    def get_routed_formats(self, source_format: str) -> Tuple[str, ...]:
+        """Get the target formats only reachable through intermediate formats.
+
+        Args:
+            source_format: Source file format (case-insensitive).
+
+        Returns:
+            Tuple[str, ...]: Sorted canonical formats with a multi-hop route
+                            and no direct conversion from the source format.
+        """
+        planner = self.get_route_planner()
+        if planner is None:
+            return ()
+
+        source_format = source_format.upper()
         canonical_source = self.get_canonical_format(source_format)
-        canonical_formats.discard(canonical_source)
+        direct_formats = {
+            self.get_canonical_format(target)
+            for target in self.get_available_formats(source_format)
+        }
+        excluded_targets = self._get_excluded_targets(source_format)
+        return tuple(
+            target
+            for target in planner.get_targets(canonical_source)
+            if target not in direct_formats and target not in excluded_targets
+        )
 
-        result = tuple(sorted(canonical_formats))
-        logger.debug("Available formats (canonical): {} formats", len(result))
-        return result
+    @lru_cache(maxsize=256)
+    def get_reachable_formats(self, source_format: str) -> Tuple[str, ...]:
+        """Get every target format, direct or through intermediate formats.
+
+        Args:
+            source_format: Source file format (case-insensitive).
+
+        Returns:
+            Tuple[str, ...]: Sorted available and routed target formats.
+        """
+        return tuple(
+            sorted(
+                set(self.get_available_formats(source_format))
+                | set(self.get_routed_formats(source_format))
+            )
+        )
+
+    def is_direct_conversion(self, from_format: str, to_format: str) -> bool:
+        """Check whether a conversion runs without intermediate formats.
+
+        Args:
+            from_format: Source format (case-insensitive).
+            to_format: Target format (case-insensitive).
+
+        Returns:
+            bool: True if a rule converts between the formats or the target is
+                 one of the source's available formats.
+        """
+        if self.get_conversion_rule(from_format, to_format):
+            return True
+        canonical_to = self.get_canonical_format(to_format.upper())
+        return canonical_to in {
+            self.get_canonical_format(target)
+            for target in self.get_available_formats(from_format.upper())
+        }
+
+    def get_route(
+        self, from_format: str, to_format: str
+    ) -> Optional[ConversionRoute]:
+        """Get the multi-hop route for a conversion without a direct rule.
+
+        Args:
+            from_format: Source format (case-insensitive).
+            to_format: Target format (case-insensitive).
+
+        Returns:
+            Optional[ConversionRoute]: Cheapest route from the canonical source
+                                      to the canonical target, or None if the
+                                      source format is unknown, the target is
+                                      a direct target or it is unreachable.
+
+        Examples:
+            >>> config.get_route("MOBI", "DOCX").formats
+            ('MOBI', 'EPUB', 'DOCX')
+        """
+        # Direct conversions never need the planner, which is costly to build
+        if not from_format or not to_format:
+            return None
+        if self.is_direct_conversion(from_format, to_format):
+            return None
+        canonical_to = self.get_canonical_format(to_format.upper())
+        if canonical_to not in self.get_routed_formats(from_format):
+            return None
+        return self.get_route_planner().get_route(
+            self.get_canonical_format(from_format.upper()), canonical_to
+        )
 
     def get_conversion_rule(
         self, from_format: str, to_format: str
@@ -514,6 +732,95 @@ class FormatConfiguration:
 
         return None
 
+    @lru_cache(maxsize=256)
+    def get_rule_candidates(
+        self, from_format: str, to_format: str
+    ) -> Tuple[RuleCandidate, ...]:
+        """Get every rule able to perform a conversion.
+
+        Candidates are, in order: the special rules for the pair of formats,
+        or the category template when there is none and both formats belong
+        to the same group; then the special rules marked ``"alternative"``,
+        which compete with them instead of replacing them. Identical commands
+        are listed once. The first candidate is the rule used when no
+        automatic rule selection takes place.
+
+        Args:
+            from_format: Source format (case-insensitive).
+            to_format: Target format (case-insensitive).
+
+        Returns:
+            Tuple[RuleCandidate, ...]: Candidates, empty for conversions
+                                      without a rule or category template.
+
+        Examples:
+            >>> [c.key for c in config.get_rule_candidates("DOCX", "TXT")]
+            ['DOCX>TXT:office', 'DOCX>TXT:pandoc']
+        """
+        from_format = from_format.upper()
+        to_format = to_format.upper()
+        pair = f"{from_format}>{to_format}"
+
+        special_rules = settings_manager.find_special_rules(from_format, to_format)
+        if not special_rules:
+            special_rules = settings_manager.find_special_rules(
+                self.get_canonical_format(from_format),
+                self.get_canonical_format(to_format),
+            )
+
+        regular_rules = [rule for rule in special_rules if not rule.get("alternative")]
+        alternative_rules = [rule for rule in special_rules if rule.get("alternative")]
+
+        candidates: List[RuleCandidate] = []
+        commands: list = []
+
+        def add_candidate(
+            name: str, converter_type: ConverterType, command, rule_data=None
+        ) -> None:
+            if not command or command in commands:
+                return
+            commands.append(command)
+            key = f"{pair}:{name}"
+            if any(candidate.key == key for candidate in candidates):
+                key = f"{key}#{len(candidates) + 1}"
+            candidates.append(RuleCandidate(key, converter_type, command, rule_data))
+
+        for rule_data in regular_rules:
+            add_candidate(
+                self._get_rule_name(rule_data),
+                ConverterType.SPECIAL,
+                rule_data.get("command"),
+                rule_data,
+            )
+
+        group_name = self.get_format_group(from_format)
+        if (
+            not regular_rules
+            and group_name
+            and group_name == self.get_format_group(to_format)
+            and self._format_groups[group_name].internal_conversions
+        ):
+            converter_type = self._format_groups[group_name].default_converter
+            template, _ = get_converter_template(converter_type.value, to_format)
+            add_candidate(converter_type.value, converter_type, template)
+
+        for rule_data in alternative_rules:
+            add_candidate(
+                self._get_rule_name(rule_data),
+                ConverterType.SPECIAL,
+                rule_data.get("command"),
+                rule_data,
+            )
+
+        return tuple(candidates)
+
+    @staticmethod
+    def _get_rule_name(rule_data: dict) -> str:
+        """Get a special rule's ``name``, or the first tool of its command."""
+        command = rule_data.get("command") or ""
+        first_command = command[0] if isinstance(command, list) and command else command
+        return rule_data.get("name") or str(first_command).split(" ", 1)[0]
+
     def get_default_converter_type(
         self, from_format: str, to_format: str
     ) -> Optional[ConverterType]:
@@ -0,0 +1,178 @@
+#!/usr/bin/python3
+"""
+Multi-hop conversion routing over the format graph.
+
+Every direct conversion (same-group conversion or special rule) is an edge
+of a directed graph whose nodes are canonical formats. Each edge has a cost,
+declared per converter type or per special rule, approximating how slow the
+underlying tool is. RoutePlanner computes the cheapest route between every
+pair of formats, with at most ``max_hops`` conversions, once; afterwards each
+lookup is a dict access, so format dialogs do not slow down.
+
+Routes only pass through intermediate formats the next tool reads back
+without loss or surprise: a lossy intermediate (AAC, JPEG) degrades the
+result, and a multi-frame or multi-page one (GIF, PDF) makes ImageMagick
+write numbered files instead of the target. The default intermediates are
+DEFAULT_INTERMEDIATES; ``routing.intermediates`` and special rules marked
+``"intermediate": true`` change them.
+
+Examples:
+    >>> planner = RoutePlanner({"MOBI": {"EPUB": 3.0}, "EPUB": {"DOCX": 1.0}})
+    >>> planner.get_route("MOBI", "DOCX")
+    ConversionRoute(formats=('MOBI', 'EPUB', 'DOCX'), cost=4.0)
+"""
+
+from typing import Collection, Dict, FrozenSet, Mapping, NamedTuple, Optional, Tuple
+
+# Relative cost of one conversion by converter type, higher for slower tools
+DEFAULT_ROUTE_COSTS = {
+    "archive": 3,
+    "audio": 2,
+    "data": 0.5,
+    "image": 1,
+    "markup": 1,
+    "office": 5,
+    "presentation": 5,
+    "special": 3,
+    "spreadsheet": 5,
+    "video": 10,
+}
+
+# Lossless, single-output formats that routes may pass through
+DEFAULT_INTERMEDIATES = (
+    "DOCX",
+    "EPUB",
+    "FLAC",
+    "HTML",
+    "JSON",
+    "MD",
+    "ODT",
+    "PNG",
+    "TAR",
+    "TIFF",
+    "WAV",
+)
+
+
+class ConversionRoute(NamedTuple):
+    """Cheapest chain of direct conversions between two formats.
+
+    Attributes:
+        formats: Source format, intermediate formats and target format.
+        cost: Sum of the edge costs along the route.
+    """
+
+    formats: Tuple[str, ...]
+    cost: float
+
+    @property
+    def hops(self) -> int:
+        """Number of conversions along the route."""
+        return len(self.formats) - 1
+
+
+class RoutePlanner:
+    """All-pairs cheapest routes over a format graph.
+
+    Attributes:
+        max_hops: Maximum number of conversions per route.
+        intermediates: Formats routes may pass through, or None for any.
+        routes: Source format -> target format -> cheapest route.
+
+    Examples:
+        >>> planner = RoutePlanner(edges, max_hops=2)
+        >>> planner.get_targets("MOBI")
+        ('DOCX', 'EPUB', ...)
+    """
+
+    def __init__(
+        self,
+        edges: Mapping[str, Mapping[str, float]],
+        max_hops: int = 2,
+        intermediates: Optional[Collection[str]] = None,
+    ) -> None:
+        """Compute the routes from every source format.
+
+        Args:
+            edges: Source format -> target format -> cost of the direct
+                  conversion. Formats must be canonical and uppercase.
+            max_hops: Maximum number of conversions per route (at least 1).
+            intermediates: Canonical formats routes may pass through, or None
+                          to allow every format.
+        """
+        self.max_hops = max(max_hops, 1)
+        self.intermediates: Optional[FrozenSet[str]] = (
+            frozenset(intermediates) if intermediates is not None else None
+        )
+        self.routes: Dict[str, Dict[str, ConversionRoute]] = {
+            source: self._find_routes(edges, source) for source in edges
+        }
+
+    def _find_routes(
+        self, edges: Mapping[str, Mapping[str, float]], source: str
+    ) -> Dict[str, ConversionRoute]:
+        """Find the cheapest routes from one source, hop by hop.
+
+        Bellman-Ford limited to ``max_hops`` rounds: each round extends the
+        routes improved by the previous one by a single conversion. Edges are
+        visited in sorted order so that ties are broken deterministically.
+
+        Args:
+            edges: Graph given to the constructor.
+            source: Source format.
+
+        Returns:
+            Dict[str, ConversionRoute]: Target format -> cheapest route.
+        """
+        best: Dict[str, ConversionRoute] = {
+            source: ConversionRoute((source,), 0.0)
+        }
+        frontier = dict(best)
+        for _ in range(self.max_hops):
+            improved: Dict[str, ConversionRoute] = {}
+            for node, route in frontier.items():
+                if (
+                    node != source
+                    and self.intermediates is not None
+                    and node not in self.intermediates
+                ):
+                    continue
+                for target, cost in sorted(edges.get(node, {}).items()):
+                    if target in route.formats:
+                        continue
+                    total = route.cost + cost
+                    known = best.get(target)
+                    if known is None or total < known.cost:
+                        best[target] = improved[target] = ConversionRoute(
+                            route.formats + (target,), total
+                        )
+            if not improved:
+                break
+            frontier = improved
+
+        del best[source]
+        return best
+
+    def get_route(self, source: str, target: str) -> Optional[ConversionRoute]:
+        """Get the cheapest route between two formats.
+
+        Args:
+            source: Canonical source format.
+            target: Canonical target format.
+
+        Returns:
+            Optional[ConversionRoute]: The route, or None if the target cannot
+                                      be reached within ``max_hops``.
+        """
+        return self.routes.get(source, {}).get(target)
+
+    def get_targets(self, source: str) -> Tuple[str, ...]:
+        """Get every format reachable from a source format.
+
+        Args:
+            source: Canonical source format.
+
+        Returns:
+            Tuple[str, ...]: Sorted reachable formats.
+        """
+        return tuple(sorted(self.routes.get(source, {})))
@@ -22,7 +22,7 @@ import time
 import urllib.request
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from simplyconvertfile.utils import text
 from simplyconvertfile.utils.logging import logger
@@ -396,6 +396,34 @@ class SettingsManager:
             None,
         )
 
+    @lru_cache(maxsize=256)
+    def find_special_rules(
+        self, from_format: str, to_format: str
+    ) -> Tuple[Dict[str, Any], ...]:
+        """Find every special rule for a specific format conversion.
+
+        Several rules may convert the same pair of formats with different
+        tools; find_special_rule returns the first one.
+
+        Args:
+            from_format: Source format (case-insensitive).
+            to_format: Target format (case-insensitive).
+
+        Returns:
+            Tuple[Dict[str, Any], ...]: Matching special rules, in settings order.
+        """
+        from_format = from_format.upper()
+        to_format = to_format.upper()
+
+        return tuple(
+            rule
+            for rule in self.get_special_rules()
+            if (
+                rule.get("from", "").upper() == from_format
+                and rule.get("to", "").upper() == to_format
+            )
+        )
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get a setting value with a default fallback.
 
@@ -416,6 +444,15 @@ class SettingsManager:
         settings = self.load_settings()
         return settings.get(key, default)
 
+    @property
+    def config_files(self) -> Tuple[Path, Path]:
+        """Settings files the merged settings are loaded from.
+
+        Returns:
+            Tuple[Path, Path]: The system and user settings files.
+        """
+        return self._system_config_file, self._user_config_file
+
     @lru_cache(maxsize=128)
     def get_output_restricted_formats(self) -> set:
         """Get formats that are restricted from being used as output targets.
@@ -477,6 +514,7 @@ def get_converter_template(
     converter_type: str,
     target_format: str,
     input_file: Optional[Path] = None,
+    special_rule: Optional[dict] = None,
 ) -> tuple[Optional[str], Optional[dict]]:
     """Get the appropriate command template for a converter type and target format.
 
@@ -488,6 +526,8 @@ def get_converter_template(
         converter_type: Type of converter ('audio', 'video', 'image', 'document', 'archive', 'special').
         target_format: Target format (e.g., 'MP3', 'MP4', 'JPEG').
         input_file: Optional input file path, required for special converter type.
+        special_rule: Special rule to use instead of the first one matching
+                     the input file's format (special converter type only).
 
     Returns:
         tuple[Optional[str], Optional[dict]]: Tuple containing:
@@ -511,7 +551,9 @@ def get_converter_template(
 
         source_format = FileValidator.get_file_format(input_file) if input_file else ""
 
-        rule = settings_manager.find_special_rule(source_format, target_format)
+        rule = special_rule or settings_manager.find_special_rule(
+            source_format, target_format
+        )
         if not rule:
             logger.warning(
                 "No special rule found for {} -> {}", source_format, target_format
@@ -541,3 +583,35 @@ def get_converter_template(
     template = rule.get("default")
     logger.debug("Using general command template: {}", template is not None)
     return template, rule
+
+
+def get_process_limits(
+    converter_type: str, rule: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Get the process limits for a conversion.
+
+    Merges the ``process_limits`` sections of the global settings, of the
+    converter type's rules (e.g. ``video_rules``) and of the special rule,
+    the most specific one winning for each key.
+
+    Args:
+        converter_type: Type of converter ('audio', 'video', 'special', ...).
+        rule: Special rule dictionary used for the conversion, if any.
+
+    Returns:
+        Dict[str, Any]: Merged settings (nice, ionice_class, ionice_level,
+                       cpu_affinity, memory_limit_mb); empty if none is set.
+
+    Examples:
+        >>> get_process_limits("video")
+        {'nice': 10, 'ionice_class': 'idle'}
+    """
+    settings = settings_manager.load_settings()
+    limits = dict(settings.get("process_limits") or {})
+
+    type_rules = settings.get(f"{converter_type}_rules")
+    if isinstance(type_rules, dict):
+        limits.update(type_rules.get("process_limits") or {})
+    if rule:
+        limits.update(rule.get("process_limits") or {})
+    return {key: value for key, value in limits.items() if value is not None}
@@ -6,9 +6,9 @@ This module defines enums and data classes used throughout
 the converter system for type safety and clear interfaces.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Union
 
 
 class ConverterType(Enum):
@@ -60,6 +60,28 @@ class ConversionRule:
         self.to_format = self.to_format.upper()
 
 
+@dataclass(frozen=True)
+class RuleCandidate:
+    """
+    One of the rules able to perform a conversion.
+
+    A conversion can be done by several special rules for the same pair of
+    formats, and by the category template of the formats' group. Candidates
+    are compared by key only.
+
+    Attributes:
+        key: Identifier of the rule in recorded timings (e.g. "DOCX>TXT:pandoc")
+        converter_type: Template category of the rule
+        command_template: Command template of the rule
+        special_rule: Special rule dictionary, or None for a category template
+    """
+
+    key: str
+    converter_type: ConverterType = field(compare=False)
+    command_template: Union[str, List[str]] = field(compare=False)
+    special_rule: Optional[Dict[str, Any]] = field(default=None, compare=False)
+
+
 @dataclass
 class FormatGroup:
     """
@@ -1,5 +1,11 @@
 from .base import Converter
+from .fan_out import FanOutConverter
+from .preview import PreviewConverter
+from .routed import RoutedConverter
 
 __all__ = [
     "Converter",
+    "FanOutConverter",
+    "PreviewConverter",
+    "RoutedConverter",
 ]
@@ -12,18 +12,26 @@ Classes:
 
 import contextlib
 import subprocess
+import time
 from pathlib import Path
 from typing import List, Optional
 
+from simplyconvertfile.config import RuleCandidate
 from simplyconvertfile.converters.helpers import (
+    CommandParser,
     ConversionManager,
     ErrorManager,
     FileManager,
+    ProcessGroup,
+    ProcessLimits,
     ProgressTracker,
     TemplateProcessor,
 )
 from simplyconvertfile.ui import notification
+from simplyconvertfile.utils.dependencies import dependency_manager
 from simplyconvertfile.utils.logging import logger
+from simplyconvertfile.utils.rule_timings import rule_timings
+from simplyconvertfile.utils.thread_budget import thread_budget
 from simplyconvertfile.utils.validation import FileValidator
 
 
@@ -45,6 +53,10 @@ class Converter:
         output_dir: Directory for output files in batch mode.
         timeout_ms: Timeout in milliseconds for conversion process.
         is_shell_command: Whether command requires shell execution.
+        command_template: Settings template the command was built from, if any.
+        process_limits: Priority and resource limits of the command, if any.
+        rule_candidate: Rule performing the conversion, whose timings are
+                       recorded, or None.
         chained_commands: List of chained command arrays for multi-step conversions.
         file_manager: Handles file operations and temporary file management.
         error_manager: Manages error collection and user feedback.
@@ -81,6 +93,11 @@ class Converter:
             **kwargs: Additional configuration options including:
                      - timeout_ms: Conversion timeout in milliseconds (default: 30000)
                      - cancel_check: Optional callable for cancellation checking
+                     - headless: Run without any dialog (e.g. watch service);
+                       dangerous commands are then always blocked
+                     - size: Target (width, height) of image conversions;
+                       ImageMagick commands then downscale the image with
+                       decode hints
 
         Returns:
             None
@@ -103,15 +120,24 @@ class Converter:
         self.timeout_ms: int = kwargs.get("timeout_ms", 30000)  # 30 seconds default
         self._process: Optional[subprocess.Popen] = None
 
+        self.rule_candidate: Optional[RuleCandidate] = self._select_rule()
         self.template_processor = TemplateProcessor(
-            self.get_converter_type(), self.format
+            self.get_converter_type(),
+            self.format,
+            special_rule=(
+                self.rule_candidate.special_rule if self.rule_candidate else None
+            ),
+            size=kwargs.get("size"),
         )
         self.conversion_manager = ConversionManager(
             batch_mode=self.batch_mode,
             external_cancel_check=self.progress_tracker._external_cancel_check,
+            headless=kwargs.get("headless", False),
         )
 
         self.is_shell_command: bool = False
+        self.command_template: Optional[str] = None
+        self.process_limits: Optional[ProcessLimits] = None
 
         self.chained_commands: List[List[str]] = []
 
@@ -158,6 +184,9 @@ class Converter:
         """
         from simplyconvertfile.config import format_config
 
+        if self.rule_candidate:
+            return self.rule_candidate.converter_type.value
+
         source_format = FileValidator.get_file_format(self.file)
 
         rule = format_config.get_conversion_rule(source_format, self.format)
@@ -173,6 +202,51 @@ class Converter:
         class_name = self.__class__.__name__.lower()
         return class_name.replace("converter", "")
 
+    def _select_rule(self) -> Optional[RuleCandidate]:
+        """Choose the rule performing the conversion.
+
+        Among the rules able to do the conversion whose tools are installed,
+        the first one is used, or the one predicted fastest for this file
+        when ``rule_timings.select_fastest`` is enabled.
+
+        Returns:
+            Optional[RuleCandidate]: The rule, or None for conversions without
+                                    a rule or category template.
+        """
+        from simplyconvertfile.config import format_config
+
+        source_format = FileValidator.get_file_format(self.file)
+        if not source_format:
+            return None
+        candidates = format_config.get_rule_candidates(source_format, self.format)
+        if len(candidates) > 1:
+            installed = [
+                candidate
+                for candidate in candidates
+                if self._are_tools_installed(candidate)
+            ]
+            if installed:
+                return rule_timings.select_rule(installed, self._get_input_size())
+        return candidates[0] if candidates else None
+
+    @classmethod
+    def _are_tools_installed(cls, candidate: RuleCandidate) -> bool:
+        """Check that every tool of a rule's command template is installed."""
+        template = candidate.command_template
+        if isinstance(template, list):
+            template = " && ".join(template)
+        return all(
+            tool in cls.SHELL_BUILTINS
+            or dependency_manager.is_installed(tool)
+            for tool in CommandParser.extract_tools_from_shell(template)
+        )
+
+    def _get_input_size(self) -> int:
+        """Get the size of the input file in bytes, 0 if unavailable."""
+        with contextlib.suppress(OSError):
+            return self.file.stat().st_size
+        return 0
+
     def build_command_from_template(self) -> bool:
         """Build command using template system.
 
@@ -199,6 +273,10 @@ class Converter:
         if temp_manager and not isinstance(temp_manager, str):
             self.file_manager.set_temp_manager(temp_manager)
 
+        self.command_template = (
+            self.template_processor.template if template_used else None
+        )
+        self.process_limits = self.template_processor.process_limits
         return template_used
 
     def convert(self) -> bool:
@@ -283,17 +361,27 @@ class Converter:
             cancel_callback = self.progress_tracker.create_cancel_callback()
 
             logger.debug("Executing conversion command")
-            result = self.conversion_manager.execute_conversion(
-                self.command,
-                self.chained_commands,
-                self.is_shell_command,
-                self.file.name,
-                self.format,
-                cancel_callback,
-            )
+            started = time.perf_counter()
+            with thread_budget.job():
+                result = self.conversion_manager.execute_conversion(
+                    self.command,
+                    self.chained_commands,
+                    self.is_shell_command,
+                    self.file.name,
+                    self.format,
+                    cancel_callback,
+                    command_template=self.command_template,
+                    process_limits=self.process_limits,
+                )
 
             if result.success:
                 logger.info("Conversion completed successfully")
+                if self.rule_candidate and self.command_template is not None:
+                    rule_timings.record(
+                        self.rule_candidate.key,
+                        self._get_input_size(),
+                        time.perf_counter() - started,
+                    )
                 return True
             elif result.cancelled:
                 logger.info("Conversion was cancelled by user")
@@ -302,6 +390,10 @@ class Converter:
                 return False
             else:
                 logger.error("Conversion failed")
+                if self.rule_candidate and self.command_template is not None:
+                    rule_timings.record_failure(
+                        self.rule_candidate.key, self._get_input_size()
+                    )
                 error_message = self.conversion_manager.handle_conversion_error(
                     result, self.file.name, self.format, self.batch_mode
                 )
@@ -395,8 +487,10 @@ class Converter:
     def cancel(self) -> None:
         """Cancel the currently running conversion.
 
-        Terminates any running conversion process and sets cancellation flags.
-        Safe to call even if no conversion is currently running.
+        Sets the cancellation flag, which makes the running command terminate
+        its whole process group, and terminates the process group of any
+        process started directly by this converter. Safe to call even if no
+        conversion is currently running.
 
         Returns:
             None
@@ -404,8 +498,7 @@ class Converter:
         self.progress_tracker.cancel()
         if self._process:
             with contextlib.suppress(Exception):
-                self._process.kill()
-                self._process.wait(timeout=1.0)
+                ProcessGroup(self._process).terminate()
 
     def get_last_error(self) -> Optional[str]:
         """Get the last error message from the conversion process.
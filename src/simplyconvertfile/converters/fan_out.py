@@ -0,0 +1,212 @@
+#!/usr/bin/python3
+"""
+Multi-target converter sharing a single decode.
+
+This module provides the FanOutConverter class, which converts one source file
+to several target formats at once (e.g. MP4 + WEBM + GIF, or FLAC to
+MP3 + OPUS + AAC).
+
+When every target command is a plain single-input ffmpeg invocation, the
+commands are merged into one ffmpeg run with one output per target, so the
+input is demuxed and decoded only once. Otherwise each target is converted
+in turn with its own command. A merged run succeeds only if every output
+file exists afterwards, and its timing is not recorded for any rule, since
+it did the work of several.
+"""
+
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from simplyconvertfile.converters.base import Converter
+from simplyconvertfile.utils import text
+from simplyconvertfile.utils.logging import logger
+
+
+class FanOutConverter(Converter):
+    """Converter producing several target formats from one source file.
+
+    The first target is converted by this instance; the other targets are
+    handled by sibling Converter instances whose commands are merged into
+    this one when possible.
+
+    Attributes:
+        formats: Target formats (uppercase, without duplicates).
+        target_files: Output file of each target format, in order.
+        siblings: Converters for the targets after the first one.
+        merged: Whether all targets run as a single ffmpeg invocation.
+
+    Class Attributes:
+        FFMPEG_GLOBAL_FLAGS: Global ffmpeg flags moved in front of the input
+                            when merging, since they cannot follow an output.
+
+    Examples:
+        >>> converter = FanOutConverter(Path("master.mov"), ["MP4", "WEBM", "GIF"])
+        >>> converter.merged
+        True
+        >>> converter.convert()
+        True
+    """
+
+    FFMPEG_GLOBAL_FLAGS = {"-y", "-n", "-hide_banner", "-nostdin", "-nostats"}
+
+    def __init__(
+        self,
+        file: Path,
+        formats: Sequence[str],
+        batch_mode: bool = False,
+        output_dir: Optional[Path] = None,
+        **kwargs,
+    ) -> None:
+        """Initialize the converter and merge the target commands if possible.
+
+        Args:
+            file: Path to the input file to be converted.
+            formats: Target formats (case-insensitive); at least one.
+            batch_mode: Whether this conversion is part of a batch operation.
+            output_dir: Optional output directory for the converted files.
+            **kwargs: Options passed to every target converter (see Converter).
+
+        Raises:
+            ValueError: If no target format is given.
+        """
+        self.formats: List[str] = list(dict.fromkeys(fmt.upper() for fmt in formats))
+        if not self.formats:
+            raise ValueError("At least one target format is required")
+
+        super().__init__(file, self.formats[0], batch_mode, output_dir, **kwargs)
+
+        self.siblings: List[Converter] = [
+            Converter(file, fmt, batch_mode, output_dir, **kwargs)
+            for fmt in self.formats[1:]
+        ]
+        self.target_files: List[Path] = [self.target_file] + [
+            sibling.target_file for sibling in self.siblings
+        ]
+
+        merged_command = self._merge_ffmpeg_commands()
+        self.merged = merged_command is not None
+        if merged_command:
+            logger.info(
+                "Merged {} ffmpeg outputs into a single run for {}",
+                len(self.formats),
+                self.file.name,
+            )
+            self.command = merged_command
+            # The merged command mixes several templates; check it as a whole
+            self.command_template = None
+            # Its timing covers every target, not the first target's rule
+            self.rule_candidate = None
+            # Only used for progress and error messages from here on
+            self.format = " + ".join(self.formats)
+
+    def convert(self) -> bool:
+        """Convert the source file to every target format.
+
+        Returns:
+            bool: True if all targets were converted, False otherwise.
+        """
+        if self.merged:
+            if super().convert():
+                return self._check_merged_outputs()
+            for sibling in self.siblings:
+                sibling._delete_target_file()
+            return False
+
+        cancel_check = self.progress_tracker.create_cancel_check()
+        success = super().convert()
+        for sibling in self.siblings:
+            if cancel_check():
+                return False
+            success = sibling.convert() and success
+        return success
+
+    def _check_merged_outputs(self) -> bool:
+        """Check that the merged ffmpeg run wrote the output of every target.
+
+        A target whose output is missing gets an error, reported by
+        get_last_error.
+
+        Returns:
+            bool: True if every output file exists, False otherwise.
+        """
+        command_str = " ".join(str(arg) for arg in self.command)
+        success = True
+        for converter in [self] + self.siblings:
+            if not converter.target_file.is_file():
+                logger.error("Missing merged output: {}", converter.target_file)
+                converter.error_manager.set_error(
+                    text.Errors.FAN_OUT_OUTPUT_MISSING_MESSAGE.format(
+                        file=converter.target_file.name
+                    ),
+                    command_str,
+                )
+                success = False
+        return success
+
+    def cancel(self) -> None:
+        """Cancel the running conversion and any remaining targets."""
+        super().cancel()
+        for sibling in self.siblings:
+            sibling.cancel()
+
+    def get_last_error(self) -> Optional[str]:
+        """Get the last error of this converter or of a sibling converter."""
+        errors = [super().get_last_error()] + [
+            sibling.get_last_error() for sibling in self.siblings
+        ]
+        return next((error for error in reversed(errors) if error), None)
+
+    def _merge_ffmpeg_commands(self) -> Optional[List[str]]:
+        """Merge the per-target ffmpeg commands into one multi-output command.
+
+        Each command must be a plain (non-shell, non-chained) ffmpeg command
+        with a single ``-i`` pointing at the source file, the same input
+        options and its output file as last argument. The merged command
+        keeps the shared input section once and appends the output options
+        and output file of every target::
+
+            ffmpeg [input opts] -i IN [opts 1] OUT1 [opts 2] OUT2 ...
+
+        Returns:
+            Optional[List[str]]: The merged command, or None if the commands
+                                cannot be merged.
+        """
+        if not self.siblings:
+            return None
+
+        global_flags: List[str] = []
+        input_section: Optional[List[str]] = None
+        output_sections: List[str] = []
+
+        for converter in [self] + self.siblings:
+            command = converter.command
+            if (
+                converter.is_shell_command
+                or converter.chained_commands
+                or not command
+                or Path(command[0]).name != "ffmpeg"
+                or command.count("-i") != 1
+                or command[-1] != str(converter.target_file)
+            ):
+                return None
+
+            input_index = command.index("-i")
+            if command[input_index + 1] != str(self.file):
+                return None
+
+            section = command[: input_index + 2]
+            if input_section is None:
+                input_section = section
+            elif section != input_section:
+                return None
+
+            for argument in command[input_index + 2 :]:
+                if argument in self.FFMPEG_GLOBAL_FLAGS:
+                    if argument not in global_flags:
+                        global_flags.append(argument)
+                else:
+                    output_sections.append(argument)
+
+        return (
+            input_section[:1] + global_flags + input_section[1:] + output_sections
+        )
@@ -11,6 +11,8 @@ from .error_manager import ErrorManager
 from .errors import ErrorHandler
 from .execution import CommandExecutionResult, CommandExecutor, ProgressManager
 from .file_manager import FileManager
+from .multi_file_handler import MultiFileHandler
+from .processes import ProcessGroup, ProcessLimits
 from .progress_tracker import ProgressTracker
 from .sanitizer import CommandSanitizer
 from .temp_file import TempFileManager
@@ -27,6 +29,9 @@ __all__ = [
     "CommandExecutor",
     "ProgressManager",
     "FileManager",
+    "MultiFileHandler",
+    "ProcessGroup",
+    "ProcessLimits",
     "ProgressTracker",
     "TempFileManager",
     "TemplateProcessor",
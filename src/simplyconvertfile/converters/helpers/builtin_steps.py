@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+"""
+In-process implementations of trivial command steps.
+
+Templates glue conversions together with small steps: ``mv`` moving the
+result out of a temporary directory, the ``test -f`` check injected before
+it, or ``cat FILE > '{output}'``. Starting a process for each of them costs
+more than the work itself, so the executor runs these forms in Python:
+
+- ``test -f|-d|-e PATH``: ``os.path`` checks.
+- ``mv SOURCE TARGET``: ``os.replace``, falling back to ``shutil.move``
+  across filesystems.
+- ``cat FILE... > OUTPUT`` (or ``>>``): a ``sendfile`` copy in the kernel.
+
+Any other form (options, several ``mv`` sources, pipes) returns None and
+runs as a regular command.
+"""
+
+import errno
+import os
+import shutil
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+from .pipeline import Pipeline
+
+# Return code and error message of a builtin step
+BuiltinResult = Tuple[int, str]
+
+TEST_PREDICATES = {
+    "-f": os.path.isfile,
+    "-d": os.path.isdir,
+    "-e": os.path.exists,
+}
+
+
+def _resolve(path: str, cwd: Optional[Path]) -> Path:
+    """Resolve a step argument against the step's working directory."""
+    return Path(cwd or ".") / path
+
+
+def _copy_contents(source, target) -> None:
+    """Append a file's contents to another, in the kernel when possible."""
+    offset = 0
+    try:
+        while True:
+            sent = os.sendfile(target.fileno(), source.fileno(), offset, 1 << 30)
+            if not sent:
+                return
+            offset += sent
+    except OSError as e:
+        if offset or e.errno not in (errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK):
+            raise
+    source.seek(0)
+    shutil.copyfileobj(source, target)
+
+
+def _run_test(args: Sequence[str], cwd: Optional[Path]) -> BuiltinResult:
+    """``test -f|-d|-e PATH``: 0 if the predicate holds, 1 otherwise."""
+    predicate = TEST_PREDICATES[args[0]]
+    return (0 if predicate(_resolve(args[1], cwd)) else 1), ""
+
+
+def _run_mv(args: Sequence[str], cwd: Optional[Path]) -> BuiltinResult:
+    """``mv SOURCE TARGET``, into TARGET if it is a directory."""
+    source = _resolve(args[0], cwd)
+    target = _resolve(args[1], cwd)
+    if target.is_dir():
+        target = target / source.name
+    try:
+        try:
+            os.replace(source, target)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(source), str(target))
+    except OSError as e:
+        return 1, f"mv: cannot move '{args[0]}' to '{args[1]}': {e.strerror or e}"
+    return 0, ""
+
+
+def _run_cat(pipeline: Pipeline, cwd: Optional[Path]) -> BuiltinResult:
+    """``cat FILE... > OUTPUT``: concatenate files into the output file."""
+    sources = list(pipeline.stages[0][1:])
+    if pipeline.input_file:
+        sources.append(pipeline.input_file)
+    output = _resolve(pipeline.output_file, cwd)
+    try:
+        # Unbuffered, as sendfile writes to the file descriptor directly
+        with open(output, "ab" if pipeline.append else "wb", buffering=0) as target:
+            for source_path in sources:
+                with open(_resolve(source_path, cwd), "rb", buffering=0) as source:
+                    _copy_contents(source, target)
+    except OSError as e:
+        return 1, f"cat: {e.filename or output}: {e.strerror or e}"
+    return 0, ""
+
+
+def run_builtin_step(
+    step: Union[List[str], Pipeline], cwd: Optional[Path] = None
+) -> Optional[BuiltinResult]:
+    """Run a step in Python if it is a supported builtin form.
+
+    Args:
+        step: Command list or parsed pipeline.
+        cwd: Working directory of the step, or None for the current one.
+
+    Returns:
+        Optional[BuiltinResult]: (return code, error message), or None if
+                                the step must run as a regular command.
+    """
+    if isinstance(step, Pipeline):
+        tool, args = step.stages[0][0], step.stages[0][1:]
+        if (
+            len(step.stages) == 1
+            and tool == "cat"
+            and step.output_file
+            # Files to read come either from arguments or from "<"
+            and bool(args) != bool(step.input_file)
+            and not any(arg.startswith("-") for arg in args)
+        ):
+            return _run_cat(step, cwd)
+        return None
+
+    if not step:
+        return None
+    tool, args = step[0], step[1:]
+    if tool == "test" and len(args) == 2 and args[0] in TEST_PREDICATES:
+        return _run_test(args, cwd)
+    if tool == "mv" and len(args) == 2 and not any(a.startswith("-") for a in args):
+        return _run_mv(args, cwd)
+    return None
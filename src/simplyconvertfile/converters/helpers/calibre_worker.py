@@ -0,0 +1,249 @@
+#!/usr/bin/python3
+"""
+Warm calibre worker for repeated e-book conversions.
+
+``ebook-convert`` starts calibre's Python and Qt runtime for every book,
+which takes seconds before any conversion work. Once a process ran
+``calibre_worker.warm_after`` ebook-convert steps (a batch, the watch or
+conversion service), the executor starts one ``calibre-debug`` process
+running calibre_worker_script.py and sends it the following ebook-convert
+steps over its stdin/stdout pipes, one JSON line per book. The arguments are
+passed to calibre's own command line parser, so every option works as with
+``ebook-convert``.
+
+The worker converts one book at a time: a step arriving while it is busy
+(parallel watch workers), a worker that does not start or dies, and a
+missing calibre run ``ebook-convert`` as a regular process instead.
+Cancelling a conversion stops the worker; the next step starts a new one.
+"""
+
+import atexit
+import contextlib
+import json
+import select
+import shlex
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Union
+
+from simplyconvertfile.config import settings_manager
+from simplyconvertfile.utils import text
+from simplyconvertfile.utils.logging import logger
+
+from .builtin_steps import BuiltinResult
+from .pipeline import Pipeline
+from .processes import ProcessGroup, ProcessLimits
+
+WORKER_SCRIPT = Path(__file__).with_name("calibre_worker_script.py")
+STARTUP_TIMEOUT = 60.0
+POLL_INTERVAL = 0.05
+
+
+class CalibreWorker:
+    """Long-lived ``calibre-debug`` process converting e-books on request.
+
+    Attributes:
+        _process: Running worker, or None.
+        _limits: Process limits the worker was started with.
+        _runs: ebook-convert steps seen so far, to start the worker only for
+              repeated conversions.
+        _failed: Whether the worker failed to start; it is not retried.
+
+    Examples:
+        >>> calibre_worker.run_step(["ebook-convert", "a.mobi", "a.epub"])
+        (0, '')
+    """
+
+    def __init__(self) -> None:
+        """Initialize without starting the worker."""
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._limits: Optional[ProcessLimits] = None
+        self._runs = 0
+        self._failed = False
+        atexit.register(self.stop)
+
+    @property
+    def settings(self) -> dict:
+        """The ``calibre_worker`` settings section."""
+        return settings_manager.get("calibre_worker", {})
+
+    def run_step(
+        self,
+        step: Union[List[str], Pipeline],
+        cwd: Optional[Path] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        process_limits: Optional[ProcessLimits] = None,
+    ) -> Optional[BuiltinResult]:
+        """Run an ebook-convert step on the warm worker if possible.
+
+        The worker runs with the process limits of the step that started it;
+        steps with other limits run as regular commands.
+
+        Args:
+            step: Command list or parsed pipeline.
+            cwd: Working directory of the step, or None for the current one.
+            cancel_check: Callback returning True to cancel the conversion.
+            process_limits: Priority and resource limits of the step.
+
+        Returns:
+            Optional[BuiltinResult]: (return code, error message), or None if
+                                    the step must run as a regular command.
+        """
+        if not isinstance(step, list) or len(step) < 3:
+            return None
+        if Path(step[0]).name != "ebook-convert":
+            return None
+        settings = self.settings
+        if not settings.get("enabled", True):
+            return None
+        # A busy worker would serialize parallel conversions
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            self._runs += 1
+            if not self._is_running() and self._runs <= settings.get("warm_after", 1):
+                return None
+            if not self._ensure_started(process_limits):
+                return None
+            if self._limits != process_limits:
+                logger.debug("ebook-convert step has other process limits")
+                return None
+            request = {"args": step[1:], "cwd": str(cwd) if cwd else None}
+            return self._convert(request, cancel_check)
+        finally:
+            self._lock.release()
+
+    def _convert(
+        self, request: dict, cancel_check: Optional[Callable[[], bool]]
+    ) -> Optional[BuiltinResult]:
+        """Send a conversion to the worker and wait for its reply.
+
+        Args:
+            request: Arguments and working directory of the conversion.
+            cancel_check: Callback returning True to cancel the conversion.
+
+        Returns:
+            Optional[BuiltinResult]: (return code, calibre's output on
+                                    failure), or None if the worker died.
+        """
+        try:
+            self._process.stdin.write(json.dumps(request) + "\n")
+            self._process.stdin.flush()
+        except (OSError, ValueError) as e:
+            logger.debug("calibre worker failed, running ebook-convert: {}", e)
+            self.stop()
+            return None
+
+        while True:
+            if cancel_check and cancel_check():
+                logger.info("Conversion cancelled, stopping calibre worker")
+                self.stop()
+                return -1, text.Operations.CANCELLED_BY_USER_MESSAGE
+            reply = self._read_reply(POLL_INTERVAL)
+            if reply is not None:
+                break
+            if self._process.poll() is not None:
+                logger.debug("calibre worker exited, running ebook-convert")
+                self.stop()
+                return None
+
+        returncode = reply.get("returncode", 1)
+        return returncode, "" if returncode == 0 else reply.get("output", "")
+
+    def _read_reply(self, timeout: float) -> Optional[dict]:
+        """Read one reply of the worker.
+
+        Args:
+            timeout: Seconds to wait for the reply to start.
+
+        Returns:
+            Optional[dict]: The reply, or None if none arrived in time or
+                           the worker closed its output.
+        """
+        readable, _, _ = select.select([self._process.stdout], [], [], timeout)
+        if not readable:
+            return None
+        line = self._process.stdout.readline()
+        try:
+            return json.loads(line) if line else None
+        except ValueError:
+            return None
+
+    def _is_running(self) -> bool:
+        """Check whether the worker process is running."""
+        return self._process is not None and self._process.poll() is None
+
+    def _ensure_started(self, process_limits: Optional[ProcessLimits]) -> bool:
+        """Start the worker unless it is running; called with the lock held.
+
+        Args:
+            process_limits: Priority and resource limits of a new worker.
+
+        Returns:
+            bool: True if the worker is running.
+        """
+        if self._is_running():
+            return True
+        if self._failed:
+            return False
+        self._failed = not self._start(process_limits)
+        return not self._failed
+
+    def _start(self, process_limits: Optional[ProcessLimits]) -> bool:
+        """Start the worker and wait until calibre is loaded.
+
+        Args:
+            process_limits: Priority and resource limits of the worker.
+
+        Returns:
+            bool: True if the worker started, False otherwise.
+        """
+        command = shlex.split(self.settings.get("command") or "") or [
+            shutil.which("calibre-debug") or "calibre-debug"
+        ]
+        self._limits = process_limits
+        try:
+            self._process = subprocess.Popen(
+                [*command, "-e", str(WORKER_SCRIPT)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                start_new_session=True,
+                env=process_limits.get_environment() if process_limits else None,
+            )
+            if process_limits:
+                process_limits.apply(self._process.pid)
+        except OSError as e:
+            logger.warning("Could not start calibre worker: {}", e)
+            return False
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline and self._process.poll() is None:
+            reply = self._read_reply(POLL_INTERVAL)
+            if reply and reply.get("ready"):
+                logger.info("Started calibre worker (pid {})", self._process.pid)
+                return True
+
+        logger.warning("calibre worker did not start, running ebook-convert per file")
+        self.stop()
+        return False
+
+    def stop(self) -> None:
+        """Stop the worker if it is running."""
+        process, self._process = self._process, None
+        if not process:
+            return
+        if process.poll() is None:
+            with ProcessGroup(process) as group:
+                group.terminate()
+        for pipe in (process.stdin, process.stdout):
+            with contextlib.suppress(OSError):
+                pipe.close()
+
+
+calibre_worker = CalibreWorker()
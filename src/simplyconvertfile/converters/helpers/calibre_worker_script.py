@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+"""
+Conversion worker run with calibre's Python by ``calibre-debug -e``.
+
+Reads one JSON request per line on stdin, ``{"args": [...], "cwd": "..."}``
+holding ebook-convert's arguments, runs calibre's conversion pipeline in this
+process and answers one JSON line ``{"returncode": N, "output": "..."}`` on
+stdout, the output being what calibre printed during the conversion. A
+``{"ready": true}`` line is written once calibre's conversion modules are
+loaded. Only the standard library and calibre can be imported here.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import traceback
+
+# Characters of calibre's output sent back with each reply
+OUTPUT_TAIL = 4000
+
+
+def convert(args, cwd):
+    """Run ebook-convert's command line in this process.
+
+    Args:
+        args: ebook-convert arguments (input, output and options).
+        cwd: Working directory of the conversion, or None.
+
+    Returns:
+        tuple: (return code, text printed during the conversion).
+    """
+    from calibre.ebooks.conversion.cli import main
+
+    previous_cwd = os.getcwd()
+    saved_fds = [os.dup(1), os.dup(2)]
+    with tempfile.TemporaryFile() as log:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        try:
+            if cwd:
+                os.chdir(cwd)
+            returncode = main(["ebook-convert"] + list(args)) or 0
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for fd, saved in zip((1, 2), saved_fds):
+                os.dup2(saved, fd)
+                os.close(saved)
+            os.chdir(previous_cwd)
+        log.seek(0)
+        output = log.read().decode("utf-8", errors="replace")
+    return returncode, output[-OUTPUT_TAIL:]
+
+
+def main():
+    """Answer conversion requests until stdin is closed."""
+    # Replies go to the original stdout; anything else printing to file
+    # descriptor 1 ends up on stderr instead of corrupting them
+    replies = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+
+    import calibre.ebooks.conversion.plumber  # noqa: F401 - preload
+
+    replies.write(json.dumps({"ready": True}) + "\n")
+    replies.flush()
+    for line in sys.stdin:
+        request = json.loads(line)
+        returncode, output = convert(request["args"], request.get("cwd"))
+        replies.write(json.dumps({"returncode": returncode, "output": output}) + "\n")
+        replies.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -207,14 +207,16 @@ class CommandParser:
             logger.debug(
                 "Input file: {}, name: {}, stem: {}",
                 input_file,
-                input_file.name,
-                input_file.stem,
+                format_args["input_name"],
+                format_args["input_stem"],
             )
 
         if output_file:
             format_args["output"] = str(output_file)
             format_args["output_dir"] = str(output_file.parent)
-            logger.debug("Output file: {}, dir: {}", output_file, output_file.parent)
+            logger.debug(
+                "Output file: {}, dir: {}", output_file, format_args["output_dir"]
+            )
 
         if temp_file:
             format_args["temp_file"] = str(temp_file)
@@ -25,6 +25,7 @@ from simplyconvertfile.utils import dependency_manager, text
 
 from .commands import CommandParser
 from .constants import SHELL_OPERATORS
+from .processes import ProcessLimits
 
 
 class ConversionManager:
@@ -39,6 +40,7 @@ class ConversionManager:
         SHELL_BUILTINS: Set of shell builtin commands that require shell execution.
         batch_mode: Whether this manager is operating in batch mode.
         external_cancel_check: Optional external callback for cancellation checks.
+        headless: Whether no GTK main loop is available to show dialogs.
         notification: Notification service for user feedback.
 
     Examples:
@@ -58,6 +60,7 @@ class ConversionManager:
         self,
         batch_mode: bool = False,
         external_cancel_check: Optional[Callable[[], bool]] = None,
+        headless: bool = False,
     ):
         """Initialize the conversion manager.
 
@@ -66,9 +69,12 @@ class ConversionManager:
                        multiple file conversions.
             external_cancel_check: Optional callback function that returns
                                  True if conversion should be cancelled.
+            headless: Whether conversions run without a GTK main loop. Dangerous
+                     commands cannot be confirmed then and are always blocked.
         """
         self.batch_mode = batch_mode
         self.external_cancel_check = external_cancel_check
+        self.headless = headless
         self.notification = notification
 
     def execute_conversion(
@@ -79,6 +85,8 @@ class ConversionManager:
         input_file_name: str,
         target_format: str,
         cancel_callback: Optional[Callable[[], None]] = None,
+        command_template: Optional[str] = None,
+        process_limits: Optional[ProcessLimits] = None,
     ) -> CommandExecutionResult:
         """Execute the conversion with progress tracking and error handling.
 
@@ -92,6 +100,10 @@ class ConversionManager:
             input_file_name: Name of the input file for progress messages.
             target_format: Target format extension for progress messages.
             cancel_callback: Optional callback to execute on cancellation.
+            command_template: Settings template the commands were built from,
+                             so its safety check is shared across a batch.
+            process_limits: Priority and resource limits applied to the
+                           commands, if any.
 
         Returns:
             CommandExecutionResult: Result object containing success status,
@@ -118,10 +130,11 @@ class ConversionManager:
             executor = CommandExecutor(
                 cancel_check=cancel_check,
                 batch_mode=self.batch_mode,
-                allow_dangerous_commands=settings_manager.get(
-                    "allow_dangerous_commands", False
-                ),
+                allow_dangerous_commands=not self.headless
+                and settings_manager.get("allow_dangerous_commands", False),
                 dangerous_command_confirm_fn=self._create_dangerous_command_confirm_fn(),
+                command_template=command_template,
+                process_limits=process_limits,
             )
 
             progress_manager = ProgressManager(
@@ -7,17 +7,25 @@ progress tracking, cancellation, and different execution modes.
 """
 
 import contextlib
+import shlex
+import signal
 import subprocess
 import threading
-import time
 from pathlib import Path
-from typing import Callable, List, Optional, Union
+from typing import Callable, List, Optional, Sequence, Union
 
 from simplyconvertfile.ui import Gtk, ProgressbarDialogWindow
 from simplyconvertfile.utils import text
 from simplyconvertfile.utils.logging import logger
+from simplyconvertfile.utils.profiling import profiler
+from simplyconvertfile.utils.progress import ProgressDisplay
 
+from .builtin_steps import run_builtin_step
+from .calibre_worker import calibre_worker
 from .constants import SHELL_OPERATORS
+from .pandoc_server import pandoc_server
+from .pipeline import ChangeDirectory, Pipeline, PipelineSyntaxError
+from .processes import ProcessGroup, ProcessLimits
 from .sanitizer import CommandSanitizer
 
 
@@ -136,6 +144,9 @@ class CommandExecutor:
     Attributes:
         cancel_check: Optional callback to check for cancellation requests.
         batch_mode: Whether operating in batch mode (affects progress display).
+        command_template: Settings template the commands were built from,
+                         used to check command safety once per template.
+        process_limits: Priority and resource limits applied to the commands.
         _cancelled: Internal flag tracking cancellation state.
 
     Examples:
@@ -152,6 +163,8 @@ class CommandExecutor:
         batch_mode: bool = False,
         allow_dangerous_commands: bool = False,
         dangerous_command_confirm_fn: Optional[Callable[[str, str], bool]] = None,
+        command_template: Optional[str] = None,
+        process_limits: Optional[ProcessLimits] = None,
     ):
         """Initialize the command executor.
 
@@ -168,9 +181,15 @@ class CommandExecutor:
                                         True if the user confirms execution.
                                         Only used when allow_dangerous_commands
                                         is True.
+            command_template: Template the executed commands were built from,
+                             or None for commands built otherwise.
+            process_limits: Priority and resource limits applied to every
+                           command, or None to run them unrestricted.
         """
         self.cancel_check = cancel_check
         self.batch_mode = batch_mode
+        self.command_template = command_template
+        self.process_limits = process_limits
         self._cancelled = False
         self._allow_dangerous_commands = allow_dangerous_commands
         self._dangerous_command_confirm_fn = dangerous_command_confirm_fn
@@ -220,9 +239,22 @@ class CommandExecutor:
         if safety_result is not None:
             return safety_result
 
-        result = self.run_cancellable_command(
-            command, shell=shell, cancel_check=self._is_cancelled
-        )
+        pipeline = None
+        if shell and isinstance(command, str):
+            with contextlib.suppress(PipelineSyntaxError):
+                pipeline = Pipeline.parse(command)
+
+        if pipeline:
+            result = self._run_step(pipeline)
+        elif not shell and isinstance(command, list):
+            result = self._run_step(command)
+        else:
+            result = self.run_cancellable_command(
+                command,
+                shell=shell,
+                cancel_check=self._is_cancelled,
+                process_limits=self.process_limits,
+            )
 
         error_message = None if result.success else result.error_output
         logger.debug(
@@ -246,8 +278,10 @@ class CommandExecutor:
     ) -> CommandExecutionResult:
         """Execute multiple commands sequentially as a chained operation.
 
-        Runs a series of commands in sequence, handling both shell-based
-        chained commands (using && operators) and regular sequential execution.
+        Runs a series of commands in sequence, stopping at the first failure.
+        Steps with pipes or redirections run as shell-free pipelines and
+        ``cd`` steps change the directory of the following steps; chains
+        using other shell syntax run as one shell command joined with &&.
         Provides progress tracking for multi-step operations.
 
         Args:
@@ -283,10 +317,43 @@ class CommandExecutor:
             for cmd in commands
         )
 
+        steps: Sequence[Union[List[str], Pipeline, ChangeDirectory]] = commands
         if needs_shell:
-            return self._execute_shell_chained_commands(commands)
-        else:
-            return self._execute_regular_chained_commands(commands, progress_callback)
+            try:
+                steps = [self._parse_step(cmd, shell_builtins) for cmd in commands]
+            except PipelineSyntaxError as e:
+                logger.debug("Running chained commands through the shell: {}", e)
+                return self._execute_shell_chained_commands(commands)
+        return self._execute_regular_chained_commands(
+            commands, progress_callback, steps
+        )
+
+    @staticmethod
+    def _parse_step(
+        cmd: List[str], shell_builtins: set
+    ) -> Union[List[str], Pipeline, ChangeDirectory]:
+        """Parse a chained command step for execution without a shell.
+
+        Args:
+            cmd: Command list, or [tool, command string] for a step using
+                shell operators.
+            shell_builtins: Set of shell builtin commands.
+
+        Returns:
+            Union[List[str], Pipeline, ChangeDirectory]: The step to run.
+
+        Raises:
+            PipelineSyntaxError: If the step needs a shell.
+        """
+        if cmd and cmd[0] == "cd":
+            if len(cmd) != 2:
+                raise PipelineSyntaxError("cd needs exactly one directory")
+            return ChangeDirectory(cmd[1])
+        if cmd and cmd[0] in shell_builtins:
+            raise PipelineSyntaxError(f"Shell builtin: {cmd[0]}")
+        if len(cmd) == 2 and any(op in cmd[1] for op in SHELL_OPERATORS):
+            return Pipeline.parse(cmd[1])
+        return cmd
 
     def _execute_shell_chained_commands(
         self, commands: List[List[str]]
@@ -319,7 +386,10 @@ class CommandExecutor:
             return safety_result
 
         result = self.run_cancellable_command(
-            command_str, shell=True, cancel_check=self._is_cancelled
+            command_str,
+            shell=True,
+            cancel_check=self._is_cancelled,
+            process_limits=self.process_limits,
         )
 
         error_message = None if result.success else result.error_output
@@ -331,8 +401,59 @@ class CommandExecutor:
             cancelled=self._cancelled,
         )
 
+    def _run_step(
+        self, step: Union[List[str], Pipeline], cwd: Optional[Path] = None
+    ) -> SubprocessResult:
+        """Run a command list or pipeline without a shell.
+
+        Trivial steps (``test``, ``mv``, ``cat > FILE``) run in Python rather
+        than in a new process (see run_builtin_step), and pandoc and
+        ebook-convert steps on a warm pandoc server or calibre worker when
+        possible (see PandocServer and CalibreWorker), if it runs with the
+        same process limits.
+
+        Args:
+            step: Command list or parsed pipeline.
+            cwd: Working directory of the step, or None for the current one.
+
+        Returns:
+            SubprocessResult: Result of the step.
+        """
+        builtin_result = run_builtin_step(step, cwd)
+        if builtin_result is None:
+            builtin_result = pandoc_server.run_step(step, cwd, self.process_limits)
+        if builtin_result is None:
+            builtin_result = calibre_worker.run_step(
+                step, cwd, self._is_cancelled, self.process_limits
+            )
+        if builtin_result is not None:
+            returncode, error = builtin_result
+            command = str(step) if isinstance(step, Pipeline) else shlex.join(step)
+            logger.debug("Ran step in-process: {}, code {}", command, returncode)
+            return SubprocessResult(
+                returncode=returncode, stderr=error, command=command
+            )
+
+        if isinstance(step, Pipeline):
+            return self.run_cancellable_pipeline(
+                step,
+                cwd=cwd,
+                cancel_check=self._is_cancelled,
+                process_limits=self.process_limits,
+            )
+        return self.run_cancellable_command(
+            step,
+            shell=False,
+            cwd=cwd,
+            cancel_check=self._is_cancelled,
+            process_limits=self.process_limits,
+        )
+
     def _execute_regular_chained_commands(
-        self, commands: List[List[str]], progress_callback: Optional[Callable]
+        self,
+        commands: List[List[str]],
+        progress_callback: Optional[Callable],
+        steps: Optional[Sequence[Union[List[str], Pipeline, ChangeDirectory]]] = None,
     ) -> CommandExecutionResult:
         """Execute chained commands step by step with individual progress tracking.
 
@@ -342,12 +463,15 @@ class CommandExecutor:
         Args:
             commands: List of command lists to execute sequentially.
             progress_callback: Optional callback for step-by-step progress updates.
+            steps: Parsed commands (see _parse_step), defaulting to commands.
 
         Returns:
             CommandExecutionResult: Result of the sequential execution.
         """
+        steps = commands if steps is None else steps
         total_steps = len(commands)
         previous_result = None
+        cwd: Optional[Path] = None
 
         # Security check: detect dangerous commands before execution
         # Check all commands upfront so we don't run half the chain
@@ -356,7 +480,7 @@ class CommandExecutor:
             if safety_result is not None:
                 return safety_result
 
-        for step_index, cmd in enumerate(commands):
+        for step_index, (cmd, step) in enumerate(zip(commands, steps)):
             if self._is_cancelled():
                 return CommandExecutionResult(
                     success=False, cancelled=True, error_message="Operation cancelled"
@@ -367,9 +491,20 @@ class CommandExecutor:
                     step_index, total_steps, f"Step {step_index + 1}/{total_steps}"
                 )
 
-            result = self.run_cancellable_command(
-                cmd, shell=False, cancel_check=self._is_cancelled
-            )
+            if isinstance(step, ChangeDirectory):
+                directory = (cwd or Path.cwd()) / step.path
+                if directory.is_dir():
+                    cwd = directory
+                    continue
+                result = SubprocessResult(
+                    returncode=1,
+                    stderr=text.Operations.CHANGE_DIRECTORY_FAILED_MESSAGE.format(
+                        directory=directory
+                    ),
+                    command=shlex.join(cmd),
+                )
+            else:
+                result = self._run_step(step, cwd)
 
             if not result.success:
                 is_validation_step = (
@@ -388,7 +523,7 @@ class CommandExecutor:
                             step=step_index + 1,
                             total=total_steps,
                             error=result.error_output,
-                            command=" ".join(cmd),
+                            command=result.command or " ".join(cmd),
                         )
                     )
 
@@ -409,11 +544,14 @@ class CommandExecutor:
         cwd: Optional[Path] = None,
         cancel_check: Optional[Callable[[], bool]] = None,
         poll_interval: float = 0.05,
+        process_limits: Optional[ProcessLimits] = None,
     ) -> SubprocessResult:
         """Run a command with cancellation support and output capture.
 
         Executes a subprocess with the ability to cancel mid-execution,
-        capturing both stdout and stderr for error reporting.
+        capturing both stdout and stderr for error reporting. The command runs
+        in its own session, so cancelling terminates every process it spawned
+        (shell pipelines, forked helpers), not just the direct child.
 
         Args:
             command: Command to run, either as string (shell mode) or list
@@ -422,6 +560,8 @@ class CommandExecutor:
             cwd: Optional working directory for the command.
             cancel_check: Callback function that returns True to cancel.
             poll_interval: Time interval between cancellation checks.
+            process_limits: Priority and resource limits applied to the
+                           command as soon as it has started.
 
         Returns:
             SubprocessResult: Complete result including return code, outputs,
@@ -456,6 +596,7 @@ class CommandExecutor:
 
         try:
             logger.debug("Starting subprocess")
+            profiler.mark("first_subprocess_spawn")
             process = subprocess.Popen(
                 command,
                 shell=shell,
@@ -464,7 +605,11 @@ class CommandExecutor:
                 stdin=subprocess.DEVNULL,
                 text=True,
                 cwd=str(cwd) if cwd else None,
+                start_new_session=True,
+                env=process_limits.get_environment() if process_limits else None,
             )
+            if process_limits:
+                process_limits.apply(process.pid)
 
             # Drain stdout/stderr in background threads to prevent
             # pipe buffer deadlock (OS pipe buffer is ~64KB on Linux;
@@ -492,12 +637,11 @@ class CommandExecutor:
             stdout_thread.start()
             stderr_thread.start()
 
-            while process.poll() is None:
-                for _ in range(5):
+            with ProcessGroup(process) as group:
+                while not group.wait(poll_interval / 5):
                     if cancel_check and cancel_check():
                         logger.info("Command cancelled during execution")
-                        with contextlib.suppress(Exception):
-                            process.kill()
+                        group.terminate()
                         # Wait for drain threads to finish after kill
                         stdout_thread.join(timeout=2)
                         stderr_thread.join(timeout=2)
@@ -506,7 +650,6 @@ class CommandExecutor:
                             stderr=text.Operations.CANCELLED_BY_USER_MESSAGE,
                             command=cmd_str,
                         )
-                    time.sleep(poll_interval / 5)
 
             # Wait for drain threads to finish
             stdout_thread.join(timeout=5)
@@ -531,6 +674,186 @@ class CommandExecutor:
                 command=cmd_str,
             )
 
+    @staticmethod
+    def run_cancellable_pipeline(
+        pipeline: Pipeline,
+        cwd: Optional[Path] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        poll_interval: float = 0.05,
+        process_limits: Optional[ProcessLimits] = None,
+    ) -> SubprocessResult:
+        """Run a pipeline without a shell, with cancellation support.
+
+        Each stage runs in its own session, like run_cancellable_command, and
+        its output feeds the next stage through a kernel pipe. The pipeline
+        fails with its first failing stage, so an error of ``tar`` in
+        ``tar -cf - . | lzma -c > out`` is not hidden by lzma succeeding.
+        Stages killed by SIGPIPE because a later stage stopped reading early
+        are not failures.
+
+        Args:
+            pipeline: Pipeline to run.
+            cwd: Optional working directory of the stages and redirections.
+            cancel_check: Callback function that returns True to cancel.
+            poll_interval: Time interval between cancellation checks.
+            process_limits: Priority and resource limits applied to every stage.
+
+        Returns:
+            SubprocessResult: Result of the pipeline; the error output of a
+                            failed stage tells which stage failed.
+        """
+        cmd_str = str(pipeline)
+        logger.debug("Running pipeline: {}, cwd: {}", cmd_str, cwd)
+        if cancel_check and cancel_check():
+            logger.info("Command cancelled before execution")
+            return SubprocessResult(
+                returncode=-1,
+                stderr=text.Operations.CANCELLED_BY_USER_MESSAGE,
+                command=cmd_str,
+            )
+
+        base_dir = cwd or Path.cwd()
+        stage_count = len(pipeline.stages)
+        processes: List[subprocess.Popen] = []
+        groups: List[ProcessGroup] = []
+        stderr_chunks: List[List[bytes]] = [[] for _ in pipeline.stages]
+        stdout_chunks: List[bytes] = []
+        drain_threads: List[threading.Thread] = []
+
+        def drain(stream, chunks: List[bytes]) -> None:
+            with contextlib.suppress(Exception):
+                for chunk in iter(lambda: stream.read(65536), b""):
+                    chunks.append(chunk)
+
+        with contextlib.ExitStack() as stack:
+            try:
+                stdin = subprocess.DEVNULL
+                if pipeline.input_file:
+                    stdin = stack.enter_context(
+                        open(base_dir / pipeline.input_file, "rb")
+                    )
+                stdout = subprocess.PIPE
+                if pipeline.output_file:
+                    stdout = stack.enter_context(
+                        open(
+                            base_dir / pipeline.output_file,
+                            "ab" if pipeline.append else "wb",
+                        )
+                    )
+            except OSError as e:
+                logger.error("Pipeline redirection failed: {}", e)
+                return SubprocessResult(returncode=1, stderr=str(e), command=cmd_str)
+
+            env = process_limits.get_environment() if process_limits else None
+            profiler.mark("first_subprocess_spawn")
+            for index, stage in enumerate(pipeline.stages):
+                is_last = index == stage_count - 1
+                try:
+                    process = subprocess.Popen(
+                        list(stage),
+                        stdin=stdin,
+                        stdout=stdout if is_last else subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        cwd=str(cwd) if cwd else None,
+                        start_new_session=True,
+                        env=env,
+                    )
+                except OSError as e:
+                    logger.error("Pipeline stage {} failed to start: {}", index + 1, e)
+                    for group in groups:
+                        group.terminate()
+                    return SubprocessResult(
+                        returncode=127,
+                        stderr=text.Operations.PIPELINE_STAGE_FAILED_MESSAGE.format(
+                            stage=index + 1,
+                            total=stage_count,
+                            command=shlex.join(stage),
+                            error=e,
+                        ),
+                        command=cmd_str,
+                    )
+                finally:
+                    # The previous stage now writes to this one only
+                    if index and processes[-1].stdout:
+                        processes[-1].stdout.close()
+
+                if process_limits:
+                    process_limits.apply(process.pid)
+                processes.append(process)
+                groups.append(stack.enter_context(ProcessGroup(process)))
+                drain_threads.append(
+                    threading.Thread(
+                        target=drain,
+                        args=(process.stderr, stderr_chunks[index]),
+                        daemon=True,
+                    )
+                )
+                if is_last and process.stdout:
+                    drain_threads.append(
+                        threading.Thread(
+                            target=drain,
+                            args=(process.stdout, stdout_chunks),
+                            daemon=True,
+                        )
+                    )
+                stdin = process.stdout
+
+            for thread in drain_threads:
+                thread.start()
+
+            for group in groups:
+                while not group.wait(poll_interval / 5):
+                    if cancel_check and cancel_check():
+                        logger.info("Pipeline cancelled during execution")
+                        for running_group in groups:
+                            running_group.terminate()
+                        for thread in drain_threads:
+                            thread.join(timeout=2)
+                        return SubprocessResult(
+                            returncode=-1,
+                            stderr=text.Operations.CANCELLED_BY_USER_MESSAGE,
+                            command=cmd_str,
+                        )
+
+            for thread in drain_threads:
+                thread.join(timeout=5)
+
+        def decode(chunks: List[bytes]) -> str:
+            return b"".join(chunks).decode(errors="replace")
+
+        stdout_text = decode(stdout_chunks)
+        for index, process in enumerate(processes):
+            returncode = process.returncode
+            if returncode == 0 or (
+                returncode == -signal.SIGPIPE and index < stage_count - 1
+            ):
+                continue
+            logger.debug(
+                "Pipeline stage {} failed with return code: {}", index + 1, returncode
+            )
+            error = decode(stderr_chunks[index]) or stdout_text
+            if stage_count > 1:
+                error = text.Operations.PIPELINE_STAGE_FAILED_MESSAGE.format(
+                    stage=index + 1,
+                    total=stage_count,
+                    command=shlex.join(pipeline.stages[index]),
+                    error=error or text.Operations.FAILED_MESSAGE,
+                )
+            return SubprocessResult(
+                returncode=returncode,
+                stdout=stdout_text,
+                stderr=error,
+                command=cmd_str,
+            )
+
+        logger.debug("Pipeline completed: {} stages", stage_count)
+        return SubprocessResult(
+            returncode=0,
+            stdout=stdout_text,
+            stderr="".join(decode(chunks) for chunks in stderr_chunks),
+            command=cmd_str,
+        )
+
     def _is_cancelled(self) -> bool:
         """Check if the current operation has been cancelled.
 
@@ -560,7 +883,8 @@ class CommandExecutor:
           If the user cancels, returns a failure result.
 
         Previously confirmed commands (same command string) are automatically
-        allowed without re-prompting.
+        allowed without re-prompting. Commands built from a template are
+        checked through the template's cached skeleton verdict.
 
         Args:
             command: Command to check, either as string or list.
@@ -577,7 +901,7 @@ class CommandExecutor:
         else:
             cmd_str = str(command)
 
-        reason = self._sanitizer.check_command(command)
+        reason = self._sanitizer.check_command(command, self.command_template)
         if reason is None:
             return None  # Command is safe
 
@@ -653,6 +977,7 @@ class ProgressManager:
         """
         self.batch_mode = batch_mode
         self._progress_window: Optional[ProgressbarDialogWindow] = None
+        self._progress_display: Optional[ProgressDisplay] = None
         self._cancelled = False
         self._cancelling = False
         self._cancel_callback = cancel_callback
@@ -719,6 +1044,7 @@ class ProgressManager:
 
         self._progress_window.dialog.connect("delete-event", on_delete_event)
         self._progress_window.progressbar.set_pulse_step(0.1)
+        self._progress_display = ProgressDisplay(self._progress_window)
 
         self._execution_result = None
         self._execution_thread = None
@@ -794,7 +1120,9 @@ class ProgressManager:
         """Create progress callback that handles cancellation and completion checking.
 
         Returns a callback function that manages progress updates, cancellation
-        detection, and dialog lifecycle.
+        detection, and dialog lifecycle. The callback runs inside the dialog's
+        main loop, so it does not pump GTK events itself, and the progress bar
+        is pulsed at most ProgressDisplay.MAX_FPS times per second.
 
         Args:
             user_callback: Optional user-provided progress callback.
@@ -819,8 +1147,8 @@ class ProgressManager:
                             )
                         return False
 
-                    if self._progress_window:
-                        self._progress_window.progressbar.pulse()
+                    if self._progress_display:
+                        self._progress_display.pulse()
                     return True
                 else:
                     self._final_cancellation_cleanup()
@@ -833,12 +1161,9 @@ class ProgressManager:
             if self._cancelled:
                 return False
 
-            while Gtk.events_pending():
-                Gtk.main_iteration()
-
             if self._execution_thread and self._execution_thread.is_alive():
-                if self._progress_window:
-                    self._progress_window.progressbar.pulse()
+                if self._progress_display:
+                    self._progress_display.pulse()
                 return True
             elif self._execution_result is not None:
                 if self._progress_window:
@@ -848,8 +1173,8 @@ class ProgressManager:
             if user_callback:
                 return user_callback(*args, **kwargs)
 
-            if self._progress_window:
-                self._progress_window.progressbar.pulse()
+            if self._progress_display:
+                self._progress_display.pulse()
             return True
 
         return progress_callback
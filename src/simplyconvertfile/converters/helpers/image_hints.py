@@ -0,0 +1,141 @@
+#!/usr/bin/python3
+"""
+Decode hints for ImageMagick commands producing downscaled images.
+
+ImageMagick decodes the whole input before resizing it, so turning a 50 MP
+camera JPEG into a small WEBP allocates and processes every pixel. When the
+target dimensions of a conversion are known (the ``size`` of a special rule
+or the ``--size`` option), the ImageMagick steps of its command template are
+rewritten before formatting:
+
+- ``-define jpeg:size=...`` before a JPEG input lets libjpeg scale the image
+  down while decoding (by 1/2, 1/4 or 1/8), keeping enough detail for the
+  final resize.
+- ``-thumbnail 'WxH>'`` (a resize that skips unneeded filtering and never
+  upscales) is added after the input and its ``-auto-orient``, or replaces
+  the template's own ``-resize``.
+
+The ``-limit memory`` and ``-limit thread`` options of the ``image_decode``
+setting are added to every ImageMagick step, whether a size is known or not.
+
+Examples:
+    >>> inject_decode_hints("convert '{input}' '{output}'", (800, 600), True)
+    "convert -define jpeg:size=1600x1600 '{input}' -thumbnail '800x600>' '{output}'"
+"""
+
+import re
+from typing import Any, Dict, Optional
+
+from simplyconvertfile.utils.image_size import Size
+
+# Ratio between the JPEG decode size and the target size, keeping enough
+# detail for a sharp resize
+DECODE_HINT_FACTOR = 2
+
+IMAGEMAGICK_STEP = re.compile(r"^(\s*(?:magick(?:\s+convert)?|convert))(?=\s)")
+INPUT_TOKEN = re.compile(r"\S*\{input\}\S*")
+AUTO_ORIENT = re.compile(r"\s+-auto-orient(?=\s|$)")
+RESIZE_OPTION = re.compile(r"-resize\s+(?:'[^']*'|\"[^\"]*\"|\S+)")
+
+
+def get_jpeg_size_hint(size: Size) -> str:
+    """Get the ``jpeg:size`` value for a target size.
+
+    The hint is square so that it also holds once ``-auto-orient`` rotated
+    the image.
+
+    Args:
+        size: Target (width, height).
+
+    Returns:
+        str: Hint such as "1600x1600".
+    """
+    side = max(size) * DECODE_HINT_FACTOR
+    return f"{side}x{side}"
+
+
+def get_limit_options(settings: Dict[str, Any]) -> str:
+    """Get the ImageMagick ``-limit`` options of the ``image_decode`` setting.
+
+    Args:
+        settings: The ``image_decode`` settings section.
+
+    Returns:
+        str: Options such as "-limit memory 256MiB -limit thread 2", or an
+            empty string if nothing is limited.
+    """
+    options = []
+    for resource, key in (("memory", "memory_limit"), ("thread", "thread_limit")):
+        value = settings.get(key)
+        if value is not None and re.fullmatch(r"[\w.]+", str(value)):
+            options.append(f"-limit {resource} {value}")
+    return " ".join(options)
+
+
+def _add_step_hints(
+    step: str, size: Optional[Size], jpeg_input: bool, limits: str
+) -> str:
+    """Add decode hints to one command step if it runs ImageMagick on the input.
+
+    Args:
+        step: Command step, without ``&&``.
+        size: Target (width, height), or None if unknown.
+        jpeg_input: Whether the input is a JPEG file.
+        limits: ``-limit`` options to add.
+
+    Returns:
+        str: The step with its hints.
+    """
+    tool = IMAGEMAGICK_STEP.match(step)
+    input_token = INPUT_TOKEN.search(step)
+    if not tool or not input_token:
+        return step
+
+    head = step[: tool.end()]
+    before_input = step[tool.end() : input_token.start()]
+    after_input = step[input_token.end() :]
+    if limits:
+        head += f" {limits}"
+
+    if size:
+        thumbnail = "-thumbnail '{}x{}>'".format(*size)
+        if jpeg_input and "jpeg:size" not in step:
+            before_input += f"-define jpeg:size={get_jpeg_size_hint(size)} "
+        if RESIZE_OPTION.search(after_input):
+            after_input = RESIZE_OPTION.sub(lambda _: thumbnail, after_input, count=1)
+        elif "-thumbnail" not in after_input:
+            orient = AUTO_ORIENT.match(after_input)
+            split = orient.end() if orient else 0
+            after_input = f"{after_input[:split]} {thumbnail}{after_input[split:]}"
+
+    return head + before_input + input_token.group() + after_input
+
+
+def inject_decode_hints(
+    template: str,
+    size: Optional[Size],
+    jpeg_input: bool = False,
+    settings: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Add decode hints to the ImageMagick steps of a command template.
+
+    Only steps starting with ``convert`` or ``magick`` and reading
+    ``{input}`` are changed; the template is returned unchanged when there
+    is neither a size nor a limit to apply.
+
+    Args:
+        template: Command template, steps separated by ``&&``.
+        size: Target (width, height), or None if unknown.
+        jpeg_input: Whether the input is a JPEG file.
+        settings: The ``image_decode`` settings section.
+
+    Returns:
+        str: The template with decode hints.
+    """
+    limits = get_limit_options(settings or {})
+    if not size and not limits:
+        return template
+    return "&&".join(
+        _add_step_hints(step, size, jpeg_input, limits)
+        for step in template.split("&&")
+    )
@@ -102,7 +102,27 @@ class MultiFileHandler:
             logger.error("Error checking multi-file conversion: {}", str(e))
             return False, None
 
-    def _create_unique_output_folder(self, pattern: dict) -> Path:
+    def create_output_folder(
+        self, pattern: dict, parent_dir: Optional[Path] = None
+    ) -> Path:
+        """Create a unique folder for the outputs of a multi-file conversion.
+
+        Used by converters that always produce several files (e.g. previews),
+        whatever the multi_file_conversions patterns.
+
+        Args:
+            pattern: Dictionary with the ``folder_suffix`` to use.
+            parent_dir: Directory receiving the folder (default: the source
+                       file's directory).
+
+        Returns:
+            Path: The path to the created output folder.
+        """
+        return self._create_unique_output_folder(pattern, parent_dir)
+
+    def _create_unique_output_folder(
+        self, pattern: dict, parent_dir: Optional[Path] = None
+    ) -> Path:
         """Create a unique output folder for multi-file conversions.
 
         Generates a folder name based on the source file, suffix, and target format.
@@ -111,6 +131,8 @@ class MultiFileHandler:
 
         Args:
             pattern: The multi-file pattern dictionary containing folder configuration.
+            parent_dir: Directory receiving the folder (default: the source
+                       file's directory).
 
         Returns:
             Path: The path to the output folder.
@@ -129,13 +151,14 @@ class MultiFileHandler:
         # Create base folder name: basename_suffix_format
         base_folder_name = f"{base_name}{suffix}_{self.target_format}"
 
-        output_folder = self.source_file.parent / base_folder_name
+        parent_dir = parent_dir or self.source_file.parent
+        output_folder = parent_dir / base_folder_name
         counter = 1
 
         # Ensure uniqueness by appending counter if folder exists
         while output_folder.exists():
             folder_name = f"{base_folder_name} ({counter})"
-            output_folder = self.source_file.parent / folder_name
+            output_folder = parent_dir / folder_name
             counter += 1
 
         try:
@@ -148,7 +171,7 @@ class MultiFileHandler:
         return output_folder
 
     def get_multi_file_output_pattern(
-        self, pattern: dict, target_extension: str
+        self, pattern: dict, target_extension: str, **placeholders
     ) -> str:
         """Get the output filename pattern for multi-file conversion.
 
@@ -159,6 +182,7 @@ class MultiFileHandler:
         Args:
             pattern: The multi-file pattern dictionary.
             target_extension: Target file extension (lowercase, without dot).
+            **placeholders: Additional placeholder values (e.g. ``size``).
 
         Returns:
             str: The filename pattern ready for ImageMagick (e.g., 'video_frame_%05d.png')
@@ -176,7 +200,9 @@ class MultiFileHandler:
 
         # Replace placeholders with actual values
         result = filename_pattern.format(
-            input_stem=self.source_file.stem, ext=target_extension.lower()
+            input_stem=self.source_file.stem,
+            ext=target_extension.lower(),
+            **placeholders,
         )
 
         logger.debug("Generated output filename pattern: {}", result)
@@ -0,0 +1,416 @@
+#!/usr/bin/python3
+"""
+Warm pandoc instance for repeated markup conversions.
+
+Most of a pandoc run on a small Markdown or HTML file is spent starting the
+Haskell runtime and initializing the readers, not converting. ``pandoc
+server`` (pandoc 3, also installed as ``pandoc-server``) keeps one instance
+running and converts documents sent as JSON over HTTP. Once a process ran
+``pandoc_server.warm_after`` pandoc steps (a batch, the watch or conversion
+service), the executor starts a server on a free local port and sends it the
+pandoc steps it can express:
+
+- ``pandoc INPUT -o OUTPUT`` with ``-f``/``--from``, ``-t``/``--to``,
+  ``-s``/``--standalone``, ``--wrap`` and ``--columns``;
+- readers and writers guessed from the file extensions, like pandoc does.
+
+The server cannot read any other file (images, templates, Lua filters), so
+other options, unknown extensions, server errors and a server that does not
+start make the step run as a regular ``pandoc`` process instead. So do
+documents referencing images when the writer would embed them (DOCX, ODT,
+EPUB, RTF, PPTX), and conversions the server reports a resource it could not
+fetch for, so every file of a batch comes out as the ``pandoc`` command would
+write it.
+"""
+
+import atexit
+import base64
+import json
+import re
+import shlex
+import shutil
+import socket
+import subprocess
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+from simplyconvertfile.config import settings_manager
+from simplyconvertfile.utils.logging import logger
+
+from .builtin_steps import BuiltinResult
+from .pipeline import Pipeline
+from .processes import ProcessGroup, ProcessLimits
+
+# Readers and writers pandoc picks from a file extension
+READERS = {
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".txt": "markdown",
+    ".html": "html",
+    ".htm": "html",
+    ".rst": "rst",
+    ".tex": "latex",
+    ".org": "org",
+    ".textile": "textile",
+    ".json": "json",
+    ".ipynb": "ipynb",
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".rtf": "rtf",
+    ".docx": "docx",
+    ".odt": "odt",
+    ".epub": "epub",
+}
+WRITERS = {
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".txt": "plain",
+    ".html": "html",
+    ".htm": "html",
+    ".rst": "rst",
+    ".tex": "latex",
+    ".org": "org",
+    ".textile": "textile",
+    ".adoc": "asciidoc",
+    ".json": "json",
+    ".ipynb": "ipynb",
+    ".rtf": "rtf",
+    ".docx": "docx",
+    ".odt": "odt",
+    ".epub": "epub",
+    ".pptx": "pptx",
+}
+# Readers whose input the server expects base64-encoded
+BINARY_READERS = {"docx", "odt", "epub"}
+# Writers embedding the images a document references in their output
+EMBEDDING_WRITERS = {"docx", "odt", "epub", "rtf", "pptx"}
+# Image references of the text readers (Markdown, HTML, LaTeX, RST, Org)
+RESOURCE_REFERENCE = re.compile(
+    r"!\[|<img\b|\\includegraphics|\.\. (?:image|figure)::|\[\[file:",
+    re.IGNORECASE,
+)
+
+# Options taking a value, by the server parameter they set
+VALUE_OPTIONS = {
+    "-o": "output",
+    "--output": "output",
+    "-f": "from",
+    "-r": "from",
+    "--from": "from",
+    "--read": "from",
+    "-t": "to",
+    "-w": "to",
+    "--to": "to",
+    "--write": "to",
+    "--wrap": "wrap",
+    "--columns": "columns",
+}
+FLAG_OPTIONS = {"-s": "standalone", "--standalone": "standalone"}
+
+STARTUP_TIMEOUT = 10.0
+
+
+class PandocRequest(NamedTuple):
+    """A pandoc command the server can run.
+
+    Attributes:
+        input_file: Document to convert.
+        output_file: File receiving the result.
+        options: Server parameters other than the text.
+    """
+
+    input_file: Path
+    output_file: Path
+    options: Dict[str, Any]
+
+
+def parse_pandoc_command(
+    command: List[str], cwd: Optional[Path] = None
+) -> Optional[PandocRequest]:
+    """Translate a pandoc command into a server request.
+
+    Args:
+        command: ``pandoc`` command arguments.
+        cwd: Working directory of the command, or None for the current one.
+
+    Returns:
+        Optional[PandocRequest]: The request, or None if the command uses
+                                options or formats the server cannot handle.
+
+    Examples:
+        >>> parse_pandoc_command(["pandoc", "a.md", "-o", "a.txt", "--wrap=none"])
+        PandocRequest(input_file=PosixPath('a.md'), output_file=PosixPath('a.txt'),
+                      options={'wrap': 'none', 'from': 'markdown', 'to': 'plain'})
+    """
+    options: Dict[str, Any] = {}
+    inputs: List[str] = []
+    index = 1
+    while index < len(command):
+        argument = command[index]
+        name, has_value, value = argument.partition("=")
+        if argument in FLAG_OPTIONS:
+            options[FLAG_OPTIONS[argument]] = True
+        elif has_value and name.startswith("--") and name in VALUE_OPTIONS:
+            options[VALUE_OPTIONS[name]] = value
+        elif argument in VALUE_OPTIONS and index + 1 < len(command):
+            index += 1
+            options[VALUE_OPTIONS[argument]] = command[index]
+        elif argument.startswith("-"):
+            return None
+        else:
+            inputs.append(argument)
+        index += 1
+
+    output = options.pop("output", None)
+    if len(inputs) != 1 or not output or output == "-":
+        return None
+    input_file = Path(cwd or ".") / inputs[0]
+    output_file = Path(cwd or ".") / output
+    options.setdefault("from", READERS.get(input_file.suffix.lower()))
+    options.setdefault("to", WRITERS.get(output_file.suffix.lower()))
+    if not options["from"] or not options["to"]:
+        return None
+    if "columns" in options:
+        if not str(options["columns"]).isdigit():
+            return None
+        options["columns"] = int(options["columns"])
+    return PandocRequest(input_file, output_file, options)
+
+
+def _get_free_port() -> int:
+    """Get a local TCP port nothing listens on."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class PandocServer:
+    """``pandoc server`` process shared by the conversions of a process.
+
+    Attributes:
+        _process: Running server, or None.
+        _port: Port the server listens on.
+        _limits: Process limits the server was started with.
+        _runs: pandoc steps seen so far, to start the server only for
+              repeated conversions.
+        _failed: Whether the server failed to start; it is not retried.
+
+    Examples:
+        >>> pandoc_server.run_step(["pandoc", "a.md", "-o", "a.html"])
+        (0, '')
+    """
+
+    def __init__(self) -> None:
+        """Initialize without starting the server."""
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._port = 0
+        self._limits: Optional[ProcessLimits] = None
+        self._runs = 0
+        self._failed = False
+        atexit.register(self.stop)
+
+    @property
+    def settings(self) -> dict:
+        """The ``pandoc_server`` settings section."""
+        return settings_manager.get("pandoc_server", {})
+
+    def run_step(
+        self,
+        step: Union[List[str], Pipeline],
+        cwd: Optional[Path] = None,
+        process_limits: Optional[ProcessLimits] = None,
+    ) -> Optional[BuiltinResult]:
+        """Run a pandoc step on the warm server if possible.
+
+        The server runs with the process limits of the step that started it;
+        steps with other limits run as regular commands.
+
+        Args:
+            step: Command list or parsed pipeline.
+            cwd: Working directory of the step, or None for the current one.
+            process_limits: Priority and resource limits of the step.
+
+        Returns:
+            Optional[BuiltinResult]: (return code, error message), or None if
+                                    the step must run as a regular command.
+        """
+        if not isinstance(step, list) or not step or Path(step[0]).name != "pandoc":
+            return None
+        settings = self.settings
+        if not settings.get("enabled", True):
+            return None
+        request = parse_pandoc_command(step, cwd)
+        if not request:
+            return None
+
+        with self._lock:
+            self._runs += 1
+            if not self._is_running() and self._runs <= settings.get("warm_after", 1):
+                return None
+            if not self._ensure_started(process_limits):
+                return None
+            if self._limits != process_limits:
+                logger.debug("pandoc step has other process limits than the server")
+                return None
+            port = self._port
+
+        try:
+            if request.options["from"] in BINARY_READERS:
+                text = base64.b64encode(request.input_file.read_bytes()).decode()
+            else:
+                text = request.input_file.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+        if (
+            request.options["to"] in EMBEDDING_WRITERS
+            and request.options["from"] not in BINARY_READERS
+            and RESOURCE_REFERENCE.search(text)
+        ):
+            logger.debug("{} references images, running pandoc", request.input_file)
+            return None
+        response = self._post(port, {"text": text, **request.options})
+        if response is None:
+            return None
+        messages = [str(message) for message in response.get("messages") or []]
+        if any("fetch" in message.lower() for message in messages):
+            # The pandoc command could read the resource the server could not
+            logger.debug("pandoc server could not fetch a resource: {}", messages)
+            return None
+
+        output = response["output"]
+        if response.get("base64"):
+            data = base64.b64decode(output)
+        else:
+            # Like the pandoc command, end text output with a newline
+            data = (output if output.endswith("\n") else output + "\n").encode()
+        try:
+            request.output_file.write_bytes(data)
+        except OSError as e:
+            return 1, f"pandoc: {request.output_file}: {e.strerror or e}"
+        for message in messages:
+            logger.debug("pandoc server: {}", message)
+        return 0, ""
+
+    def start(self, process_limits: Optional[ProcessLimits] = None) -> bool:
+        """Start the server now rather than on a later pandoc step.
+
+        Args:
+            process_limits: Priority and resource limits of the server.
+
+        Returns:
+            bool: True if the server is running.
+        """
+        with self._lock:
+            return self._ensure_started(process_limits)
+
+    def _is_running(self) -> bool:
+        """Check whether the server process is running."""
+        return self._process is not None and self._process.poll() is None
+
+    def _ensure_started(self, process_limits: Optional[ProcessLimits]) -> bool:
+        """Start the server unless it is running; called with the lock held.
+
+        Args:
+            process_limits: Priority and resource limits of a new server.
+
+        Returns:
+            bool: True if the server is running.
+        """
+        if self._is_running():
+            return True
+        if self._failed:
+            return False
+        self._failed = not self._start(process_limits)
+        return not self._failed
+
+    def _start(self, process_limits: Optional[ProcessLimits]) -> bool:
+        """Start the server and wait until it answers.
+
+        Args:
+            process_limits: Priority and resource limits of the server.
+
+        Returns:
+            bool: True if the server started, False otherwise.
+        """
+        settings = self.settings
+        command = shlex.split(settings.get("command") or "")
+        if not command:
+            server = shutil.which("pandoc-server")
+            command = [server] if server else ["pandoc", "server"]
+        port = _get_free_port()
+        timeout = int(settings.get("timeout", 30))
+        self._limits = process_limits
+
+        try:
+            self._process = subprocess.Popen(
+                [*command, "--port", str(port), "--timeout", str(timeout)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+                env=process_limits.get_environment() if process_limits else None,
+            )
+            if process_limits:
+                process_limits.apply(self._process.pid)
+        except OSError as e:
+            logger.warning("Could not start pandoc server, running pandoc: {}", e)
+            return False
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline and self._process.poll() is None:
+            try:
+                with urllib.request.urlopen(
+                    f"http://127.0.0.1:{port}/version", timeout=1
+                ) as response:
+                    version = response.read().decode(errors="replace").strip()
+            except OSError:
+                time.sleep(0.05)
+                continue
+            self._port = port
+            logger.info("Started pandoc server {} on port {}", version, port)
+            return True
+
+        logger.warning("pandoc server did not start, running pandoc per file")
+        self.stop()
+        return False
+
+    def _post(self, port: int, parameters: Dict[str, Any]) -> Optional[dict]:
+        """Send a conversion to the server.
+
+        Args:
+            port: Port of the server.
+            parameters: Request body (text, formats and options).
+
+        Returns:
+            Optional[dict]: Response with ``output``, ``base64`` and
+                           ``messages``, or None if the conversion failed.
+        """
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{port}/",
+            data=json.dumps(parameters).encode(),
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+        timeout = int(self.settings.get("timeout", 30)) + 5
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                result = json.load(response)
+        except (OSError, ValueError) as e:
+            logger.debug("pandoc server failed, running pandoc instead: {}", e)
+            return None
+        if not isinstance(result, dict) or not isinstance(result.get("output"), str):
+            return None
+        return result
+
+    def stop(self) -> None:
+        """Stop the server if it is running."""
+        process, self._process = self._process, None
+        if process and process.poll() is None:
+            with ProcessGroup(process) as group:
+                group.terminate()
+
+
+pandoc_server = PandocServer()
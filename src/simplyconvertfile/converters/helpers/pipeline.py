@@ -0,0 +1,236 @@
+#!/usr/bin/python3
+"""
+Shell-free parsing of command pipelines.
+
+Templates chain tools with pipes and redirections, such as
+``tar -cf - . | lzma -c > '/out/archive.tar.lzma'``. Rather than handing the
+whole command to ``/bin/sh``, the executor parses it into a Pipeline and
+starts each stage itself, connected by kernel pipes. This saves the shell
+process and tells which stage failed.
+
+Only plain words, quoting, ``|``, ``<`` (first stage) and ``>`` / ``>>``
+(last stage) are understood. Anything else a shell would interpret
+(variables, globs, ``;``, ``&``, subshells, other redirections, variable
+assignments and keywords such as ``!`` or ``if`` starting a stage) raises
+PipelineSyntaxError, and the command is then run by the shell as before.
+"""
+
+import re
+import shlex
+from dataclasses import dataclass
+from typing import List, NamedTuple, Optional, Tuple
+
+# Unquoted characters with a shell meaning the parser does not implement
+UNSUPPORTED_CHARACTERS = frozenset(";&$`()*?[{\n")
+# Characters with a shell meaning at the start of a word only
+UNSUPPORTED_WORD_START = frozenset("~#")
+# Characters a backslash escapes inside double quotes
+DOUBLE_QUOTE_ESCAPES = frozenset('"\\')
+# Variable assignment before a command, such as LC_ALL=C
+ASSIGNMENT_WORD = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
+# Reserved words the shell interprets at the start of a command
+SHELL_KEYWORDS = frozenset(
+    {
+        "!",
+        "case",
+        "do",
+        "done",
+        "elif",
+        "else",
+        "esac",
+        "fi",
+        "for",
+        "function",
+        "if",
+        "in",
+        "select",
+        "then",
+        "time",
+        "until",
+        "while",
+        "}",
+    }
+)
+
+
+class PipelineSyntaxError(ValueError):
+    """Raised for command syntax that needs a real shell."""
+
+
+class ChangeDirectory(NamedTuple):
+    """A ``cd`` step of a chained command, changing the directory of later steps.
+
+    Attributes:
+        path: Directory, relative to the current one or absolute.
+    """
+
+    path: str
+
+
+Token = Tuple[str, bool]
+
+
+def _tokenize(command: str) -> List[Token]:
+    """Split a command into words and operators, resolving quotes.
+
+    Args:
+        command: Command string, as a POSIX shell would read it.
+
+    Returns:
+        List[Token]: (text, is_operator) pairs.
+
+    Raises:
+        PipelineSyntaxError: If the command uses unsupported shell syntax.
+    """
+    tokens: List[Token] = []
+    word: List[str] = []
+    in_word = False
+    index = 0
+    length = len(command)
+
+    def end_word() -> None:
+        nonlocal in_word
+        if in_word:
+            tokens.append(("".join(word), False))
+            word.clear()
+            in_word = False
+
+    while index < length:
+        char = command[index]
+        if char in " \t":
+            end_word()
+        elif char == "'":
+            closing = command.find("'", index + 1)
+            if closing < 0:
+                raise PipelineSyntaxError("Unterminated single quote")
+            word.append(command[index + 1 : closing])
+            in_word = True
+            index = closing
+        elif char == '"':
+            index += 1
+            while index < length and command[index] != '"':
+                quoted = command[index]
+                if quoted in "$`":
+                    raise PipelineSyntaxError(f"Unsupported expansion: {quoted}")
+                if quoted == "\\" and index + 1 < length:
+                    if command[index + 1] in DOUBLE_QUOTE_ESCAPES:
+                        index += 1
+                        quoted = command[index]
+                word.append(quoted)
+                index += 1
+            if index >= length:
+                raise PipelineSyntaxError("Unterminated double quote")
+            in_word = True
+        elif char == "\\":
+            if index + 1 >= length:
+                raise PipelineSyntaxError("Trailing backslash")
+            index += 1
+            word.append(command[index])
+            in_word = True
+        elif char in "|<>":
+            if command.startswith("||", index):
+                raise PipelineSyntaxError("Unsupported operator: ||")
+            if in_word and word and all(c.isdigit() for c in word):
+                raise PipelineSyntaxError("Unsupported file descriptor redirection")
+            end_word()
+            operator = ">>" if command.startswith(">>", index) else char
+            if command.startswith(("<<", "<>", ">&", "<&", ">|"), index) or (
+                operator == ">>" and command.startswith(">>&", index)
+            ):
+                raise PipelineSyntaxError("Unsupported redirection")
+            tokens.append((operator, True))
+            index += len(operator) - 1
+        elif char in UNSUPPORTED_CHARACTERS or (
+            not in_word and char in UNSUPPORTED_WORD_START
+        ):
+            raise PipelineSyntaxError(f"Unsupported shell syntax: {char}")
+        else:
+            word.append(char)
+            in_word = True
+        index += 1
+
+    end_word()
+    return tokens
+
+
+@dataclass(frozen=True)
+class Pipeline:
+    """Commands connected by pipes, with optional file redirections.
+
+    Attributes:
+        stages: Argument lists of the commands, in pipe order.
+        input_file: File read by the first stage (``<``), or None.
+        output_file: File written by the last stage (``>`` or ``>>``), or None.
+        append: Whether the output file is appended to (``>>``).
+
+    Examples:
+        >>> Pipeline.parse("tar -cf - . | lzma -c > '/tmp/out file.lzma'")
+        Pipeline(stages=(('tar', '-cf', '-', '.'), ('lzma', '-c')),
+                 input_file=None, output_file='/tmp/out file.lzma', append=False)
+    """
+
+    stages: Tuple[Tuple[str, ...], ...]
+    input_file: Optional[str] = None
+    output_file: Optional[str] = None
+    append: bool = False
+
+    @classmethod
+    def parse(cls, command: str) -> "Pipeline":
+        """Parse a command string into a pipeline.
+
+        Args:
+            command: Command with optional ``|``, ``<``, ``>`` and ``>>``.
+
+        Returns:
+            Pipeline: The parsed pipeline.
+
+        Raises:
+            PipelineSyntaxError: If the command needs a shell to run.
+        """
+        stages: List[List[str]] = [[]]
+        redirections = {}
+        tokens = _tokenize(command)
+        index = 0
+        while index < len(tokens):
+            value, is_operator = tokens[index]
+            if not is_operator:
+                stages[-1].append(value)
+            elif value == "|":
+                if not stages[-1] or redirections.get(">"):
+                    raise PipelineSyntaxError("Empty pipeline stage")
+                stages.append([])
+            else:
+                index += 1
+                if index >= len(tokens) or tokens[index][1]:
+                    raise PipelineSyntaxError(f"Missing file after {value}")
+                direction = "<" if value == "<" else ">"
+                if direction in redirections or (direction == "<" and len(stages) > 1):
+                    raise PipelineSyntaxError(f"Unsupported redirection: {value}")
+                redirections[direction] = (tokens[index][0], value == ">>")
+            index += 1
+
+        if not stages[-1]:
+            raise PipelineSyntaxError("Empty pipeline stage")
+        for stage in stages:
+            if ASSIGNMENT_WORD.match(stage[0]):
+                raise PipelineSyntaxError(f"Variable assignment: {stage[0]}")
+            if stage[0] in SHELL_KEYWORDS:
+                raise PipelineSyntaxError(f"Shell keyword: {stage[0]}")
+        output_file, append = redirections.get(">", (None, False))
+        return cls(
+            stages=tuple(tuple(stage) for stage in stages),
+            input_file=redirections.get("<", (None, False))[0],
+            output_file=output_file,
+            append=append,
+        )
+
+    def __str__(self) -> str:
+        """Command line of the pipeline, for logs and error messages."""
+        stages = [shlex.join(stage) for stage in self.stages]
+        if self.input_file:
+            stages[0] += f" < {shlex.quote(self.input_file)}"
+        command = " | ".join(stages)
+        if self.output_file:
+            operator = ">>" if self.append else ">"
+            command += f" {operator} {shlex.quote(self.output_file)}"
+        return command
@@ -0,0 +1,321 @@
+#!/usr/bin/python3
+"""
+Process group handling for conversion commands.
+
+Conversion commands are started in their own session (and therefore their
+own process group), so cancelling a conversion can signal every process it
+spawned: both sides of a shell pipeline (``tar -cf - . | lzma -c > out``),
+LibreOffice's ``soffice.bin`` forked by ``oosplash``, or helpers started by
+a wrapper script. Killing only the direct child would leave those running.
+
+On Linux 5.3+ with Python 3.9+, the exit of the group leader is waited for
+through a pidfd, so waits wake up as soon as the process exits instead of
+polling.
+
+ProcessLimits holds the priority and resource settings (``process_limits``)
+the parent applies to a conversion command right after starting it, and the
+thread count given to multithreaded tools through their environment. No
+``preexec_fn`` is needed, which would be unsafe in this threaded program and
+keep Popen from using its faster spawn paths.
+"""
+
+import contextlib
+import ctypes
+import ctypes.util
+import os
+import platform
+import resource
+import select
+import signal
+import subprocess
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+from simplyconvertfile.utils.logging import logger
+
+# Seconds between SIGTERM and SIGKILL when terminating a process group
+TERMINATE_GRACE = 0.2
+
+# ioprio_set(2): syscall numbers per architecture, classes and encoding
+IOPRIO_SET_SYSCALLS = {
+    "x86_64": 251,
+    "i386": 289,
+    "i686": 289,
+    "aarch64": 30,
+    "riscv64": 30,
+    "armv7l": 314,
+    "ppc64le": 273,
+}
+IOPRIO_CLASSES = {"realtime": 1, "best-effort": 2, "idle": 3}
+IOPRIO_CLASS_SHIFT = 13
+IOPRIO_WHO_PGRP = 2
+
+
+def _open_pidfd(pid: int) -> Optional[int]:
+    """Open a pidfd for a process, or None if pidfds are unavailable."""
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return None
+    try:
+        return pidfd_open(pid)
+    except OSError:
+        return None
+
+
+class ProcessGroup:
+    """A child process started as the leader of its own process group.
+
+    The process must be started with ``start_new_session=True``. Used as a
+    context manager, the group is killed on exit if the leader is still
+    running (e.g. after an exception or KeyboardInterrupt).
+
+    Attributes:
+        process: The group leader.
+
+    Examples:
+        >>> process = subprocess.Popen(["sh", "-c", "sleep 60 | cat"],
+        ...                            start_new_session=True)
+        >>> with ProcessGroup(process) as group:
+        ...     if not group.wait(0.1):
+        ...         group.terminate()
+    """
+
+    def __init__(self, process: subprocess.Popen) -> None:
+        """Watch a process started in its own session.
+
+        Args:
+            process: Process started with ``start_new_session=True``.
+        """
+        self.process = process
+        self._pidfd = _open_pidfd(process.pid)
+
+    def __enter__(self) -> "ProcessGroup":
+        """Return the group."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Kill the group if the leader is still running and release the pidfd."""
+        if self.process.poll() is None:
+            self.signal(signal.SIGKILL)
+            with contextlib.suppress(subprocess.TimeoutExpired):
+                self.process.wait(timeout=1.0)
+        self.close()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for the group leader to exit.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            bool: True if the leader exited (and was reaped), False on timeout.
+        """
+        if self.process.poll() is not None:
+            return True
+        if self._pidfd is not None:
+            with contextlib.suppress(OSError, ValueError):
+                select.select([self._pidfd], [], [], timeout)
+            return self.process.poll() is not None
+        try:
+            self.process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+
+    def signal(self, signum: int) -> None:
+        """Send a signal to every process of the group.
+
+        Args:
+            signum: Signal number (e.g. signal.SIGTERM).
+        """
+        with contextlib.suppress(ProcessLookupError, PermissionError):
+            os.killpg(self.process.pid, signum)
+
+    def terminate(self, grace: float = TERMINATE_GRACE) -> None:
+        """Terminate the whole group: SIGTERM, then SIGKILL after a grace period.
+
+        SIGKILL is sent to the group even when the leader exited within the
+        grace period, so that children ignoring SIGTERM or outliving their
+        parent do not keep running.
+
+        Args:
+            grace: Seconds to wait for the leader after SIGTERM.
+        """
+        logger.debug("Terminating process group {}", self.process.pid)
+        self.signal(signal.SIGTERM)
+        self.wait(grace)
+        self.signal(signal.SIGKILL)
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            self.process.wait(timeout=1.0)
+
+    def close(self) -> None:
+        """Release the pidfd, if any."""
+        if self._pidfd is not None:
+            with contextlib.suppress(OSError):
+                os.close(self._pidfd)
+            self._pidfd = None
+
+
+@lru_cache(maxsize=1)
+def _get_ioprio_set() -> Optional[Callable[[int, int], None]]:
+    """Get a function setting the I/O priority of a process group.
+
+    Returns:
+        Optional[Callable[[int, int], None]]: Function taking a process group
+            ID and an encoded I/O priority, or None if ioprio_set is
+            unavailable on this system.
+    """
+    syscall_number = IOPRIO_SET_SYSCALLS.get(platform.machine())
+    library = ctypes.util.find_library("c")
+    if syscall_number is None or library is None:
+        return None
+    try:
+        syscall = ctypes.CDLL(library, use_errno=True).syscall
+    except (OSError, AttributeError):
+        return None
+
+    def ioprio_set(pgid: int, priority: int) -> None:
+        syscall(syscall_number, IOPRIO_WHO_PGRP, pgid, priority)
+
+    return ioprio_set
+
+
+def _parse_cpu_list(value: Any) -> Optional[FrozenSet[int]]:
+    """Parse a CPU list given as [0, 1, 2] or as a string like "0-3,6"."""
+    cpus = set()
+    if isinstance(value, str):
+        for part in value.split(","):
+            first, _, last = part.strip().partition("-")
+            cpus.update(range(int(first), int(last or first) + 1))
+    elif isinstance(value, list):
+        cpus.update(int(cpu) for cpu in value)
+    else:
+        raise ValueError(value)
+    return frozenset(cpus) or None
+
+
+@dataclass(frozen=True)
+class ProcessLimits:
+    """Priority and resource limits applied to a conversion command.
+
+    Attributes:
+        nice: Added to the niceness of the command, like ``nice -n``.
+        ionice_class: I/O scheduling class ("realtime", "best-effort" or
+                     "idle"), or None to keep the inherited one.
+        ionice_level: I/O priority within the class, 0 (highest) to 7.
+        cpu_affinity: CPUs the command may run on, or None for all.
+        memory_limit_mb: Address space limit (RLIMIT_AS), or None.
+        threads: Threads the command may use (its share of the thread
+                budget), or None for tool defaults.
+
+    Examples:
+        >>> limits = ProcessLimits.from_settings({"nice": 10, "ionice_class": "idle"})
+        >>> process = subprocess.Popen(command, start_new_session=True)
+        >>> limits.apply(process.pid)
+    """
+
+    nice: int = 0
+    ionice_class: Optional[str] = None
+    ionice_level: Optional[int] = None
+    cpu_affinity: Optional[FrozenSet[int]] = None
+    memory_limit_mb: Optional[int] = None
+    threads: Optional[int] = None
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> Optional["ProcessLimits"]:
+        """Build limits from a ``process_limits`` settings section.
+
+        Invalid values are logged and ignored.
+
+        Args:
+            settings: Merged settings (nice, ionice_class, ionice_level,
+                     cpu_affinity, memory_limit_mb), missing keys or null
+                     values meaning "unchanged".
+
+        Returns:
+            Optional[ProcessLimits]: The limits, or None if nothing is limited.
+        """
+        values: Dict[str, Any] = {}
+        parsers = {
+            "nice": int,
+            "ionice_class": cls._parse_ionice_class,
+            "ionice_level": lambda level: min(max(int(level), 0), 7),
+            "cpu_affinity": _parse_cpu_list,
+            "memory_limit_mb": lambda megabytes: int(megabytes) or None,
+        }
+        for key, parse in parsers.items():
+            if settings.get(key) is None:
+                continue
+            try:
+                values[key] = parse(settings[key])
+            except (TypeError, ValueError):
+                logger.warning(
+                    "Ignoring invalid process_limits.{}: {}", key, settings[key]
+                )
+
+        limits = cls(**values)
+        return limits if limits != cls() else None
+
+    @staticmethod
+    def _parse_ionice_class(value: Any) -> str:
+        """Validate an I/O scheduling class name."""
+        name = str(value).lower()
+        if name not in IOPRIO_CLASSES:
+            raise ValueError(value)
+        return name
+
+    def apply(self, pid: int) -> None:
+        """Apply the limits to a command the parent just started.
+
+        The command must be the leader of a new session. Niceness and I/O
+        priority are set for its whole process group, CPU affinity and the
+        memory limit for the leader, whose later children inherit them. A
+        limit that cannot be applied (e.g. a negative nice value without
+        privileges, or a command that already exited) is skipped rather
+        than failing the conversion.
+
+        Args:
+            pid: Process ID of the command, which is also its process group ID.
+        """
+        if self.nice:
+            with contextlib.suppress(OSError):
+                niceness = os.getpriority(os.PRIO_PROCESS, 0) + self.nice
+                os.setpriority(os.PRIO_PGRP, pid, niceness)
+        if self.ionice_class:
+            ioprio_set = _get_ioprio_set()
+            level = 4 if self.ionice_level is None else self.ionice_level
+            if self.ionice_class == "idle":
+                level = 0
+            if ioprio_set:
+                ioprio_set(
+                    pid, IOPRIO_CLASSES[self.ionice_class] << IOPRIO_CLASS_SHIFT | level
+                )
+        if self.cpu_affinity:
+            with contextlib.suppress(OSError, ValueError):
+                os.sched_setaffinity(pid, self.cpu_affinity)
+        if self.memory_limit_mb:
+            memory_limit = self.memory_limit_mb * 1024 * 1024
+            with contextlib.suppress(OSError, ValueError):
+                resource.prlimit(pid, resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+    def get_environment(self) -> Optional[Dict[str, str]]:
+        """Get the environment limiting the threads of the command.
+
+        ImageMagick and other OpenMP programs read ``MAGICK_THREAD_LIMIT`` and
+        ``OMP_NUM_THREADS``, xz reads its options from ``XZ_DEFAULTS``.
+
+        Returns:
+            Optional[Dict[str, str]]: Environment to pass as Popen's ``env``,
+                or None to inherit the current one.
+        """
+        if not self.threads:
+            return None
+        threads = str(self.threads)
+        environment = dict(os.environ)
+        environment["MAGICK_THREAD_LIMIT"] = threads
+        environment["OMP_NUM_THREADS"] = threads
+        environment["XZ_DEFAULTS"] = (
+            f"-T{threads} " + environment.get("XZ_DEFAULTS", "")
+        ).strip()
+        return environment
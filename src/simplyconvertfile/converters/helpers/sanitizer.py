@@ -8,12 +8,14 @@ escalation, network access, and system control commands.
 """
 
 import re
+from functools import lru_cache
 from pathlib import PurePosixPath
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 from simplyconvertfile.utils.logging import logger
 from simplyconvertfile.utils.text import text
 
+from .commands import CommandParser
 from .constants import DANGEROUS_COMMAND_CATEGORIES, DANGEROUS_COMMANDS
 
 
@@ -25,6 +27,12 @@ class CommandSanitizer:
     each sub-command. Used as a security gate at the command execution
     chokepoint.
 
+    Commands built from a settings template can be checked through the
+    template instead: its executable skeleton (file path placeholders
+    replaced) is checked once and the verdict is cached for every file of a
+    batch. Templates with a placeholder outside single quotes, where the
+    path becomes part of the shell syntax, are checked per command.
+
     Examples:
         >>> sanitizer = CommandSanitizer()
         >>> reason = sanitizer.check_command("ffmpeg -i input.mp4 output.mp3")
@@ -39,10 +47,19 @@ class CommandSanitizer:
     # while preserving the ability to identify each sub-command.
     _SPLIT_PATTERN = re.compile(r"\s*(?:&&|\|\||\||;)\s*")
 
+    # Placeholders substituted with file paths by CommandParser.format_template
+    _PLACEHOLDER_PATTERN = re.compile(
+        r"\{(" + "|".join(sorted(CommandParser._PATH_KEYS)) + r")\}"
+    )
+
     def __init__(self) -> None:
         """Initialize the command sanitizer."""
 
-    def check_command(self, command: Union[str, List[str]]) -> Optional[str]:
+    def check_command(
+        self,
+        command: Union[str, List[str]],
+        template: Optional[str] = None,
+    ) -> Optional[str]:
         """Check a command for dangerous executables.
 
         Parses the command string (handling shell operators), extracts the
@@ -51,6 +68,9 @@ class CommandSanitizer:
 
         Args:
             command: Command to check, either as a string or list of strings.
+            template: Settings template the command was built from. When its
+                     placeholders are all single-quoted, the cached verdict of
+                     the template skeleton is returned instead.
 
         Returns:
             Optional[str]: Human-readable reason string if a dangerous command
@@ -63,6 +83,11 @@ class CommandSanitizer:
             >>> sanitizer.check_command("sudo ffmpeg -i input.mp4 output.mp3")
             "Blocked command 'sudo' detected (privilege escalation)"
         """
+        if template is not None:
+            compiled, reason = self._check_template(template)
+            if compiled:
+                return reason
+
         if isinstance(command, list):
             # For list-form commands, check if it's a shell command
             # (tool, full_cmd_str) pair or a regular argument list
@@ -77,6 +102,96 @@ class CommandSanitizer:
 
         return self._check_command_string(str(command))
 
+    @classmethod
+    def compile_template(cls, template: str) -> Optional[str]:
+        """Compile a command template into its executable skeleton.
+
+        Placeholders inside a single-quoted shell string are replaced by a
+        neutral token: whatever path is substituted there stays one literal
+        argument (quotes in paths are escaped), so it can never name an
+        executable or add a shell operator.
+
+        Args:
+            template: Command template with {input}, {output}, etc.
+
+        Returns:
+            Optional[str]: The skeleton, or None if a placeholder appears
+                          unquoted or inside double quotes (where the path is
+                          part of the shell syntax and must be checked per file).
+
+        Examples:
+            >>> CommandSanitizer.compile_template("convert '{input}' '{output}'")
+            "convert '_' '_'"
+            >>> CommandSanitizer.compile_template("cat {input} > {output}")
+        """
+        placeholders = list(cls._PLACEHOLDER_PATTERN.finditer(template))
+        if not placeholders:
+            return template
+
+        single_quoted = cls._get_single_quoted_spans(template)
+        skeleton = template
+        for match in reversed(placeholders):
+            quoted = any(
+                start < match.start() and match.end() <= end
+                for start, end in single_quoted
+            )
+            # format_template escapes quotes for a double-quoted context when
+            # an odd number of double quotes precedes the placeholder
+            if not quoted or template[: match.start()].count('"') % 2:
+                return None
+            skeleton = skeleton[: match.start()] + "_" + skeleton[match.end() :]
+        return skeleton
+
+    @staticmethod
+    def _get_single_quoted_spans(command_str: str) -> List[Tuple[int, int]]:
+        """Find the single-quoted strings of a shell command.
+
+        Follows shell quoting rules: single quotes inside double quotes are
+        literal, and a backslash escapes the next character outside quotes.
+
+        Args:
+            command_str: Shell command to scan.
+
+        Returns:
+            List[Tuple[int, int]]: (opening quote, closing quote) indexes.
+        """
+        spans = []
+        quote = None
+        start = 0
+        index = 0
+        while index < len(command_str):
+            char = command_str[index]
+            if quote is None:
+                if char == "\\":
+                    index += 1
+                elif char in "'\"":
+                    quote, start = char, index
+            elif quote == "'":
+                if char == "'":
+                    spans.append((start, index))
+                    quote = None
+            elif char == "\\":
+                index += 1
+            elif char == '"':
+                quote = None
+            index += 1
+        return spans
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _check_template(cls, template: str) -> Tuple[bool, Optional[str]]:
+        """Check a template skeleton once and cache the verdict.
+
+        Returns:
+            Tuple[bool, Optional[str]]: Whether the template could be compiled,
+                and the reason string if its skeleton is dangerous.
+        """
+        skeleton = cls.compile_template(template)
+        if skeleton is None:
+            logger.debug("Template has unquoted placeholders, checking per file")
+            return False, None
+        return True, cls()._check_command_string(skeleton)
+
     def _check_command_string(self, command_str: str) -> Optional[str]:
         """Check a command string for dangerous executables.
 
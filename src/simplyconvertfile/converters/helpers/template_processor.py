@@ -7,14 +7,25 @@ functionality extracted from the base converter.
 """
 
 import contextlib
+import dataclasses
 from pathlib import Path
 from typing import Optional
 
-from simplyconvertfile.config.settings import get_converter_template, settings_manager
+from simplyconvertfile.config.formats import format_config
+from simplyconvertfile.config.settings import (
+    get_converter_template,
+    get_process_limits,
+    settings_manager,
+)
 from simplyconvertfile.converters.helpers.commands import CommandParser
+from simplyconvertfile.converters.helpers.image_hints import inject_decode_hints
+from simplyconvertfile.converters.helpers.processes import ProcessLimits
 from simplyconvertfile.converters.helpers.temp_file import TempFileManager
+from simplyconvertfile.converters.helpers.thread_hints import inject_thread_options
 from simplyconvertfile.utils import text
+from simplyconvertfile.utils.image_size import Size, parse_image_size
 from simplyconvertfile.utils.logging import logger
+from simplyconvertfile.utils.thread_budget import thread_budget
 
 
 class TemplateProcessor:
@@ -28,6 +39,13 @@ class TemplateProcessor:
     Attributes:
         converter_type: The type of converter (e.g., "image", "video").
         target_format: The target format extension in uppercase.
+        template: The template string used for the last command built, or
+                 None if no template was used.
+        process_limits: Priority and resource limits for the last command
+                       built, or None if nothing is limited.
+        size: Target image size requested for the conversion, or None.
+        threads: Share of the thread budget given to the last command built
+                (the ``{threads}`` placeholder).
 
     Examples:
         >>> processor = TemplateProcessor("video", "MP4")
@@ -37,15 +55,30 @@ class TemplateProcessor:
         ... )
     """
 
-    def __init__(self, converter_type: str, target_format: str) -> None:
+    def __init__(
+        self,
+        converter_type: str,
+        target_format: str,
+        special_rule: Optional[dict] = None,
+        size: Optional[Size] = None,
+    ) -> None:
         """Initialize the template processor.
 
         Args:
             converter_type: The converter type identifier (e.g., "image", "video").
             target_format: The target format extension (converted to uppercase).
+            special_rule: Special rule to use for the "special" converter type
+                         instead of the first one matching the input format.
+            size: Target (width, height) of image conversions; takes
+                 precedence over the ``size`` of a special rule.
         """
         self.converter_type = converter_type
         self.target_format = target_format.upper()
+        self.special_rule = special_rule
+        self.size = size
+        self.template: Optional[str] = None
+        self.process_limits: Optional[ProcessLimits] = None
+        self.threads: int = 1
 
     def build_command_from_template(
         self,
@@ -86,9 +119,23 @@ class TemplateProcessor:
             self.converter_type,
             self.target_format,
         )
+        self.template = None
         template, rule = get_converter_template(
-            self.converter_type, self.target_format, input_file=input_file
+            self.converter_type,
+            self.target_format,
+            input_file=input_file,
+            special_rule=self.special_rule,
+        )
+        self.process_limits = ProcessLimits.from_settings(
+            get_process_limits(
+                self.converter_type, rule if self.converter_type == "special" else None
+            )
         )
+        self.threads = thread_budget.get_share()
+        if self.threads < thread_budget.cores:
+            self.process_limits = dataclasses.replace(
+                self.process_limits or ProcessLimits(), threads=self.threads
+            )
         if template:
             logger.debug("Found template: {}", template)
             try:
@@ -143,6 +190,10 @@ class TemplateProcessor:
                 logger.debug("Template is a list, joining with ' && '")
                 template = " && ".join(template)
                 logger.debug("Joined template: {}", template)
+            template = self._add_decode_hints(template, input_file, rule)
+            if self.process_limits and self.process_limits.threads:
+                template = inject_thread_options(template, self.threads)
+            self.template = template
 
             if "{temp_dir}" in template:
                 logger.debug("Template requires temp directory")
@@ -167,6 +218,7 @@ class TemplateProcessor:
                 output_file=output_file,
                 temp_dir=temp_dir_path,
                 temp_file=temp_file_path,
+                threads=self.threads,
             )
             logger.debug("Formatted command string: {}", command_str)
 
@@ -194,6 +246,36 @@ class TemplateProcessor:
                     temp_manager.__exit__(None, None, None)
             raise e
 
+    def _add_decode_hints(
+        self, template: str, input_file: Optional[Path], rule: Optional[dict]
+    ) -> str:
+        """Add ImageMagick decode hints for the target size to a template.
+
+        Args:
+            template: The command template string.
+            input_file: Path to the input file.
+            rule: Optional rule dictionary, whose ``size`` is used when no
+                 size was requested.
+
+        Returns:
+            str: The template with decode hints (see inject_decode_hints).
+
+        Raises:
+            ValueError: If the rule's size is invalid.
+        """
+        size = self.size
+        if size is None and rule and rule.get("size"):
+            size = parse_image_size(rule["size"])
+        jpeg_input = bool(input_file) and format_config.get_canonical_format(
+            input_file.suffix.lstrip(".").upper()
+        ) in ("JPEG", "JPG")
+        hinted = inject_decode_hints(
+            template, size, jpeg_input, settings_manager.get("image_decode", {})
+        )
+        if hinted != template:
+            logger.debug("Added decode hints: {}", hinted)
+        return hinted
+
     def _parse_command_string(self, command_str: str) -> tuple:
         """Parse command string and return command components.
 
@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+"""
+Thread options for FFmpeg and 7-Zip commands sharing the CPU cores.
+
+FFmpeg and 7-Zip read their thread count from the command line only, so
+when a conversion gets less than the whole machine from the thread budget,
+their steps of its command template are rewritten before formatting:
+
+- ``-threads N`` is added before the output of ``ffmpeg`` steps;
+- ``-mmt=N`` is added to ``7z a`` (compression) steps.
+
+Steps already setting their thread count are left alone, and templates are
+not changed when the conversion may use every core. Other tools get their
+share through the environment (see ProcessLimits).
+
+Examples:
+    >>> inject_thread_options("ffmpeg -i '{input}' '{output}'", 2)
+    "ffmpeg -i '{input}' -threads 2 '{output}'"
+"""
+
+import re
+
+FFMPEG_STEP = re.compile(r"^\s*ffmpeg(?=\s)")
+SEVEN_ZIP_ADD_STEP = re.compile(r"^(\s*7z\s+a)(?=\s)")
+OUTPUT_TOKEN = re.compile(r"\S*\{(?:output|temp_file)\}\S*")
+
+
+def _add_step_options(step: str, threads: int) -> str:
+    """Add the thread option to one command step if it runs FFmpeg or 7-Zip.
+
+    Args:
+        step: Command step, without ``&&``.
+        threads: Threads the command may use.
+
+    Returns:
+        str: The step with its thread option.
+    """
+    if FFMPEG_STEP.match(step) and "-threads" not in step:
+        outputs = list(OUTPUT_TOKEN.finditer(step))
+        if outputs:
+            split = outputs[-1].start()
+            return f"{step[:split]}-threads {threads} {step[split:]}"
+        return step
+
+    seven_zip = SEVEN_ZIP_ADD_STEP.match(step)
+    if seven_zip and "-mmt" not in step:
+        return f"{seven_zip.group(1)} -mmt={threads}{step[seven_zip.end():]}"
+    return step
+
+
+def inject_thread_options(template: str, threads: int) -> str:
+    """Add thread options to the FFmpeg and 7-Zip steps of a command template.
+
+    Args:
+        template: Command template, steps separated by ``&&``.
+        threads: Threads the command may use.
+
+    Returns:
+        str: The template with thread options.
+    """
+    return "&&".join(
+        _add_step_options(step, threads) for step in template.split("&&")
+    )
@@ -0,0 +1,245 @@
+#!/usr/bin/python3
+"""
+Preview and thumbnail generation sharing a single decode.
+
+This module provides the PreviewConverter class, which produces downscaled
+previews of an image or video at several sizes (the ``previews.sizes``
+setting) with one tool invocation:
+
+- Images: ImageMagick reads the input once, with a ``jpeg:size`` hint so
+  JPEG files are shrunk while decoding, then writes each size from the
+  previous one, largest first (``-thumbnail ... -write ...``).
+- Videos: ffmpeg decodes one frame and splits it into one scaled output per
+  size.
+
+Outputs are written to a folder created by MultiFileHandler, named after
+the source file (e.g. ``photo_previews_JPEG/photo_256.jpeg``).
+"""
+
+import contextlib
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from simplyconvertfile.config import format_config, settings_manager
+from simplyconvertfile.converters.base import Converter
+from simplyconvertfile.converters.helpers import MultiFileHandler
+from simplyconvertfile.converters.helpers.image_hints import (
+    get_jpeg_size_hint,
+    get_limit_options,
+)
+from simplyconvertfile.utils import text
+from simplyconvertfile.utils.image_size import Size, parse_image_size
+from simplyconvertfile.utils.logging import logger
+from simplyconvertfile.utils.validation import FileValidator
+
+class PreviewConverter(Converter):
+    """Converter producing previews of one file at several sizes.
+
+    Previews fit within their size, keep the aspect ratio and are never
+    larger than the source.
+
+    Attributes:
+        sizes: Bounding boxes of the previews, largest first.
+        output_folder: Folder receiving the previews (created on convert).
+        target_files: Preview files, in the order of ``sizes``.
+
+    Examples:
+        >>> converter = PreviewConverter(Path("photo.jpg"), [1024, 256])
+        >>> converter.convert()
+        True
+        >>> converter.target_files
+        [PosixPath('photo_previews_JPEG/photo_1024.jpeg'), ...]
+    """
+
+    def __init__(
+        self,
+        file: Path,
+        sizes: Optional[Sequence] = None,
+        format: Optional[str] = None,
+        batch_mode: bool = False,
+        output_dir: Optional[Path] = None,
+        **kwargs,
+    ) -> None:
+        """Initialize the converter; outputs are laid out on convert.
+
+        Args:
+            file: Path to the image or video.
+            sizes: Preview sizes (see parse_image_size); defaults to the
+                  ``previews.sizes`` setting.
+            format: Preview format (JPEG, PNG or WEBP); defaults to the
+                   ``previews.format`` setting.
+            batch_mode: Whether this conversion is part of a batch operation.
+            output_dir: Directory receiving the previews folder (default: the
+                       source file's directory).
+            **kwargs: Options passed to Converter.
+
+        Raises:
+            ValueError: If a size is invalid or no size is given.
+        """
+        self.preview_settings = settings_manager.get("previews", {})
+        sizes = sizes or self.preview_settings.get("sizes", [1024, 512, 256])
+        self.sizes: List[Size] = sorted(
+            {parse_image_size(size) for size in sizes},
+            key=lambda size: size[0] * size[1],
+            reverse=True,
+        )
+        if not self.sizes:
+            raise ValueError("At least one preview size is required")
+
+        self.output_folder: Optional[Path] = None
+        self.target_files: List[Path] = []
+        format = format or self.preview_settings.get("format", "JPEG")
+        super().__init__(file, format, batch_mode, output_dir, **kwargs)
+
+    def build_command(self) -> None:
+        """Skip building a command: it depends on the output folder."""
+
+    def convert(self) -> bool:
+        """Create the output folder and generate every preview.
+
+        Returns:
+            bool: True if all previews were generated, False otherwise.
+        """
+        source_format = FileValidator.get_file_format(self.file)
+        group = format_config.get_format_group(source_format or "")
+        if group not in ("IMAGE", "VIDEO"):
+            self.error_manager.set_error(
+                text.Errors.PREVIEW_UNSUPPORTED_SOURCE_MESSAGE.format(
+                    format=source_format or "unknown"
+                )
+            )
+            return False
+
+        handler = MultiFileHandler(self.file, source_format, self.format)
+        folder_suffix = self.preview_settings.get("folder_suffix", "_previews")
+        self.output_folder = handler.create_output_folder(
+            {"folder_suffix": folder_suffix}, self.output_dir
+        )
+        pattern = {
+            "output_filename_pattern": self.preview_settings.get(
+                "output_filename_pattern", "{input_stem}_{size}.{ext}"
+            )
+        }
+        self.target_files = [
+            self.output_folder
+            / handler.get_multi_file_output_pattern(
+                pattern, self.format.lower(), size=self._format_size(size)
+            )
+            for size in self.sizes
+        ]
+        self.target_file = self.output_folder
+
+        if group == "IMAGE":
+            self.command = self._build_imagemagick_command()
+        else:
+            self.command = self._build_ffmpeg_command()
+        logger.debug("Preview command: {}", self.command)
+
+        if not super().convert():
+            return False
+        missing = [target for target in self.target_files if not target.exists()]
+        if missing:
+            self.error_manager.set_error(
+                text.Errors.PREVIEW_MISSING_OUTPUT_MESSAGE.format(file=missing[0].name),
+                " ".join(self.command),
+            )
+            self._delete_target_file()
+            return False
+        return True
+
+    @staticmethod
+    def _format_size(size: Size) -> str:
+        """Name of a size in file names: "256" for a square box, else "320x180"."""
+        width, height = size
+        return str(width) if width == height else f"{width}x{height}"
+
+    def _get_quality(self) -> Optional[int]:
+        """Get the quality (1-100) of lossy preview formats, None for PNG."""
+        quality = self.preview_settings.get("quality")
+        if quality is None or self.format == "PNG":
+            return None
+        return min(max(int(quality), 1), 100)
+
+    def _build_imagemagick_command(self) -> List[str]:
+        """Build the ImageMagick command writing every size from one decode.
+
+        Each preview is scaled down from the previous one when it fits within
+        it, which is cheaper than scaling the full image again; otherwise it
+        restarts from the decoded image, kept in memory (``mpr:``).
+
+        Returns:
+            List[str]: ``convert`` command; the first frame or page is used
+                      for animations and documents.
+        """
+        limits = get_limit_options(settings_manager.get("image_decode", {}))
+        command = [
+            "convert",
+            *limits.split(),
+            "-define",
+            f"jpeg:size={get_jpeg_size_hint(max(self.sizes, key=max))}",
+            f"{self.file}[0]",
+            "-auto-orient",
+            "-strip",
+        ]
+        quality = self._get_quality()
+        if quality is not None:
+            command += ["-quality", str(quality)]
+
+        steps: List[str] = []
+        restarts = False
+        previous: Optional[Size] = None
+        for (width, height), target in zip(self.sizes, self.target_files):
+            if previous and (width > previous[0] or height > previous[1]):
+                steps += ["+delete", "mpr:source"]
+                restarts = True
+            steps += ["-thumbnail", f"{width}x{height}>", "-write", str(target)]
+            previous = (width, height)
+
+        if restarts:
+            command += ["-write", "mpr:source"]
+        return command + steps + ["null:"]
+
+    def _build_ffmpeg_command(self) -> List[str]:
+        """Build the ffmpeg command scaling one decoded frame to every size.
+
+        Returns:
+            List[str]: ``ffmpeg`` command with one output per size.
+        """
+        position = str(self.preview_settings.get("video_position", 1))
+        count = len(self.sizes)
+        filters = [f"[0:v]split={count}" + "".join(f"[s{i}]" for i in range(count))]
+        for index, (width, height) in enumerate(self.sizes):
+            filters.append(
+                f"[s{index}]scale='min({width}\\,iw)':'min({height}\\,ih)'"
+                f":force_original_aspect_ratio=decrease[p{index}]"
+            )
+
+        command = [
+            "ffmpeg",
+            "-y",
+            "-ss",
+            position,
+            "-i",
+            str(self.file),
+            "-filter_complex",
+            ";".join(filters),
+        ]
+        quality = self._get_quality()
+        for index, target in enumerate(self.target_files):
+            command += ["-map", f"[p{index}]", "-frames:v", "1", "-update", "1"]
+            if quality is not None and self.format == "JPEG":
+                # ffmpeg's JPEG scale goes from 2 (best) to 31 (worst)
+                command += ["-q:v", str(round(31 - quality * 0.29))]
+            elif quality is not None:
+                command += ["-quality", str(quality)]
+            command.append(str(target))
+        return command
+
+    def _delete_target_file(self) -> None:
+        """Delete the generated previews and their folder, if empty."""
+        for target in self.target_files:
+            with contextlib.suppress(OSError):
+                target.unlink()
+        if self.output_folder:
+            with contextlib.suppress(OSError):
+                self.output_folder.rmdir()
@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+"""
+Multi-hop converter following a conversion route.
+
+This module provides the RoutedConverter class, which converts a file to a
+format without any direct conversion by chaining direct conversions through
+intermediate formats (e.g. MOBI -> EPUB -> DOCX), as planned by the format
+configuration's RoutePlanner.
+
+Intermediate files are written to ``routing.intermediate_directory``
+(``/dev/shm`` by default, a tmpfs) so they never touch the disk, and are
+removed once the conversion finished, whatever its outcome.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+from simplyconvertfile.config import ConversionRoute, settings_manager
+from simplyconvertfile.converters.base import Converter
+from simplyconvertfile.converters.helpers import TempFileManager
+from simplyconvertfile.utils.logging import logger
+
+
+class RoutedConverter(Converter):
+    """Converter reaching its target format through intermediate formats.
+
+    Each hop is an ordinary Converter, created only when its input (the
+    previous hop's output) exists. The last hop writes the real target file.
+
+    Attributes:
+        route: Route followed, from the source format to the target format.
+        current_hop: Converter of the running hop, if any.
+
+    Examples:
+        >>> route = format_config.get_route("MOBI", "DOCX")
+        >>> converter = RoutedConverter(Path("book.mobi"), route)
+        >>> converter.convert()
+        True
+    """
+
+    def __init__(
+        self,
+        file: Path,
+        route: ConversionRoute,
+        batch_mode: bool = False,
+        output_dir: Optional[Path] = None,
+        **kwargs,
+    ) -> None:
+        """Initialize the converter for a route.
+
+        Args:
+            file: Path to the input file to be converted.
+            route: Route from the file's format to the target format.
+            batch_mode: Whether this conversion is part of a batch operation.
+            output_dir: Optional output directory for the converted file.
+            **kwargs: Options passed to every hop converter (see Converter).
+        """
+        self.route = route
+        self.current_hop: Optional[Converter] = None
+        self._hop_kwargs = kwargs
+        super().__init__(file, route.formats[-1], batch_mode, output_dir, **kwargs)
+
+    def build_command(self) -> None:
+        """Skip building a command: each hop builds its own when it runs."""
+
+    def convert(self) -> bool:
+        """Convert the source file hop by hop along the route.
+
+        Returns:
+            bool: True if every hop succeeded, False otherwise.
+        """
+        logger.info(
+            "Routing conversion: {} via {}",
+            self.file,
+            " -> ".join(self.route.formats),
+        )
+        cancel_check = self.progress_tracker.create_cancel_check()
+        hop_formats = self.route.formats[1:]
+
+        with TempFileManager(
+            is_dir=True, prefix="route_", directory=self._get_intermediate_directory()
+        ) as work_dir:
+            source = self.file
+            for index, hop_format in enumerate(hop_formats):
+                if cancel_check():
+                    return False
+                is_last = index == len(hop_formats) - 1
+                self.current_hop = Converter(
+                    source,
+                    hop_format,
+                    self.batch_mode,
+                    self.target_file.parent if is_last else work_dir,
+                    **self._hop_kwargs,
+                )
+                if is_last:
+                    self.target_file = self.current_hop.target_file
+                if not self.current_hop.convert():
+                    return False
+                source = self.current_hop.target_file
+
+        return True
+
+    def cancel(self) -> None:
+        """Cancel the running hop and the remaining ones."""
+        super().cancel()
+        if self.current_hop:
+            self.current_hop.cancel()
+
+    def get_last_error(self) -> Optional[str]:
+        """Get the last error of the failed hop, if any."""
+        if self.current_hop:
+            return self.current_hop.get_last_error()
+        return super().get_last_error()
+
+    def get_last_command(self) -> Optional[str]:
+        """Get the last command of the failed hop, if any."""
+        if self.current_hop:
+            return self.current_hop.get_last_command()
+        return super().get_last_command()
+
+    @staticmethod
+    def _get_intermediate_directory() -> Path:
+        """Get the directory for intermediate files.
+
+        Returns:
+            Path: ``routing.intermediate_directory`` if it exists and is
+                 writable, otherwise the temporary files directory.
+        """
+        directory = settings_manager.get("routing", {}).get(
+            "intermediate_directory", "/dev/shm"
+        )
+        if directory:
+            path = Path(directory).expanduser()
+            if path.is_dir() and os.access(path, os.W_OK):
+                return path
+        return TempFileManager.TEMP_DIR
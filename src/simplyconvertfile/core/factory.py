@@ -10,11 +10,16 @@ command building for all conversion types.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 from simplyconvertfile.config import format_config
-from simplyconvertfile.converters import Converter
-from simplyconvertfile.utils.logging import logger
+from simplyconvertfile.converters import (
+    Converter,
+    FanOutConverter,
+    PreviewConverter,
+    RoutedConverter,
+)
+from simplyconvertfile.utils.logging import Deferred, logger
 from simplyconvertfile.utils.validation import FileValidator
 
 
@@ -62,18 +67,27 @@ class ConverterFactory:
             **kwargs: Additional arguments passed to the converter constructor.
 
         Returns:
-            Optional[Converter]: Converter instance for the conversion,
-                               or None if the conversion is not supported.
+            Optional[Converter]: Converter instance for the conversion (a
+                               RoutedConverter for targets only reachable
+                               through intermediate formats), or None if the
+                               conversion is not supported or the file content
+                               contradicts its extension (``content_sniffing``
+                               set to ``"fail"``).
 
         Note:
             All conversions use the same Converter class with template-based
-            command building from settings.
+            command building from settings; routed conversions chain several.
 
         Examples:
             >>> converter = ConverterFactory.create_converter(Path("video.mp4"), "AVI")
             >>> converter is not None
             True
         """
+        content_error = FileValidator.check_file_content(file)
+        if content_error:
+            logger.warning("Skipping mislabeled file {}", file)
+            return None
+
         source_format = FileValidator.get_file_format(file)
         target_format = target_format.upper()
 
@@ -85,6 +99,25 @@ class ConverterFactory:
             output_dir,
         )
 
+        if source_format and not format_config.is_direct_conversion(
+            source_format, target_format
+        ):
+            route = format_config.get_route(source_format, target_format)
+            if route:
+                logger.debug(
+                    "Using RoutedConverter for {} -> {} via {}",
+                    source_format,
+                    target_format,
+                    Deferred(lambda: " -> ".join(route.formats)),
+                )
+                return RoutedConverter(
+                    file,
+                    route,
+                    batch_mode=batch_mode,
+                    output_dir=output_dir,
+                    **kwargs,
+                )
+
         if not format_config.get_conversion_rule(
             source_format, target_format
         ) and not format_config.get_default_converter_type(
@@ -103,3 +136,134 @@ class ConverterFactory:
             output_dir=output_dir,
             **kwargs,
         )
+
+    @staticmethod
+    def create_fan_out_converter(
+        file: Path,
+        target_formats: Sequence[str],
+        batch_mode: bool = False,
+        output_dir: Optional[Path] = None,
+        **kwargs,
+    ) -> Optional[FanOutConverter]:
+        """Create a converter producing several target formats from one file.
+
+        When all targets are converted by ffmpeg, the returned converter runs
+        a single ffmpeg invocation with one output per target, so the source
+        is decoded once.
+
+        Args:
+            file: Path to the source file to be converted.
+            target_formats: Target format strings (case-insensitive).
+            batch_mode: Whether the converter will be used in batch mode.
+            output_dir: Optional output directory for converted files.
+            **kwargs: Additional arguments passed to the converter constructor.
+
+        Returns:
+            Optional[FanOutConverter]: Converter for all targets, or None if
+                                     any of the conversions is not supported
+                                     or needs intermediate formats.
+
+        Examples:
+            >>> converter = ConverterFactory.create_fan_out_converter(
+            ...     Path("master.flac"), ["MP3", "OPUS", "AAC"]
+            ... )
+            >>> converter.merged
+            True
+        """
+        target_formats = [fmt.upper() for fmt in target_formats]
+        if not target_formats:
+            return None
+
+        content_error = FileValidator.check_file_content(file)
+        if content_error:
+            logger.warning("Skipping mislabeled file {}", file)
+            return None
+
+        source_format = FileValidator.get_file_format(file)
+
+        for target_format in target_formats:
+            if format_config.get_route(source_format, target_format):
+                logger.debug(
+                    "{} -> {} needs intermediate formats, not supported with "
+                    "several targets",
+                    source_format,
+                    target_format,
+                )
+                return None
+            if not format_config.get_conversion_rule(
+                source_format, target_format
+            ) and not format_config.get_default_converter_type(
+                source_format, target_format
+            ):
+                logger.debug(
+                    "No conversion available for {} -> {}",
+                    source_format,
+                    target_format,
+                )
+                return None
+
+        logger.debug(
+            "Using FanOutConverter for {} -> {}",
+            source_format,
+            ", ".join(target_formats),
+        )
+        return FanOutConverter(
+            file,
+            target_formats,
+            batch_mode=batch_mode,
+            output_dir=output_dir,
+            **kwargs,
+        )
+
+    @staticmethod
+    def create_preview_converter(
+        file: Path,
+        sizes: Optional[Sequence] = None,
+        preview_format: Optional[str] = None,
+        batch_mode: bool = False,
+        output_dir: Optional[Path] = None,
+        **kwargs,
+    ) -> Optional[PreviewConverter]:
+        """Create a converter generating previews of a file at several sizes.
+
+        Args:
+            file: Path to the image or video.
+            sizes: Preview sizes (e.g. [1024, "320x180"]); defaults to the
+                  ``previews.sizes`` setting.
+            preview_format: Preview format; defaults to ``previews.format``.
+            batch_mode: Whether the converter will be used in batch mode.
+            output_dir: Directory receiving the previews folder.
+            **kwargs: Additional arguments passed to the converter constructor.
+
+        Returns:
+            Optional[PreviewConverter]: Converter for all sizes, or None if the
+                                       file is neither an image nor a video.
+
+        Examples:
+            >>> converter = ConverterFactory.create_preview_converter(
+            ...     Path("clip.mp4"), [640, 320]
+            ... )
+            >>> converter.convert()
+            True
+        """
+        content_error = FileValidator.check_file_content(file)
+        if content_error:
+            logger.warning("Skipping mislabeled file {}", file)
+            return None
+
+        source_format = FileValidator.get_file_format(file)
+        if format_config.get_format_group(source_format or "") not in (
+            "IMAGE",
+            "VIDEO",
+        ):
+            logger.debug("No previews for {} files", source_format)
+            return None
+
+        return PreviewConverter(
+            file,
+            sizes,
+            preview_format,
+            batch_mode=batch_mode,
+            output_dir=output_dir,
+            **kwargs,
+        )
@@ -22,10 +22,23 @@ Features:
 - Cross-platform compatibility (Linux-focused)
 
 Usage:
-    simplyconvertfile [file_path ...]
+    simplyconvertfile [--profile PATH] [file_path ...]
+    simplyconvertfile watch DIRECTORY --to FORMAT [--output DIR] [--workers N]
+    simplyconvertfile convert FILE [FILE ...] --to FORMAT [--output DIR] [--size WxH]
+    simplyconvertfile serve [--socket PATH] [--idle-timeout SECONDS]
+    simplyconvertfile previews FILE [FILE ...] [--sizes SIZES] [--format FORMAT]
 
     When called without arguments, opens a GTK file chooser dialog.
     When called with file paths, proceeds directly to conversion.
+    With --profile (or the SCF_PROFILE environment variable), writes a
+    cProfile dump plus startup timings to PATH.
+    The watch command converts every file dropped into DIRECTORY.
+    The convert command converts files without dialogs through the resident
+    conversion service (started on first use), and serve runs that service.
+    The previews command writes downscaled copies of images and videos at
+    several sizes, decoding each file once.
+    --profile may come before or after the command. An existing file named
+    like a command is converted; ``--`` before file names always does so.
 
 Examples:
     # Launch file picker
@@ -40,22 +53,41 @@ Examples:
     # Convert video file
     simplyconvertfile video.mp4
 
+    # Convert everything dropped into ~/Inbox to PDF
+    simplyconvertfile watch ~/Inbox --to PDF
+
+    # Convert without dialogs through the warm conversion service
+    simplyconvertfile convert *.heic --to JPEG
+
+    # Convert a master to several formats, decoding it only once
+    simplyconvertfile convert master.mov --to MP4,WEBM,GIF
+
+    # Shrink camera photos to fit within 1920x1080 WEBP images
+    simplyconvertfile convert *.jpg --to WEBP --size 1920x1080
+
+    # Write 1024, 512 and 256 pixel previews of every photo
+    simplyconvertfile previews *.jpg --sizes 1024,512,256
+
+    # Profile a conversion (open the result with snakeviz)
+    simplyconvertfile --profile /tmp/scf.prof video.mp4
+
 Note:
     For batch conversions, all files must belong to the same format group
     (e.g., all images, all videos, etc.).
 """
 
 import argparse
+import os
+import signal
 import sys
 import traceback
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from simplyconvertfile import __version__
-from simplyconvertfile.actions import Action, BatchAction
-from simplyconvertfile.config.settings import SettingsManager
 from simplyconvertfile.utils import text
 from simplyconvertfile.utils.logging import logger
+from simplyconvertfile.utils.profiling import profiler
 
 
 def _get_supported_extensions() -> List[str]:
@@ -179,6 +211,7 @@ def _open_file_chooser() -> Optional[List[str]]:
         text.UI.OK_BUTTON_LABEL,
         Gtk.ResponseType.OK,
     )
+    profiler.mark("first_dialog")
     dialog.set_select_multiple(True)
     dialog.set_default_response(Gtk.ResponseType.OK)
 
@@ -217,15 +250,67 @@ def _get_supported_formats_label() -> str:
     return "Supported Formats"
 
 
+def _get_profile_path(argv: List[str]) -> Optional[str]:
+    """Get the profile output path from the command line or environment.
+
+    The path is looked up before the full argument parsing so profiling can
+    start ahead of the heavy imports (settings, format configuration, GTK).
+
+    Args:
+        argv: Command-line arguments (without the program name).
+
+    Returns:
+        Optional[str]: Profile output path, or None if profiling is disabled.
+    """
+    pre_parser = argparse.ArgumentParser(add_help=False)
+    pre_parser.add_argument("--profile")
+    known_args, _ = pre_parser.parse_known_args(argv)
+    return known_args.profile or os.environ.get(profiler.ENV_VAR) or None
+
+
+def _split_command(argv: List[str]) -> Tuple[Optional[str], List[str]]:
+    """Find the subcommand among the command-line arguments.
+
+    The subcommand is the first argument that is not ``--profile PATH``,
+    provided it is not an existing path: a file named ``watch`` in the
+    current directory is converted. Arguments after ``--`` are always files.
+
+    Args:
+        argv: Command-line arguments (without the program name).
+
+    Returns:
+        Tuple[Optional[str], List[str]]: The subcommand, or None to convert
+            files, and the remaining arguments (``--profile`` included).
+    """
+    index = 0
+    while index < len(argv):
+        argument = argv[index]
+        if argument == "--profile":
+            index += 2
+            continue
+        if argument.startswith("--profile="):
+            index += 1
+            continue
+        if argument in SUBCOMMANDS and not os.path.exists(argument):
+            return argument, argv[:index] + argv[index + 1 :]
+        break
+    return None, argv
+
+
 def main() -> None:
     """Main entry point for the SimplyConvertFile application.
 
-    Parses command-line arguments and executes the appropriate conversion workflow
-    based on the number of files provided. When no files are given, opens a
-    GTK file chooser dialog to select files interactively.
+    Starts the optional profiler and runs the application.
 
     Command-line Usage:
-        simplyconvertfile [file_path ...]
+        simplyconvertfile [--profile PATH] [--] [file_path ...]
+        simplyconvertfile [--profile PATH] watch DIRECTORY --to FORMAT [...]
+        simplyconvertfile [--profile PATH] convert FILE ... --to FORMATS [...]
+        simplyconvertfile [--profile PATH] previews FILE ... [--sizes SIZES]
+        simplyconvertfile [--profile PATH] serve [--socket PATH]
+
+    A file named like a subcommand is converted if it exists; file names
+    after ``--`` are never taken as subcommands.
 
     Args:
         None (reads from sys.argv)
@@ -236,9 +321,34 @@ def main() -> None:
     Raises:
         SystemExit: With code 1 if invalid usage or conversion fails
     """
+    profile_path = _get_profile_path(sys.argv[1:])
+    if profile_path:
+        profiler.start(profile_path)
+
+    try:
+        _run()
+    finally:
+        profiler.stop()
+
+
+def _run() -> None:
+    """Parse command-line arguments and execute the conversion workflow.
+
+    Executes the appropriate conversion workflow based on the number of
+    files provided. When no files are given, opens a GTK file chooser dialog
+    to select files interactively.
+    """
     logger.info("SimplyConvertFile application started")
     logger.debug("Command line arguments: {}", sys.argv)
 
+    command, argv = _split_command(sys.argv[1:])
+    if command:
+        SUBCOMMANDS[command](argv)
+        return
+
+    from simplyconvertfile.actions import Action, BatchAction
+    from simplyconvertfile.config.settings import SettingsManager
+
     parser = argparse.ArgumentParser(
         prog="simplyconvertfile",
         description=text.CLI.APPLICATION_DESCRIPTION,
@@ -249,12 +359,17 @@ def main() -> None:
         f"SimplyConvertFile {__version__} (settings version {settings.get('version')})"
     )
     parser.add_argument("--version", "-v", action="version", version=version_string)
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help=text.CLI.PROFILE_ARGUMENT_HELP,
+    )
     parser.add_argument(
         "files",
         nargs="*",
         help=text.CLI.FILES_ARGUMENT_HELP,
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     file_paths: List[str] = args.files
 
@@ -288,5 +403,278 @@ def main() -> None:
         raise
 
 
+def _run_watch(argv: List[str]) -> None:
+    """Run the watch-folder service until interrupted.
+
+    Args:
+        argv: Arguments following the ``watch`` command.
+
+    Raises:
+        SystemExit: With code 2 if the directory does not exist.
+    """
+    from simplyconvertfile.services import WatchService
+
+    parser = argparse.ArgumentParser(
+        prog="simplyconvertfile watch",
+        description=text.CLI.WATCH_DESCRIPTION,
+    )
+    parser.add_argument("directory", type=Path, help=text.CLI.WATCH_DIRECTORY_HELP)
+    parser.add_argument(
+        "--to",
+        dest="target_format",
+        metavar="FORMAT",
+        required=True,
+        help=text.CLI.TARGET_FORMAT_ARGUMENT_HELP,
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="DIR",
+        help=text.CLI.OUTPUT_DIRECTORY_ARGUMENT_HELP,
+    )
+    parser.add_argument(
+        "--workers", type=int, metavar="N", help=text.CLI.WORKERS_ARGUMENT_HELP
+    )
+    parser.add_argument(
+        "--profile", metavar="PATH", help=text.CLI.PROFILE_ARGUMENT_HELP
+    )
+    args = parser.parse_args(argv)
+
+    directory = args.directory.expanduser()
+    if not directory.is_dir():
+        parser.error(text.CLI.NOT_A_DIRECTORY_MESSAGE.format(path=directory))
+
+    def on_result(file: Path, success: bool, detail: str) -> None:
+        if success:
+            print(text.CLI.WATCH_CONVERTED_MESSAGE.format(file=file, output=detail))
+        else:
+            print(text.CLI.WATCH_FAILED_MESSAGE.format(file=file, error=detail))
+
+    service = WatchService(
+        directory,
+        args.target_format,
+        output_dir=args.output.expanduser() if args.output else None,
+        workers=args.workers,
+        on_result=on_result,
+    )
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: service.stop())
+
+    print(
+        text.CLI.WATCH_STARTED_MESSAGE.format(
+            source=service.source_dir,
+            extension=service.target_format,
+            output=service.output_dir,
+        )
+    )
+    service.run()
+    print(
+        text.CLI.WATCH_STOPPED_MESSAGE.format(
+            converted=service.converted, failed=service.failed
+        )
+    )
+
+
+def _run_convert(argv: List[str]) -> None:
+    """Convert files through the resident conversion service.
+
+    Only the lightweight service client is imported here; settings, format
+    configuration and converters are already loaded in the service.
+
+    Args:
+        argv: Arguments following the ``convert`` command.
+
+    Raises:
+        SystemExit: With code 1 if any file failed or the service is
+                   unavailable.
+    """
+    from simplyconvertfile.services.client import (
+        ServiceClient,
+        ServiceUnavailableError,
+    )
+    from simplyconvertfile.utils.image_size import parse_image_size
+
+    parser = argparse.ArgumentParser(
+        prog="simplyconvertfile convert",
+        description=text.CLI.CONVERT_DESCRIPTION,
+    )
+    parser.add_argument(
+        "files", nargs="+", type=Path, help=text.CLI.CONVERT_FILES_ARGUMENT_HELP
+    )
+    parser.add_argument(
+        "--to",
+        dest="target_format",
+        metavar="FORMAT",
+        required=True,
+        help=text.CLI.TARGET_FORMATS_ARGUMENT_HELP,
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="DIR",
+        help=text.CLI.CONVERT_OUTPUT_ARGUMENT_HELP,
+    )
+    parser.add_argument(
+        "--size", metavar="WxH", help=text.CLI.CONVERT_SIZE_ARGUMENT_HELP
+    )
+    parser.add_argument(
+        "--profile", metavar="PATH", help=text.CLI.PROFILE_ARGUMENT_HELP
+    )
+    args = parser.parse_args(argv)
+    if args.size:
+        # Checked here for a clear message rather than the service's rejection
+        try:
+            parse_image_size(args.size)
+        except ValueError as e:
+            parser.error(str(e))
+
+    failed = 0
+    try:
+        for event in ServiceClient().convert(
+            [file.expanduser() for file in args.files],
+            args.target_format,
+            output_dir=args.output.expanduser() if args.output else None,
+            size=args.size,
+        ):
+            if event["event"] == "converted":
+                print(
+                    text.CLI.WATCH_CONVERTED_MESSAGE.format(
+                        file=event["file"], output=event["output"]
+                    )
+                )
+            elif event["event"] == "failed":
+                failed += 1
+                print(
+                    text.CLI.WATCH_FAILED_MESSAGE.format(
+                        file=event["file"], error=event["error"]
+                    )
+                )
+            elif event["event"] == "error":
+                failed += 1
+                print(event["message"], file=sys.stderr)
+    except ServiceUnavailableError as e:
+        logger.error("Conversion service unavailable: {}", e)
+        print(text.CLI.SERVICE_UNAVAILABLE_MESSAGE.format(error=e), file=sys.stderr)
+        sys.exit(1)
+
+    if failed:
+        sys.exit(1)
+
+
+def _run_previews(argv: List[str]) -> None:
+    """Generate previews of images and videos at several sizes.
+
+    Args:
+        argv: Arguments following the ``previews`` command.
+
+    Raises:
+        SystemExit: With code 1 if previews of any file failed.
+    """
+    from simplyconvertfile.core.factory import ConverterFactory
+
+    parser = argparse.ArgumentParser(
+        prog="simplyconvertfile previews",
+        description=text.CLI.PREVIEWS_DESCRIPTION,
+    )
+    parser.add_argument(
+        "files", nargs="+", type=Path, help=text.CLI.PREVIEWS_FILES_ARGUMENT_HELP
+    )
+    parser.add_argument(
+        "--sizes", metavar="SIZES", help=text.CLI.PREVIEW_SIZES_ARGUMENT_HELP
+    )
+    parser.add_argument(
+        "--format",
+        dest="preview_format",
+        metavar="FORMAT",
+        help=text.CLI.PREVIEW_FORMAT_ARGUMENT_HELP,
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="DIR",
+        help=text.CLI.CONVERT_OUTPUT_ARGUMENT_HELP,
+    )
+    parser.add_argument(
+        "--profile", metavar="PATH", help=text.CLI.PROFILE_ARGUMENT_HELP
+    )
+    args = parser.parse_args(argv)
+    sizes = args.sizes.split(",") if args.sizes else None
+
+    failed = 0
+    for file in args.files:
+        file = file.expanduser()
+        try:
+            converter = ConverterFactory.create_preview_converter(
+                file,
+                sizes,
+                args.preview_format,
+                batch_mode=True,
+                output_dir=args.output.expanduser() if args.output else None,
+                headless=True,
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        if converter and converter.convert():
+            print(
+                text.CLI.WATCH_CONVERTED_MESSAGE.format(
+                    file=file, output=converter.output_folder
+                )
+            )
+        else:
+            failed += 1
+            error = converter.get_last_error() if converter else None
+            print(
+                text.CLI.WATCH_FAILED_MESSAGE.format(
+                    file=file, error=error or text.CLI.PREVIEW_UNSUPPORTED_MESSAGE
+                )
+            )
+
+    if failed:
+        sys.exit(1)
+
+
+def _run_serve(argv: List[str]) -> None:
+    """Run the resident conversion service until idle or interrupted.
+
+    Args:
+        argv: Arguments following the ``serve`` command.
+    """
+    from simplyconvertfile.services import ConversionServer
+
+    parser = argparse.ArgumentParser(
+        prog="simplyconvertfile serve",
+        description=text.CLI.SERVE_DESCRIPTION,
+    )
+    parser.add_argument(
+        "--socket", type=Path, metavar="PATH", help=text.CLI.SOCKET_ARGUMENT_HELP
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        metavar="SECONDS",
+        help=text.CLI.IDLE_TIMEOUT_ARGUMENT_HELP,
+    )
+    parser.add_argument(
+        "--profile", metavar="PATH", help=text.CLI.PROFILE_ARGUMENT_HELP
+    )
+    args = parser.parse_args(argv)
+
+    server = ConversionServer(
+        socket_path=args.socket.expanduser() if args.socket else None,
+        idle_timeout=args.idle_timeout,
+    )
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: server.stop())
+    server.run()
+
+
+SUBCOMMANDS: Dict[str, Callable[[List[str]], None]] = {
+    "convert": _run_convert,
+    "previews": _run_previews,
+    "serve": _run_serve,
+    "watch": _run_watch,
+}
+
+
 if __name__ == "__main__":
     main()
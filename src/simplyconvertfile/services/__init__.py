@@ -0,0 +1,26 @@
+"""
+Long-running conversion services.
+
+Exports are resolved lazily so the thin service client can be imported
+without loading the format configuration and converters.
+"""
+
+from importlib import import_module
+
+_EXPORTS = {
+    "ConversionServer": ".server",
+    "ServiceClient": ".client",
+    "WatchService": ".watch",
+}
+
+__all__ = [
+    "ConversionServer",
+    "ServiceClient",
+    "WatchService",
+]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name], __name__), name)
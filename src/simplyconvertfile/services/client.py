@@ -0,0 +1,220 @@
+#!/usr/bin/python3
+"""
+Thin client for the resident conversion service.
+
+This module is deliberately lightweight (standard library only): it is what
+``simplyconvertfile convert FILE... --to FORMAT`` runs, so it must not load
+the settings, format configuration or converters. The heavy lifting happens
+in the already warm :mod:`simplyconvertfile.services.server` process, which
+is started on first use when it is not socket-activated by systemd.
+
+Protocol:
+    Newline-delimited JSON over a Unix stream socket. The client sends one
+    request and the server streams events back until ``finished``::
+
+        -> {"files": ["/abs/a.jpg"], "target": "PNG", "output_dir": null}
+        <- {"event": "started", "total": 1}
+        <- {"event": "converted", "file": "/abs/a.jpg", "output": "/abs/a.png"}
+        <- {"event": "finished", "converted": 1, "failed": 0}
+
+    Other events are ``failed`` (with ``error``), ``error`` (invalid request,
+    with ``message``) and ``stale`` (the server's settings changed on disk;
+    it exits and the client retries with a fresh server).
+    A comma-separated ``target`` (e.g. ``"MP4,WEBM"``) converts each file to
+    every listed format, with one ``converted`` event per output file.
+    An optional ``size`` (e.g. ``"800x600"``) downscales images to fit
+    within that size.
+    Closing the connection cancels the running conversion.
+"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+SOCKET_NAME = "simplyconvertfile.sock"
+
+
+def get_socket_path() -> Path:
+    """Get the per-user service socket path.
+
+    Uses ``$XDG_RUNTIME_DIR`` (matching ``%t`` in the systemd user units),
+    falling back to a private directory under /tmp.
+
+    Returns:
+        Path: Path of the service socket.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return Path(runtime_dir) / SOCKET_NAME
+    return Path(f"/tmp/simplyconvertfile-{os.getuid()}") / SOCKET_NAME
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Encode a protocol message as a JSON line."""
+    return json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+class ServiceUnavailableError(ConnectionError):
+    """Raised when the conversion service cannot be reached or started."""
+
+
+class ServiceClient:
+    """Client sending conversion requests to the resident service.
+
+    Attributes:
+        socket_path: Path of the service socket.
+        autostart: Whether to spawn the service when it is not running.
+        start_timeout: Seconds to wait for a spawned service to listen.
+
+    Examples:
+        >>> client = ServiceClient()
+        >>> for event in client.convert([Path("photo.jpg")], "PNG"):
+        ...     print(event["event"])
+        started
+        converted
+        finished
+    """
+
+    # Delay between connection attempts while a spawned service starts
+    CONNECT_RETRY_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        autostart: bool = True,
+        start_timeout: float = 15.0,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            socket_path: Service socket path. Defaults to get_socket_path().
+            autostart: Spawn the service on first use if it is not running.
+            start_timeout: Seconds to wait for a spawned service.
+        """
+        self.socket_path = socket_path or get_socket_path()
+        self.autostart = autostart
+        self.start_timeout = start_timeout
+
+    def convert(
+        self,
+        files: Sequence[Path],
+        target_format: str,
+        output_dir: Optional[Path] = None,
+        size: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Convert files through the service, yielding progress events.
+
+        Args:
+            files: Files to convert.
+            target_format: Target format (e.g. "PNG"), or several
+                          comma-separated formats (e.g. "MP4,WEBM,GIF").
+            output_dir: Optional directory receiving the converted files.
+            size: Optional size images are downscaled to fit within (e.g.
+                 "800x600").
+
+        Yields:
+            Dict[str, Any]: Protocol events, ending with ``finished`` or
+                           ``error``.
+
+        Raises:
+            ServiceUnavailableError: If the service cannot be reached.
+        """
+        request = {
+            "files": [str(Path(file).resolve()) for file in files],
+            "target": target_format,
+            "output_dir": str(output_dir.resolve()) if output_dir else None,
+        }
+        if size:
+            request["size"] = size
+
+        # A stale server exits after answering, so retry once with a new one
+        for attempt in range(2):
+            with self._connect() as sock:
+                try:
+                    sock.sendall(encode_message(request))
+                except (BrokenPipeError, ConnectionResetError):
+                    # A stale server answers before reading; read its reply
+                    pass
+                events = self._read_events(sock)
+                first_event = next(events, None)
+                if first_event is None:
+                    raise ServiceUnavailableError(
+                        f"Service closed the connection: {self.socket_path}"
+                    )
+                if first_event.get("event") == "stale" and attempt == 0:
+                    continue
+                yield first_event
+                yield from events
+                return
+
+    def _connect(self) -> socket.socket:
+        """Connect to the service, starting it first if needed.
+
+        Returns:
+            socket.socket: Connected socket.
+
+        Raises:
+            ServiceUnavailableError: If the service cannot be reached.
+        """
+        try:
+            return self._try_connect()
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            if not self.autostart:
+                raise ServiceUnavailableError(
+                    f"Service is not running: {self.socket_path}"
+                ) from e
+
+        self._spawn_service()
+        deadline = time.monotonic() + self.start_timeout
+        while True:
+            try:
+                return self._try_connect()
+            except (FileNotFoundError, ConnectionRefusedError) as e:
+                if time.monotonic() > deadline:
+                    raise ServiceUnavailableError(
+                        f"Service did not start listening on {self.socket_path}"
+                    ) from e
+                time.sleep(self.CONNECT_RETRY_INTERVAL)
+
+    def _try_connect(self) -> socket.socket:
+        """Make a single connection attempt."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _spawn_service(self) -> None:
+        """Start a detached service process listening on the socket."""
+        command: List[str] = [
+            sys.executable,
+            "-m",
+            "simplyconvertfile",
+            "serve",
+            "--socket",
+            str(self.socket_path),
+        ]
+        subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True,
+        )
+
+    @staticmethod
+    def _read_events(sock: socket.socket) -> Iterator[Dict[str, Any]]:
+        """Yield the JSON events sent by the service until it closes."""
+        with sock.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
@@ -0,0 +1,377 @@
+#!/usr/bin/python3
+"""
+Resident conversion service over a Unix socket.
+
+This module implements ``simplyconvertfile serve``: a per-user process that
+keeps the expensive startup state warm (interpreter, settings, format
+configuration and rule index, converter modules) and runs conversion
+requests sent by :class:`simplyconvertfile.services.client.ServiceClient`.
+
+Design:
+- The listening socket comes from systemd socket activation
+  (``LISTEN_FDS``) when available, otherwise the server binds the socket
+  itself; the client starts it on first use.
+- Each connection is served by its own thread and receives newline-delimited
+  JSON progress events (see the client module for the protocol).
+- Only peers running as the same user are accepted (SO_PEERCRED).
+- Settings are loaded once. When a settings file changes on disk, the next
+  request is answered with ``stale`` and the server exits, so the client
+  (or systemd) starts a fresh one with the new configuration.
+- The server exits after ``service.idle_timeout`` seconds without requests.
+"""
+
+import json
+import os
+import select
+import socket
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from simplyconvertfile.config import settings_manager
+from simplyconvertfile.utils.logging import logger
+
+from .client import encode_message, get_socket_path
+
+# First file descriptor passed by systemd socket activation (sd_listen_fds)
+SD_LISTEN_FDS_START = 3
+
+_PEER_CREDENTIALS = struct.Struct("3i")
+
+
+class ConversionServer:
+    """Per-user conversion service keeping configuration warm.
+
+    Attributes:
+        socket_path: Path of the listening Unix socket.
+        idle_timeout: Seconds without connections before the server exits
+                     (0 disables the timeout).
+
+    Examples:
+        >>> server = ConversionServer()
+        >>> server.run()  # Blocks until idle, stale or stopped
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        idle_timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            socket_path: Socket to bind when not socket-activated.
+                        Defaults to the per-user runtime socket.
+            idle_timeout: Idle seconds before exiting. Defaults to the
+                         ``service.idle_timeout`` setting.
+        """
+        service_settings = settings_manager.get("service", {})
+        self.socket_path = socket_path or get_socket_path()
+        self.idle_timeout = float(
+            idle_timeout
+            if idle_timeout is not None
+            else service_settings.get("idle_timeout", 600)
+        )
+
+        self._listener: Optional[socket.socket] = None
+        self._owns_socket = False
+        self._stop_event = threading.Event()
+        self._active_lock = threading.Lock()
+        self._active_connections = 0
+        self._last_activity = time.monotonic()
+        self._settings_stamp = self._get_settings_stamp()
+
+    def run(self) -> None:
+        """Serve requests until idle, stale or stopped.
+
+        Raises:
+            OSError: If the socket cannot be created.
+        """
+        self._listener = self._get_listener()
+        if self._listener is None:
+            logger.info("Conversion service already running on {}", self.socket_path)
+            return
+
+        self._warm_up()
+        logger.info("Conversion service listening on {}", self.socket_path)
+        try:
+            while not self._stop_event.is_set():
+                readable, _, _ = select.select([self._listener], [], [], 1.0)
+                if readable:
+                    self._accept()
+                elif self._is_idle():
+                    logger.info("Conversion service idle, exiting")
+                    break
+        finally:
+            self._close_listener()
+
+    def stop(self) -> None:
+        """Request the server to stop. Safe to call from signal handlers."""
+        self._stop_event.set()
+
+    def _get_listener(self) -> Optional[socket.socket]:
+        """Get the listening socket, from systemd or by binding it.
+
+        Returns:
+            Optional[socket.socket]: Listening socket, or None if another
+                                    server already listens on the path.
+        """
+        if os.environ.get("LISTEN_PID") == str(os.getpid()) and os.environ.get(
+            "LISTEN_FDS"
+        ):
+            for variable in ("LISTEN_PID", "LISTEN_FDS", "LISTEN_FDNAMES"):
+                os.environ.pop(variable, None)
+            logger.debug("Using socket-activated file descriptor")
+            return socket.socket(fileno=SD_LISTEN_FDS_START)
+
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.socket_path))
+                return None
+            except OSError:
+                # Leftover from a server that did not exit cleanly
+                self.socket_path.unlink()
+            finally:
+                probe.close()
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            listener.bind(str(self.socket_path))
+        finally:
+            os.umask(old_umask)
+        listener.listen(16)
+        self._owns_socket = True
+        return listener
+
+    def _close_listener(self) -> None:
+        """Close the listening socket and remove it if this server bound it."""
+        if self._listener is None:
+            return
+        if self._owns_socket:
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+        self._listener.close()
+        self._listener = None
+
+    def _warm_up(self) -> None:
+        """Load the configuration and converter modules ahead of requests."""
+        from simplyconvertfile.config import format_config
+        from simplyconvertfile.core.factory import ConverterFactory  # noqa: F401
+
+        start = time.perf_counter()
+        for group in format_config._format_groups.values():
+            for source_format in group.formats:
+                format_config.get_reachable_formats(source_format)
+        logger.debug(
+            "Conversion service warmed up in {:.3f}s", time.perf_counter() - start
+        )
+
+    def _accept(self) -> None:
+        """Accept one connection and serve it in a separate thread."""
+        try:
+            connection, _ = self._listener.accept()
+        except OSError:
+            return
+
+        if not self._is_same_user(connection):
+            logger.warning("Rejected connection from another user")
+            connection.close()
+            return
+
+        if self._get_settings_stamp() != self._settings_stamp:
+            logger.info("Settings changed on disk, restarting conversion service")
+            # Release the socket path before answering so the client's retry
+            # starts a fresh server instead of reaching this one.
+            self._close_listener()
+            self._send(connection, {"event": "stale"})
+            connection.close()
+            self.stop()
+            return
+
+        with self._active_lock:
+            self._active_connections += 1
+        threading.Thread(
+            target=self._serve_connection, args=(connection,), daemon=False
+        ).start()
+
+    def _serve_connection(self, connection: socket.socket) -> None:
+        """Read one request from a connection and stream its progress."""
+        try:
+            with connection:
+                request = self._read_request(connection)
+                if request is None:
+                    self._send(connection, {"event": "error", "message": "Bad request"})
+                    return
+                files, target_format, output_dir, size = request
+                self._convert_files(
+                    connection,
+                    files,
+                    target_format,
+                    output_dir,
+                    size,
+                    cancel_check=lambda: self._is_disconnected(connection),
+                )
+        except OSError as e:
+            logger.debug("Client connection closed: {}", e)
+        finally:
+            with self._active_lock:
+                self._active_connections -= 1
+                self._last_activity = time.monotonic()
+
+    def _convert_files(
+        self,
+        connection: socket.socket,
+        files: list,
+        target_format: str,
+        output_dir: Optional[Path],
+        size: Optional[Tuple[int, int]],
+        cancel_check: Callable[[], bool],
+    ) -> None:
+        """Convert the requested files, sending one event per file.
+
+        A comma-separated target (e.g. "MP4,WEBM,GIF") converts each file to
+        every listed format, sharing a single decode when possible; one
+        ``converted`` event is then sent per output file.
+        """
+        from simplyconvertfile.core.factory import ConverterFactory
+
+        if output_dir:
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+        target_formats = [fmt.strip() for fmt in target_format.split(",")]
+        converted = failed = 0
+        self._send(connection, {"event": "started", "total": len(files)})
+        for file in files:
+            if cancel_check():
+                logger.info("Client disconnected, cancelling remaining files")
+                return
+
+            converter = None
+            if file.is_file() and len(target_formats) > 1:
+                converter = ConverterFactory.create_fan_out_converter(
+                    file,
+                    target_formats,
+                    batch_mode=True,
+                    output_dir=output_dir,
+                    headless=True,
+                    cancel_check=cancel_check,
+                    size=size,
+                )
+            elif file.is_file():
+                converter = ConverterFactory.create_converter(
+                    file,
+                    target_formats[0],
+                    batch_mode=True,
+                    output_dir=output_dir,
+                    headless=True,
+                    cancel_check=cancel_check,
+                    size=size,
+                )
+
+            if converter and converter.convert():
+                converted += 1
+                for output in getattr(
+                    converter, "target_files", [converter.target_file]
+                ):
+                    self._send(
+                        connection,
+                        {
+                            "event": "converted",
+                            "file": str(file),
+                            "output": str(output),
+                        },
+                    )
+            else:
+                failed += 1
+                error = converter.get_last_error() if converter else None
+                self._send(
+                    connection,
+                    {
+                        "event": "failed",
+                        "file": str(file),
+                        "error": error or "Conversion not supported",
+                    },
+                )
+
+        self._send(
+            connection, {"event": "finished", "converted": converted, "failed": failed}
+        )
+
+    @staticmethod
+    def _read_request(
+        connection: socket.socket,
+    ) -> Optional[Tuple[list, str, Optional[Path], Optional[Tuple[int, int]]]]:
+        """Read and validate the request line sent by the client.
+
+        Returns:
+            Optional[Tuple[list, str, Optional[Path], Optional[Tuple[int, int]]]]:
+                Files, target format, output directory and image size, or
+                None if the request is invalid.
+        """
+        from simplyconvertfile.utils.image_size import parse_image_size
+
+        with connection.makefile("r", encoding="utf-8") as stream:
+            line = stream.readline()
+        try:
+            request: Dict[str, Any] = json.loads(line)
+            files = [Path(file) for file in request["files"]]
+            target_format = str(request["target"]).upper()
+            size = parse_image_size(request["size"]) if request.get("size") else None
+        except (ValueError, KeyError, TypeError):
+            return None
+        if not all(file.is_absolute() for file in files):
+            return None
+        output_dir = request.get("output_dir")
+        return files, target_format, Path(output_dir) if output_dir else None, size
+
+    @staticmethod
+    def _send(connection: socket.socket, event: Dict[str, Any]) -> None:
+        """Send one event to the client."""
+        connection.sendall(encode_message(event))
+
+    @staticmethod
+    def _is_disconnected(connection: socket.socket) -> bool:
+        """Whether the client closed its end of the connection."""
+        try:
+            readable, _, _ = select.select([connection], [], [], 0)
+            return bool(readable) and not connection.recv(1, socket.MSG_PEEK)
+        except OSError:
+            return True
+
+    @staticmethod
+    def _is_same_user(connection: socket.socket) -> bool:
+        """Whether the peer process runs as the same user as the server."""
+        credentials = connection.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, _PEER_CREDENTIALS.size
+        )
+        _, uid, _ = _PEER_CREDENTIALS.unpack(credentials)
+        return uid == os.getuid()
+
+    def _is_idle(self) -> bool:
+        """Whether the idle timeout elapsed with no connection in progress."""
+        if self.idle_timeout <= 0:
+            return False
+        with self._active_lock:
+            return (
+                self._active_connections == 0
+                and time.monotonic() - self._last_activity > self.idle_timeout
+            )
+
+    @staticmethod
+    def _get_settings_stamp() -> Tuple[Optional[int], ...]:
+        """Modification times of the settings files, None when missing."""
+        stamps = []
+        for config_file in settings_manager.config_files:
+            try:
+                file_stat = os.stat(config_file)
+                stamps.append(file_stat.st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
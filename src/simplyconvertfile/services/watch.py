@@ -0,0 +1,422 @@
+#!/usr/bin/python3
+"""
+Watch-folder conversion service.
+
+This module implements ``simplyconvertfile watch DIR --to FORMAT``: a
+long-running service that converts every file dropped into a directory tree.
+
+Design:
+- inotify (IN_CLOSE_WRITE / IN_MOVED_TO) reports new files, so the tree is
+  walked only once at startup. The event loop never blocks on conversions,
+  so bursts are drained faster than the kernel queue fills; the tree is
+  walked again only if the kernel reports a queue overflow.
+- New files are debounced: a file is converted only after it stayed
+  unchanged for ``settle_seconds``, which skips partially written files.
+- Files are deduplicated by (device, inode, mtime), so repeated events for
+  the same content convert it once.
+- Settled files are fed to a bounded queue consumed by worker threads that
+  use the regular ConverterFactory in batch mode.
+- Output files are written to a mirrored tree under the output directory.
+"""
+
+import fnmatch
+import heapq
+import os
+import queue
+import select
+import threading
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from simplyconvertfile.config import format_config, settings_manager
+from simplyconvertfile.utils.logging import logger
+from simplyconvertfile.utils.thread_budget import thread_budget
+from simplyconvertfile.utils.validation import FileValidator
+
+from .inotify import (
+    IN_CLOSE_WRITE,
+    IN_CREATE,
+    IN_DELETE_SELF,
+    IN_IGNORED,
+    IN_ISDIR,
+    IN_MODIFY,
+    IN_MOVE_SELF,
+    IN_MOVED_TO,
+    IN_ONLYDIR,
+    IN_Q_OVERFLOW,
+    Inotify,
+    InotifyEvent,
+)
+
+ResultCallback = Callable[[Path, bool, str], None]
+
+
+class WatchService:
+    """Converts files dropped into a watched directory tree.
+
+    Attributes:
+        WATCH_MASK: inotify events watched on every directory.
+        SEEN_CACHE_SIZE: Number of (device, inode, mtime) keys remembered for
+                         deduplication.
+        source_dir: Root of the watched tree.
+        target_format: Target format for every converted file.
+        output_dir: Root of the mirrored output tree.
+        workers: Number of conversion worker threads.
+        converted: Number of successful conversions.
+        failed: Number of failed conversions.
+
+    Examples:
+        >>> service = WatchService(Path("~/Inbox").expanduser(), "PDF")
+        >>> service.run()  # blocks until stop() is called
+    """
+
+    WATCH_MASK = (
+        IN_CLOSE_WRITE
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_MODIFY
+        | IN_DELETE_SELF
+        | IN_MOVE_SELF
+        | IN_ONLYDIR
+    )
+    SEEN_CACHE_SIZE = 100_000
+
+    def __init__(
+        self,
+        source_dir: Path,
+        target_format: str,
+        output_dir: Optional[Path] = None,
+        workers: Optional[int] = None,
+        on_result: Optional[ResultCallback] = None,
+    ) -> None:
+        """Initialize the watch service.
+
+        Args:
+            source_dir: Directory tree to watch.
+            target_format: Format every new file is converted to.
+            output_dir: Root of the mirrored output tree. Defaults to a sibling
+                       directory named after the source directory.
+            workers: Number of conversion workers (default from settings).
+            on_result: Optional callback called with (file, success, detail)
+                      after every conversion, where detail is the output
+                      path or the error message.
+        """
+        watch_settings = settings_manager.get("watch", {})
+
+        self.source_dir = source_dir.resolve()
+        self.target_format = target_format.upper()
+        self.output_dir = (
+            output_dir.resolve()
+            if output_dir
+            else self.source_dir.with_name(
+                f"{self.source_dir.name}_"
+                f"{settings_manager.get('output_directory_name', 'converted_files')}"
+            )
+        )
+        self.workers = max(
+            1, workers or watch_settings.get("workers") or (os.cpu_count() or 2) // 2
+        )
+        self._settle_seconds = float(watch_settings.get("settle_seconds", 1.0))
+        self._ignore_patterns: List[str] = watch_settings.get(
+            "ignore_patterns", [".*", "*.part", "*.crdownload", "*.tmp", "*~"]
+        )
+        self._on_result = on_result
+
+        self.converted = 0
+        self.failed = 0
+
+        self._inotify: Optional[Inotify] = None
+        self._watch_paths: Dict[int, Path] = {}
+
+        # Debounce state: path -> (deadline, size, mtime_ns); the heap may hold
+        # stale entries, only the deadline stored in _pending is authoritative.
+        self._pending: Dict[Path, Tuple[float, int, int]] = {}
+        self._deadlines: List[Tuple[float, str]] = []
+        self._ready: Deque[Path] = deque()
+        self._seen: "OrderedDict[Tuple[int, int, int], None]" = OrderedDict()
+
+        self._queue: "queue.Queue[Optional[Path]]" = queue.Queue(
+            maxsize=int(watch_settings.get("queue_size", 64))
+        )
+        self._stop_event = threading.Event()
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        self._stats_lock = threading.Lock()
+
+    def run(self) -> None:
+        """Watch the source tree and convert new files until stopped.
+
+        Raises:
+            OSError: If inotify is unavailable or the tree cannot be watched.
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(
+            "Watching {} -> {} ({}) with {} workers",
+            self.source_dir,
+            self.output_dir,
+            self.target_format,
+            self.workers,
+        )
+
+        worker_threads = [
+            threading.Thread(target=self._worker_loop, daemon=True)
+            for _ in range(self.workers)
+        ]
+        for thread in worker_threads:
+            thread.start()
+
+        # Each worker gets its share of the cores from the start
+        with thread_budget.reserve(self.workers), Inotify() as inotify:
+            self._inotify = inotify
+            self._add_watch_tree(self.source_dir, schedule_files=False)
+            try:
+                self._event_loop()
+            finally:
+                self._inotify = None
+                self._shutdown_workers(worker_threads)
+                os.close(self._wakeup_read)
+                os.close(self._wakeup_write)
+
+    def stop(self) -> None:
+        """Request the service to stop. Safe to call from signal handlers."""
+        self._stop_event.set()
+        self._wake_event_loop()
+
+    def _wake_event_loop(self) -> None:
+        """Interrupt the event loop's poll() call."""
+        try:
+            os.write(self._wakeup_write, b"\0")
+        except OSError:
+            pass
+
+    def _event_loop(self) -> None:
+        """Read inotify events and dispatch settled files until stopped."""
+        poller = select.poll()
+        poller.register(self._inotify.fd, select.POLLIN)
+        poller.register(self._wakeup_read, select.POLLIN)
+
+        while not self._stop_event.is_set():
+            timeout = self._next_timeout()
+            for fd, _ in poller.poll(timeout):
+                if fd == self._inotify.fd:
+                    for event in self._inotify.read_events():
+                        self._handle_event(event)
+                else:
+                    os.read(self._wakeup_read, 512)
+            self._dispatch_due()
+            self._feed_queue()
+
+    def _next_timeout(self) -> int:
+        """Return the poll timeout in milliseconds."""
+        if not self._deadlines:
+            return 1000
+        delay = self._deadlines[0][0] - time.monotonic()
+        return max(0, min(1000, int(delay * 1000) + 1))
+
+    def _handle_event(self, event: InotifyEvent) -> None:
+        """Process a single inotify event."""
+        if event.mask & IN_Q_OVERFLOW:
+            # The kernel dropped events; this is the only case where the tree
+            # is walked again. Already converted files are skipped by the
+            # (device, inode, mtime) deduplication.
+            logger.warning(
+                "inotify event queue overflowed, rescanning {}", self.source_dir
+            )
+            self._add_watch_tree(self.source_dir, schedule_files=True)
+            return
+
+        directory = self._watch_paths.get(event.wd)
+        if directory is None:
+            return
+
+        if event.mask & (IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF):
+            if event.mask & IN_IGNORED:
+                self._watch_paths.pop(event.wd, None)
+            return
+
+        path = directory / event.name
+        if self._is_ignored(path):
+            return
+
+        if event.mask & IN_ISDIR:
+            if event.mask & (IN_CREATE | IN_MOVED_TO):
+                # Files may already exist in a directory moved or created
+                # before its watch was added; only this subtree is walked.
+                self._add_watch_tree(path, schedule_files=True)
+            return
+
+        if event.mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+            self._schedule(path)
+        elif event.mask & IN_MODIFY and path in self._pending:
+            # Still being written: push the deadline back
+            self._schedule(path)
+
+    def _add_watch_tree(self, root: Path, schedule_files: bool) -> None:
+        """Add watches for a directory and all its subdirectories.
+
+        Args:
+            root: Directory to watch recursively.
+            schedule_files: Whether existing files should be converted.
+        """
+        for directory, dir_names, file_names in os.walk(root):
+            dir_path = Path(directory)
+            if self._is_in_output(dir_path):
+                dir_names[:] = []
+                continue
+            dir_names[:] = [d for d in dir_names if not self._is_ignored(dir_path / d)]
+            try:
+                wd = self._inotify.add_watch(dir_path, self.WATCH_MASK)
+            except OSError as e:
+                logger.error("Cannot watch {}: {}", dir_path, e)
+                continue
+            self._watch_paths[wd] = dir_path
+            if schedule_files:
+                for file_name in file_names:
+                    file_path = dir_path / file_name
+                    if not self._is_ignored(file_path):
+                        self._schedule(file_path)
+
+    def _schedule(self, path: Path) -> None:
+        """Schedule a file for conversion once it has settled."""
+        try:
+            stat = path.stat()
+        except OSError:
+            self._pending.pop(path, None)
+            return
+
+        deadline = time.monotonic() + self._settle_seconds
+        self._pending[path] = (deadline, stat.st_size, stat.st_mtime_ns)
+        heapq.heappush(self._deadlines, (deadline, str(path)))
+
+    def _dispatch_due(self) -> None:
+        """Move files whose debounce deadline passed to the ready queue."""
+        now = time.monotonic()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, path_str = heapq.heappop(self._deadlines)
+            path = Path(path_str)
+            entry = self._pending.get(path)
+            if entry is None or entry[0] != deadline:
+                continue  # Stale heap entry, rescheduled or dropped
+
+            del self._pending[path]
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            if (stat.st_size, stat.st_mtime_ns) != entry[1:]:
+                self._schedule(path)
+                continue
+
+            key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+            if key in self._seen:
+                logger.debug("Skipping already converted file: {}", path)
+                continue
+            self._seen[key] = None
+            if len(self._seen) > self.SEEN_CACHE_SIZE:
+                self._seen.popitem(last=False)
+
+            if self._is_convertible(path):
+                self._ready.append(path)
+
+    def _feed_queue(self) -> None:
+        """Move ready files to the bounded worker queue without blocking."""
+        while self._ready:
+            try:
+                self._queue.put_nowait(self._ready[0])
+            except queue.Full:
+                return
+            self._ready.popleft()
+
+    def _worker_loop(self) -> None:
+        """Convert files from the worker queue until a sentinel is received."""
+        while True:
+            path = self._queue.get()
+            if path is None:
+                return
+            if self._ready:
+                # A queue slot was freed, let the event loop refill it
+                self._wake_event_loop()
+            try:
+                self._convert(path)
+            except Exception as e:
+                logger.error("Unexpected error converting {}: {}", path, e)
+                self._report(path, False, str(e))
+
+    def _convert(self, path: Path) -> None:
+        """Convert a single file into the mirrored output tree."""
+        from simplyconvertfile.core.factory import ConverterFactory
+
+        output_dir = self.output_dir / path.parent.relative_to(self.source_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        converter = ConverterFactory.create_converter(
+            path,
+            self.target_format,
+            batch_mode=True,
+            output_dir=output_dir,
+            headless=True,
+            cancel_check=self._stop_event.is_set,
+        )
+        if not converter:
+            self._report(path, False, "Conversion not supported")
+            return
+
+        if converter.convert():
+            self._report(path, True, str(converter.target_file))
+        else:
+            self._report(path, False, converter.get_last_error() or "")
+
+    def _report(self, path: Path, success: bool, detail: str) -> None:
+        """Update counters and notify the result callback."""
+        with self._stats_lock:
+            if success:
+                self.converted += 1
+            else:
+                self.failed += 1
+        if success:
+            logger.info("Converted {} -> {}", path, detail)
+        else:
+            logger.error("Failed to convert {}: {}", path, detail)
+        if self._on_result:
+            self._on_result(path, success, detail)
+
+    def _shutdown_workers(self, worker_threads: List[threading.Thread]) -> None:
+        """Stop worker threads, cancelling in-flight conversions."""
+        self._ready.clear()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        for _ in worker_threads:
+            self._queue.put(None)
+        for thread in worker_threads:
+            thread.join()
+
+    def _is_convertible(self, path: Path) -> bool:
+        """Check whether a file can be converted to the target format."""
+        source_format = FileValidator.get_file_format(path)
+        if not source_format or not format_config.get_format_group(source_format):
+            return False
+
+        canonical_target = format_config.get_canonical_format(self.target_format)
+        if format_config.get_canonical_format(source_format) == canonical_target:
+            return False
+
+        available = FileValidator.get_available_formats(source_format)
+        if canonical_target not in available and self.target_format not in available:
+            logger.debug("No conversion from {} to {}", source_format, canonical_target)
+            return False
+        return True
+
+    def _is_ignored(self, path: Path) -> bool:
+        """Check whether a path matches one of the ignore patterns."""
+        return any(
+            fnmatch.fnmatch(path.name, pattern) for pattern in self._ignore_patterns
+        )
+
+    def _is_in_output(self, path: Path) -> bool:
+        """Check whether a path lies inside the output tree."""
+        return path == self.output_dir or self.output_dir in path.parents
@@ -6,7 +6,7 @@ from .dialogs import (
     ErrorDialogWindow,
     SelectDropdownDialogWindow,
 )
-from .gi import Gdk, GLib, Gtk
+from .gi import Gdk, Gio, GLib, Gtk
 from .notifications import notification
 
 __all__ = [
@@ -15,6 +15,7 @@ __all__ = [
     "DialogWindow",
     "ErrorDialogWindow",
     "Gdk",
+    "Gio",
     "GLib",
     "Gtk",
     "InfoDialogWindow",
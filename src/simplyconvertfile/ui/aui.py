@@ -47,6 +47,7 @@ from typing import Callable, Optional, Sequence, Union
 from gi.repository import GdkPixbuf, GLib, Gtk
 from simplyconvertfile.utils import text
 from simplyconvertfile.utils.logging import logger
+from simplyconvertfile.utils.profiling import profiler
 
 _ = gettext.gettext
 
@@ -127,6 +128,7 @@ class DialogWindow(Gtk.Window):
             Union[int, str, None]: Dialog response code or value.
         """
         logger.debug("Running dialog window")
+        profiler.mark("first_dialog")
         response = self.dialog.run()
         logger.debug("Dialog window response: {}", response)
         return response
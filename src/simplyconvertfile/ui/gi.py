@@ -1,5 +1,6 @@
 import importlib
 
 Gdk = importlib.import_module("gi.repository.Gdk")
+Gio = importlib.import_module("gi.repository.Gio")
 GLib = importlib.import_module("gi.repository.GLib")
 Gtk = importlib.import_module("gi.repository.Gtk")
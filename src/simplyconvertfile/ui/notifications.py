@@ -4,18 +4,135 @@ NotificationService for desktop notifications.
 
 This module provides a centralized notification system with consistent formatting,
 icons, and urgency levels for conversion operations.
+
+Notifications are sent over D-Bus to org.freedesktop.Notifications, without
+spawning a process per notification. Batch progress notifications update a
+single notification in place and are rate-limited. notify-send is used as a
+fallback when the session bus or notification daemon is unavailable.
 """
 
 import contextlib
 import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
 
 from simplyconvertfile.config.settings import settings_manager
 from simplyconvertfile.utils import text
 from simplyconvertfile.utils.logging import logger
 
+from .gi import Gio, GLib
 from .icons import get_notification_icon
 
 
+class DBusNotifier:
+    """Client for the org.freedesktop.Notifications D-Bus interface.
+
+    Attributes:
+        available: False once a call failed; callers then use a fallback.
+
+    Class Attributes:
+        BUS_NAME: Well-known name of the notification daemon.
+        OBJECT_PATH: Object path of the notification interface.
+        URGENCY_LEVELS: Urgency hint values by urgency name.
+        CALL_TIMEOUT_MS: Maximum wait for the daemon to answer.
+
+    Examples:
+        >>> notifier = DBusNotifier()
+        >>> notification_id = notifier.notify("App", "icon", "Title", "Body")
+        >>> notifier.notify("App", "icon", "Title", "Updated", notification_id)
+    """
+
+    BUS_NAME = "org.freedesktop.Notifications"
+    OBJECT_PATH = "/org/freedesktop/Notifications"
+    URGENCY_LEVELS = {"low": 0, "normal": 1, "critical": 2}
+    CALL_TIMEOUT_MS = 1000
+
+    def __init__(self) -> None:
+        """Initialize the client; the session bus is connected on first use."""
+        self._connection: Optional[Gio.DBusConnection] = None
+        self.available = True
+
+    def notify(
+        self,
+        app_name: str,
+        icon: str,
+        title: str,
+        message: str,
+        replaces_id: int = 0,
+        urgency: str = "normal",
+    ) -> Optional[int]:
+        """Show a notification, or update the one with replaces_id.
+
+        Args:
+            app_name: Application name shown by the daemon.
+            icon: Icon name or path.
+            title: Notification summary.
+            message: Notification body.
+            replaces_id: ID of a notification to update in place (0 for new).
+            urgency: Urgency level - "low", "normal", or "critical".
+
+        Returns:
+            Optional[int]: ID of the shown notification, or None on failure
+                          (the client is then marked unavailable).
+        """
+        try:
+            if self._connection is None:
+                self._connection = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+            hints = {
+                "urgency": GLib.Variant("y", self.URGENCY_LEVELS.get(urgency, 1))
+            }
+            reply = self._connection.call_sync(
+                self.BUS_NAME,
+                self.OBJECT_PATH,
+                self.BUS_NAME,
+                "Notify",
+                GLib.Variant(
+                    "(susssasa{sv}i)",
+                    (app_name, replaces_id, icon, title, message, [], hints, -1),
+                ),
+                GLib.VariantType("(u)"),
+                Gio.DBusCallFlags.NONE,
+                self.CALL_TIMEOUT_MS,
+                None,
+            )
+        except GLib.Error as e:
+            logger.debug("D-Bus notifications unavailable: {}", e.message)
+            self.available = False
+            return None
+        return reply.unpack()[0]
+
+
+@dataclass
+class BatchNotificationState:
+    """Progress of the running batch, summarized in progress notifications.
+
+    Attributes:
+        extension: Target format of the batch.
+        total: Number of files in the batch.
+        processed: Number of files converted or failed so far.
+        failed: Number of files that failed.
+        started_at: time.monotonic() when the batch started.
+
+    Examples:
+        >>> state = BatchNotificationState("PNG", 1000, processed=312, failed=4)
+        >>> state.files_per_minute()
+        45.0
+    """
+
+    extension: str
+    total: int
+    processed: int = 0
+    failed: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    def files_per_minute(self) -> float:
+        """Average conversion rate since the batch started."""
+        elapsed = time.monotonic() - self.started_at
+        return self.processed * 60 / elapsed if elapsed > 0 else 0.0
+
+
 class NotificationService:
     """Service for sending desktop notifications related to file conversion operations.
 
@@ -23,23 +140,46 @@ class NotificationService:
     with appropriate icons, urgency levels, and formatting. All notifications
     respect user settings for enabling/disabling specific notification types.
 
+    During a batch, step events are not shown one by one: they update a
+    single progress notification in place ("312/1000 done, 4 failed,
+    45 files/min"), at most once every ``notifications.min_interval``
+    seconds, when ``on_batch_step_start`` or ``on_batch_step_success`` is
+    enabled. Only failures get a notification of their own (when
+    ``on_batch_step_failure`` is enabled). The final batch summary replaces
+    the progress notification and is never dropped.
+
     Class Attributes:
         settings: Dictionary of notification settings from configuration.
         icon: Default notification icon path or fallback icon name.
+        PROGRESS, SUMMARY, EVENT: Kinds of notification (see send_notification).
 
     Examples:
         >>> NotificationService.notify_conversion_success("example.jpg", "PNG")
         >>> NotificationService.notify_batch_started("JPEG", 5)
     """
 
+    PROGRESS = "progress"
+    SUMMARY = "summary"
+    EVENT = "event"
+
     settings: dict = settings_manager.get("notifications", {})
     _icon: str = get_notification_icon() or "gtk-convert"
+    _dbus = DBusNotifier()
+    _lock = threading.Lock()
+    _progress_id: int = 0
+    _last_progress_time: float = 0.0
+    _batch: Optional[BatchNotificationState] = None
 
     @classmethod
     def send_notification(
-        cls, title: str, message: str, urgency: str = "normal", icon: str = ""
+        cls,
+        title: str,
+        message: str,
+        urgency: str = "normal",
+        icon: str = "",
+        kind: str = EVENT,
     ) -> None:
-        """Send a desktop notification using notify-send.
+        """Send a desktop notification over D-Bus, or with notify-send.
 
         Sends a desktop notification with the specified parameters. Respects
         global notification settings and handles errors gracefully.
@@ -49,12 +189,16 @@ class NotificationService:
             message: The notification body message.
             urgency: Urgency level - "low", "normal", or "critical".
             icon: Custom icon path (uses default if empty).
+            kind: PROGRESS updates the batch notification in place and is
+                 dropped when sent within ``min_interval`` of the previous
+                 update; SUMMARY updates it and ends it; EVENT (default)
+                 shows a new notification.
 
         Returns:
             None
 
         Note:
-            Silently fails if notifications are disabled or notify-send unavailable.
+            Silently fails if notifications are disabled or unavailable.
         """
         logger.debug("Sending notification: {} - {}", title, message)
         if not cls.settings.get("enabled", True):
@@ -64,6 +208,43 @@ class NotificationService:
         if not icon:
             icon = cls._icon
 
+        with cls._lock:
+            replaces_id = 0
+            if kind != cls.EVENT:
+                now = time.monotonic()
+                min_interval = float(cls.settings.get("min_interval", 5.0))
+                if (
+                    kind == cls.PROGRESS
+                    and now - cls._last_progress_time < min_interval
+                ):
+                    logger.debug("Progress notification rate-limited")
+                    return
+                cls._last_progress_time = now
+                replaces_id = cls._progress_id
+
+            if cls._dbus.available:
+                notification_id = cls._dbus.notify(
+                    text.UI.APPLICATION_TITLE,
+                    icon,
+                    title,
+                    message,
+                    replaces_id,
+                    urgency,
+                )
+                if notification_id is not None:
+                    if kind == cls.PROGRESS:
+                        cls._progress_id = notification_id
+                    elif kind == cls.SUMMARY:
+                        cls._progress_id = 0
+                    return
+
+        cls._send_with_notify_send(title, message, urgency, icon)
+
+    @staticmethod
+    def _send_with_notify_send(
+        title: str, message: str, urgency: str, icon: str
+    ) -> None:
+        """Send a notification by spawning notify-send (D-Bus fallback)."""
         with contextlib.suppress(FileNotFoundError, subprocess.SubprocessError):
             subprocess.Popen(
                 [
@@ -81,7 +262,12 @@ class NotificationService:
 
     @classmethod
     def _notify(
-        cls, setting_key: str, title: str, message: str, urgency: str = "normal"
+        cls,
+        setting_key: str,
+        title: str,
+        message: str,
+        urgency: str = "normal",
+        kind: str = EVENT,
     ) -> None:
         """Send notification if the specific setting is enabled.
 
@@ -93,13 +279,39 @@ class NotificationService:
             title: Notification title text.
             message: Notification body message.
             urgency: Urgency level for the notification.
+            kind: Kind of notification (see send_notification).
 
         Returns:
             None
         """
         if not cls.settings.get(setting_key, True):
             return
-        cls.send_notification(title, message, urgency)
+        cls.send_notification(title, message, urgency, kind=kind)
+
+    @classmethod
+    def _notify_batch_progress(cls, setting_key: str) -> None:
+        """Update the batch progress notification if the setting is enabled.
+
+        Args:
+            setting_key: Step setting that triggered the update.
+
+        Returns:
+            None
+        """
+        batch = cls._batch
+        if not batch:
+            return
+        cls._notify(
+            setting_key,
+            text.Notifications.BATCH_PROGRESS_TITLE.format(extension=batch.extension),
+            text.Notifications.BATCH_PROGRESS_MESSAGE.format(
+                processed=batch.processed,
+                total=batch.total,
+                failed=batch.failed,
+                rate=round(batch.files_per_minute()),
+            ),
+            kind=cls.PROGRESS,
+        )
 
     @classmethod
     def notify_missing_dependency(cls, dependency_name: str) -> None:
@@ -146,6 +358,7 @@ class NotificationService:
             >>> NotificationService.notify_cancelled_conversion("JPEG", 3, 5, True)
         """
         if is_batch:
+            cls._batch = None
             cls._notify(
                 "on_batch_cancel",
                 text.Notifications.BATCH_CONVERSION_CANCELLED_TITLE,
@@ -154,6 +367,7 @@ class NotificationService:
                     total=total,
                     extension=extension,
                 ),
+                kind=cls.SUMMARY,
             )
             return
 
@@ -279,11 +493,8 @@ class NotificationService:
                 failed=failed_conversions, total=total_count, extension=extension
             )
 
-        cls._notify(
-            "on_batch_finish",
-            title,
-            message,
-        )
+        cls._batch = None
+        cls._notify("on_batch_finish", title, message, kind=cls.SUMMARY)
 
     @classmethod
     def notify_batch_started(cls, extension: str, total: int = 0) -> None:
@@ -302,6 +513,7 @@ class NotificationService:
         Examples:
             >>> NotificationService.notify_batch_started("PNG", 10)
         """
+        cls._batch = BatchNotificationState(extension, total)
         cls._notify(
             "on_batch_start",
             text.Notifications.BATCH_CONVERSION_STARTED_TITLE,
@@ -309,14 +521,15 @@ class NotificationService:
                 extension=extension,
                 total=total,
             ),
+            kind=cls.PROGRESS,
         )
 
     @classmethod
     def notify_batch_step_start(cls, file_name: str, extension: str) -> None:
         """Notify about the start of an individual batch step.
 
-        Sends a notification when processing of a specific file begins
-        within a batch conversion operation.
+        Updates the batch progress notification (rate-limited). Outside of
+        a batch started with notify_batch_started, shows the file name.
 
         Args:
             file_name: Name of the file currently being processed.
@@ -328,20 +541,24 @@ class NotificationService:
         Examples:
             >>> NotificationService.notify_batch_step_start("image1.jpg", "PNG")
         """
+        if cls._batch:
+            cls._notify_batch_progress("on_batch_step_start")
+            return
         cls._notify(
             "on_batch_step_start",
             text.Notifications.BATCH_STEP_CONVERSION_STARTED_TITLE,
             text.Notifications.BATCH_STEP_CONVERSION_STARTED_MESSAGE.format(
                 filename=file_name, extension=extension
             ),
+            kind=cls.PROGRESS,
         )
 
     @classmethod
     def notify_batch_step_success(cls, file_name: str, extension: str) -> None:
         """Notify about successful completion of a batch step.
 
-        Sends a success notification for an individual file within a
-        batch conversion that completed successfully.
+        Counts the file in the batch progress and updates the progress
+        notification (rate-limited). Outside of a batch, shows the file name.
 
         Args:
             file_name: Name of the successfully converted file.
@@ -353,12 +570,17 @@ class NotificationService:
         Examples:
             >>> NotificationService.notify_batch_step_success("photo.jpg", "PNG")
         """
+        if cls._batch:
+            cls._batch.processed += 1
+            cls._notify_batch_progress("on_batch_step_success")
+            return
         cls._notify(
             "on_batch_step_success",
             text.Notifications.SUCCESS_TITLE,
             text.Notifications.SUCCESS_MESSAGE.format(
                 filename=file_name, extension=extension
             ),
+            kind=cls.PROGRESS,
         )
 
     @classmethod
@@ -378,6 +600,9 @@ class NotificationService:
         Examples:
             >>> NotificationService.notify_batch_step_failure("corrupt.jpg", "PNG")
         """
+        if cls._batch:
+            cls._batch.processed += 1
+            cls._batch.failed += 1
         cls._notify(
             "on_batch_step_failure",
             text.Notifications.FAILURE_TITLE,
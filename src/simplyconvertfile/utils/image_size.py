@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+"""
+Image sizes given on the command line and in settings.
+
+Kept free of the converter modules so the conversion service client can
+check a ``--size`` value without loading them.
+"""
+
+import re
+from typing import Any, Tuple
+
+Size = Tuple[int, int]
+
+
+def parse_image_size(value: Any) -> Size:
+    """Parse an image size given as 256 (a 256x256 box) or "320x180".
+
+    Args:
+        value: Integer or "WIDTHxHEIGHT" string.
+
+    Returns:
+        Size: (width, height) of the bounding box.
+
+    Raises:
+        ValueError: If the value is not a positive size.
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*(?:[xX]\s*(\d+))?\s*", str(value))
+    if not match:
+        raise ValueError(f"Invalid image size: {value}")
+    width = int(match.group(1))
+    height = int(match.group(2) or width)
+    if not width or not height:
+        raise ValueError(f"Invalid image size: {value}")
+    return width, height
@@ -0,0 +1,159 @@
+#!/usr/bin/python3
+"""
+JSON files in the config directory shared by concurrent processes.
+
+Usage statistics and rule timings are updated by every conversion, possibly
+from several processes at once (file manager actions, the watch and
+conversion services). A JsonStore keeps the file content in memory and
+writes the changes recorded since the last write in one go, a few seconds
+later or when the process exits. Each write locks a sidecar lock file,
+merges the pending changes into the current file content (so concurrent
+processes never lose each other's changes) and atomically replaces the file.
+"""
+
+import atexit
+import fcntl
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from simplyconvertfile.utils.logging import logger
+
+CONFIG_DIR = Path.home() / ".config" / "simplyconvertfile"
+
+# Merges changes into data in place: merge(data, changes)
+MergeFunction = Callable[[Dict, Dict], None]
+
+
+class JsonStore:
+    """A JSON object in a config file, written in batches.
+
+    Attributes:
+        path: Path to the JSON file.
+        description: What the file holds, for log messages.
+        flush_delay: Seconds between a recorded change and the write, so
+                    changes recorded in the meantime share one write.
+
+    Examples:
+        >>> store = JsonStore("usage_stats.json", merge_counts, "usage statistics")
+        >>> store.add({"JPEG": {"PNG": 1}})
+        >>> store.data["JPEG"]
+        {'PNG': 1}
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        merge: MergeFunction,
+        description: str,
+        flush_delay: float = 5.0,
+        indent: Optional[int] = None,
+    ) -> None:
+        """Initialize the store; the file is read on first use.
+
+        Args:
+            file_name: Name of the file in the config directory.
+            merge: Function merging changes into data in place.
+            description: What the file holds, for log messages.
+            flush_delay: Seconds between a recorded change and the write.
+            indent: Indentation of the written JSON, or None for compact.
+        """
+        self.path = CONFIG_DIR / file_name
+        self.description = description
+        self.flush_delay = flush_delay
+        self._merge = merge
+        self._indent = indent
+        self._data: Optional[Dict] = None
+        self._pending: Dict = {}
+        self._lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
+
+    @property
+    def data(self) -> Dict:
+        """The file content with the pending changes, read on first use."""
+        if self._data is None:
+            logger.debug("Loading {} from: {}", self.description, self.path)
+            self._data = self._read()
+        return self._data
+
+    def _read(self) -> Dict:
+        """Read the file, empty if missing or invalid."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error("Failed to load {}: {}", self.description, e)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, data: Dict) -> None:
+        """Atomically replace the file with the given data."""
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.stem}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=self._indent)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def add(self, changes: Dict) -> None:
+        """Record changes in memory and schedule their write.
+
+        Args:
+            changes: Changes to merge into the data and the file.
+        """
+        with self._lock:
+            self._merge(self.data, changes)
+            self._merge(self._pending, changes)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_delay, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write the pending changes to the file.
+
+        Holds an exclusive lock on a sidecar lock file while merging the
+        pending changes into the file's current content, then replaces the
+        file atomically (temporary file + rename). Does nothing when nothing
+        was recorded since the last flush.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        logger.debug("Saving {} to: {}", self.description, self.path)
+        lock_path = self.path.with_name(self.path.name + ".lock")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                data = self._read()
+                self._merge(data, pending)
+                self._write(data)
+        except OSError as e:
+            logger.error("Failed to save {}: {}", self.description, e)
+            with self._lock:
+                self._merge(self._pending, pending)
+            return
+
+        # Pick up changes written by other processes in the meantime
+        with self._lock:
+            self._merge(data, self._pending)
+            self._data = data
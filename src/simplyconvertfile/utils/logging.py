@@ -4,17 +4,25 @@ Conditional logging utilities for the file converter.
 
 This module provides lightweight logging functionality that activates
 only when a DEBUG file exists in the user configuration directory.
-When enabled, log messages are printed to stdout with color coding
-by log level. When disabled, all logging operations are no-ops for
+When enabled, log messages are written to stdout with color coding
+by log level, or to a rotating log file when the DEBUG file contains
+a path. When disabled, all logging operations are no-ops for
 optimal performance.
 
 The logging system is designed to have zero performance impact when
-debugging is not active, making it safe to include in production code.
+debugging is not active, making it safe to include in production code:
+the logging methods are replaced by a no-op function, and expensive
+arguments can be wrapped in Deferred so they are only computed when a
+message is actually written.
 """
 
+import atexit
 import contextlib
-from functools import lru_cache
+import os
+import sys
+import threading
 from pathlib import Path
+from typing import Any, Callable, Optional, TextIO
 
 
 class LogColors:
@@ -29,59 +37,170 @@ class LogColors:
     CRITICAL = "\033[31;1m"  # Red + Bold
 
 
+class Deferred:
+    """Log argument computed only when the message is formatted.
+
+    Examples:
+        >>> logger.debug("Tree: {}", Deferred(lambda: render_tree(root)))
+    """
+
+    __slots__ = ("_func",)
+
+    def __init__(self, func: Callable[[], Any]) -> None:
+        """Wrap a function returning the argument value.
+
+        Args:
+            func: Called without arguments when the message is formatted.
+        """
+        self._func = func
+
+    def __format__(self, format_spec: str) -> str:
+        """Compute the value and format it."""
+        return format(self._func(), format_spec)
+
+    def __str__(self) -> str:
+        """Compute the value and convert it to a string."""
+        return str(self._func())
+
+
+class LogFileSink:
+    """Buffered log file rotated when it grows too large.
+
+    Writes go through a regular buffered file object and are flushed for
+    error messages and at exit, instead of one unbuffered write per message.
+
+    Attributes:
+        path: Path of the active log file.
+
+    Class Attributes:
+        MAX_BYTES: Size from which the file is rotated.
+        BACKUP_COUNT: Number of rotated files kept (path.1, path.2, ...).
+
+    Examples:
+        >>> sink = LogFileSink(Path("/tmp/simplyconvertfile.log"))
+        >>> sink.write("[INFO]: Started\\n", flush=False)
+    """
+
+    MAX_BYTES = 5 * 1024 * 1024
+    BACKUP_COUNT = 3
+
+    def __init__(self, path: Path) -> None:
+        """Open the log file for appending.
+
+        Args:
+            path: Log file path; its directory is created if needed.
+
+        Raises:
+            OSError: If the file cannot be opened.
+        """
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._stream: TextIO = open(self.path, "a", encoding="utf-8")
+        self._size = self._stream.tell()
+
+    def write(self, entry: str, flush: bool) -> None:
+        """Append an entry, rotating the file first if it is full.
+
+        Args:
+            entry: Complete log line, including the newline.
+            flush: Whether to flush the buffer after writing.
+        """
+        with self._lock:
+            if self._size + len(entry) > self.MAX_BYTES:
+                self._rotate()
+            self._stream.write(entry)
+            self._size += len(entry)
+            if flush:
+                self._stream.flush()
+
+    def flush(self) -> None:
+        """Flush buffered entries to disk."""
+        with self._lock:
+            self._stream.flush()
+
+    def _rotate(self) -> None:
+        """Shift path -> path.1 -> path.2 ... and start a new file."""
+        self._stream.close()
+        for index in range(self.BACKUP_COUNT - 1, 0, -1):
+            with contextlib.suppress(OSError):
+                os.replace(f"{self.path}.{index}", f"{self.path}.{index + 1}")
+        with contextlib.suppress(OSError):
+            os.replace(self.path, f"{self.path}.1")
+        self._stream = open(self.path, "a", encoding="utf-8")
+        self._size = 0
+
+
 class Logger:
     """Conditional logger activated by DEBUG file presence.
 
-    The logger checks for the existence of a DEBUG file in the user config
-    directory (~/.config/simplyconvertfile/DEBUG). When present, it
-    prints formatted log messages to stdout with color coding by log level:
+    The logger checks once for a DEBUG file in the user config directory
+    (~/.config/simplyconvertfile/DEBUG). When present, it writes formatted
+    log messages with the level in brackets:
     - DEBUG: Cyan
     - INFO: Green
     - WARNING: Yellow
     - ERROR: Red
     - CRITICAL: Red (bold)
 
-    When absent, all logging methods become no-ops.
+    Messages go to stdout (colored), or to a rotating log file when the
+    DEBUG file contains a path on its first line.
 
-    This design ensures debugging can be enabled on-demand without
-    performance penalties in normal operation.
+    When absent, all logging methods are replaced by a no-op function, so a
+    disabled call costs one attribute lookup and one empty call. Arguments
+    are still evaluated by the caller: pass objects rather than derived
+    strings, wrap expensive values in Deferred, or test ``logger.enabled``.
 
     Attributes:
+        enabled: Whether log messages are written.
         _debug_file_path: Path to the DEBUG trigger file.
 
     Examples:
         >>> logger = Logger()
         >>> logger.debug("Processing file: {}", "example.jpg")
-        >>> logger.error("Conversion failed: {}", str(error))
+        >>> logger.error("Conversion failed: {}", error)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, enabled: Optional[bool] = None) -> None:
         """Initialize the conditional logger.
 
-        Sets up the path to the DEBUG trigger file.
+        Checks the DEBUG trigger file and sets up the output sink.
+
+        Args:
+            enabled: Force logging on or off instead of checking the
+                    DEBUG file (used by benchmarks).
         """
         config_dir = Path.home() / ".config" / "simplyconvertfile"
         self._debug_file_path = config_dir / "DEBUG"
+        self._file_sink: Optional[LogFileSink] = None
 
-    @lru_cache(maxsize=1)
-    def _is_debug_enabled(self) -> bool:
-        """Check if debug logging is currently enabled.
-
-        Uses functools.lru_cache to memoize the result of checking
-        whether the DEBUG file exists. This provides efficient caching
-        with a built-in Python mechanism.
+        self.enabled = self._debug_file_path.exists() if enabled is None else enabled
+        if not self.enabled:
+            self.debug = self.info = self.warning = _discard  # type: ignore
+            self.error = self.critical = _discard  # type: ignore
+            return
 
-        Returns:
-            bool: True if DEBUG file exists and logging is active.
-        """
-        return self._debug_file_path.exists()
+        log_file = self._get_log_file() if enabled is None else None
+        if log_file:
+            with contextlib.suppress(OSError):
+                self._file_sink = LogFileSink(log_file)
+                atexit.register(self._file_sink.flush)
+
+    def _get_log_file(self) -> Optional[Path]:
+        """Get the log file path written in the DEBUG file, if any."""
+        with contextlib.suppress(OSError, UnicodeDecodeError):
+            first_line = self._debug_file_path.read_text(encoding="utf-8")
+            first_line = first_line.strip().split("\n", 1)[0].strip()
+            if first_line:
+                return Path(first_line).expanduser()
+        return None
 
     def _print_log_message(self, level: str, message: str, *args) -> None:
-        """Print a formatted log message to stdout with color coding.
+        """Write a formatted log message to the log file or stdout.
 
-        Formats the message with provided arguments and prints it to stdout
-        with a colored log level prefix in brackets. Only prints
-        when debugging is enabled.
+        Formats the message with provided arguments and writes it with the
+        log level in brackets (colored on stdout). Entries are buffered;
+        ERROR and CRITICAL messages flush the output immediately.
 
         Args:
             level: Log level string (e.g., 'DEBUG', 'INFO', 'ERROR').
@@ -89,22 +208,26 @@ class Logger:
             *args: Arguments to format into the message.
 
         Note:
-            Silently ignores any formatting or printing errors to prevent
+            Silently ignores any formatting or writing errors to prevent
             logging failures from disrupting the main application flow.
             Only the [LEVEL] part is colored, the message uses default color.
         """
-        if not self._is_debug_enabled():
-            return
-
         with contextlib.suppress(Exception):
             if args:
                 formatted_message = message.format(*args)
             else:
                 formatted_message = message
 
+            flush = level in ("ERROR", "CRITICAL")
+            if self._file_sink:
+                self._file_sink.write(f"[{level}]: {formatted_message}\n", flush)
+                return
+
             color = getattr(LogColors, level, LogColors.RESET)
             log_entry = f"{color}[{level}]{LogColors.RESET}: {formatted_message}\n"
-            print(log_entry, end="")
+            sys.stdout.write(log_entry)
+            if flush:
+                sys.stdout.flush()
 
     def debug(self, message: str, *args) -> None:
         """Log a debug-level message.
@@ -165,7 +288,7 @@ class Logger:
             *args: Arguments to format into the message.
 
         Examples:
-            >>> logger.error("Conversion failed: {}", str(error))
+            >>> logger.error("Conversion failed: {}", error)
             >>> logger.error("Invalid format: {}", extension)
         """
         self._print_log_message("ERROR", message, *args)
@@ -188,4 +311,8 @@ class Logger:
         self._print_log_message("CRITICAL", message, *args)
 
 
+def _discard(message: str, *args) -> None:
+    """Logging method used while logging is disabled."""
+
+
 logger = Logger()
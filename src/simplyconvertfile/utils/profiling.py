@@ -0,0 +1,235 @@
+#!/usr/bin/python3
+"""
+Cold-start profiling utilities.
+
+This module provides an opt-in profiler used to diagnose slow startups and
+conversions. It is enabled with ``--profile PATH`` on the command line or
+the ``SCF_PROFILE`` environment variable (useful for the Nemo action).
+
+When active it collects:
+- A cProfile profile of the main thread and every thread started while
+  profiling (a single process-wide profile from Python 3.12), dumped in pstats format (loadable in snakeviz).
+- Import-time timings for every module imported while profiling.
+- Milestone timings such as the first GTK dialog and the first subprocess
+  spawn, stored next to the profile as ``PATH.timings.json``.
+
+When disabled, all operations are no-ops.
+"""
+
+import builtins
+import contextlib
+import cProfile
+import importlib.util
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from simplyconvertfile.utils.logging import logger
+
+# From Python 3.12 cProfile uses sys.monitoring, which profiles every thread
+# and allows a single active profile per process
+PROCESS_WIDE_PROFILE = sys.version_info >= (3, 12)
+
+
+class Profiler:
+    """Opt-in cProfile wrapper with import and milestone timings.
+
+    Attributes:
+        ENV_VAR: Environment variable holding the profile output path.
+        _output_path: Path where the profile is dumped, None when disabled.
+        _profile: Profile of the thread that started profiling.
+        _thread_profiles: Profiles of threads started while profiling.
+        _marks: First occurrence time of each milestone, relative to start.
+        _imports: Import timings collected while profiling.
+
+    Examples:
+        >>> profiler.start("/tmp/scf.prof")
+        >>> profiler.mark("first_dialog")
+        >>> profiler.stop()
+    """
+
+    ENV_VAR = "SCF_PROFILE"
+
+    def __init__(self) -> None:
+        """Initialize a disabled profiler."""
+        self._output_path: Optional[Path] = None
+        self._profile: Optional[cProfile.Profile] = None
+        self._thread_profiles: List[cProfile.Profile] = []
+        self._marks: Dict[str, float] = {}
+        self._imports: List[Dict[str, Union[str, float, int]]] = []
+        self._start_time = 0.0
+        self._process_age_at_start: Optional[float] = None
+        self._original_import = None
+        self._import_depth = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether profiling is currently active."""
+        return self._output_path is not None
+
+    def start(self, output_path: Union[str, Path]) -> None:
+        """Start profiling, writing results to ``output_path`` on stop.
+
+        Args:
+            output_path: Destination of the pstats profile dump.
+        """
+        if self.enabled:
+            return
+
+        self._output_path = Path(output_path).expanduser()
+        self._start_time = time.perf_counter()
+        self._process_age_at_start = self._get_process_age()
+        self._marks = {}
+        self._imports = []
+        self._thread_profiles = []
+        logger.info("Profiling enabled, writing to {}", self._output_path)
+
+        self._install_import_hook()
+        if not PROCESS_WIDE_PROFILE:
+            threading.setprofile(self._profile_new_thread)
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def mark(self, name: str) -> None:
+        """Record the first occurrence of a milestone.
+
+        Args:
+            name: Milestone name (e.g. "first_dialog").
+        """
+        if self._output_path is None or name in self._marks:
+            return
+        self._marks[name] = time.perf_counter() - self._start_time
+
+    def stop(self) -> Optional[Path]:
+        """Stop profiling and dump the collected data.
+
+        Returns:
+            Optional[Path]: Path of the written profile, or None if profiling
+                           was not active or the dump failed.
+        """
+        if not self.enabled or self._profile is None:
+            return None
+
+        self._profile.disable()
+        threading.setprofile(None)
+        self._remove_import_hook()
+        self.mark("exit")
+
+        output_path = self._output_path
+        self._output_path = None
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            stats = pstats.Stats(self._profile)
+            for thread_profile in self._thread_profiles:
+                stats.add(thread_profile)
+            stats.dump_stats(str(output_path))
+
+            timings_path = output_path.with_name(output_path.name + ".timings.json")
+            timings_path.write_text(
+                json.dumps(self._build_timings(), indent=2), encoding="utf-8"
+            )
+            logger.info("Profile written to {} ({})", output_path, timings_path.name)
+            return output_path
+        except Exception as e:
+            logger.error("Failed to write profile {}: {}", output_path, e)
+            return None
+
+    def _build_timings(self) -> Dict[str, object]:
+        """Build the timings document stored next to the profile."""
+        marks = dict(self._marks)
+        timings: Dict[str, object] = {
+            "process_age_at_start_s": self._process_age_at_start,
+            "marks_s": marks,
+            "imports": sorted(
+                self._imports, key=lambda item: item["seconds"], reverse=True
+            ),
+        }
+        if "first_dialog" in marks and "first_subprocess_spawn" in marks:
+            timings["first_dialog_to_first_spawn_s"] = (
+                marks["first_subprocess_spawn"] - marks["first_dialog"]
+            )
+        return timings
+
+    def _profile_new_thread(self, *args) -> None:
+        """Start a dedicated profile in a thread created while profiling.
+
+        Installed through threading.setprofile, so it runs once as the
+        first profile event of each new thread and then replaces itself
+        with a cProfile profile for that thread.
+        """
+        sys.setprofile(None)
+        thread_profile = cProfile.Profile()
+        try:
+            thread_profile.enable()
+        except ValueError as e:
+            # Another profiler is active; the thread must still run its target
+            logger.debug("Thread not profiled: {}", e)
+            return
+        with self._lock:
+            self._thread_profiles.append(thread_profile)
+
+    def _install_import_hook(self) -> None:
+        """Wrap builtins.__import__ to time newly imported modules."""
+        self._original_import = builtins.__import__
+        original_import = self._original_import
+        timed_modules = set()
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            module_name = name
+            if level:
+                with contextlib.suppress(Exception):
+                    module_name = importlib.util.resolve_name(
+                        "." * level + name, (globals or {}).get("__package__")
+                    )
+            if module_name in sys.modules or module_name in timed_modules:
+                return original_import(name, globals, locals, fromlist, level)
+
+            timed_modules.add(module_name)
+            depth = getattr(self._import_depth, "value", 0)
+            self._import_depth.value = depth + 1
+            start = time.perf_counter()
+            try:
+                return original_import(name, globals, locals, fromlist, level)
+            finally:
+                self._import_depth.value = depth
+                self._imports.append(
+                    {
+                        "module": module_name,
+                        "seconds": time.perf_counter() - start,
+                        "depth": depth,
+                    }
+                )
+
+        builtins.__import__ = timed_import
+
+    def _remove_import_hook(self) -> None:
+        """Restore the original builtins.__import__."""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    @staticmethod
+    def _get_process_age() -> Optional[float]:
+        """Return seconds elapsed since the process started, if available.
+
+        Covers the interpreter startup and the imports that happened before
+        profiling could be enabled. Linux-only (reads /proc).
+        """
+        try:
+            with open("/proc/self/stat", encoding="utf-8") as stat_file:
+                fields = stat_file.read().rsplit(")", 1)[1].split()
+            with open("/proc/uptime", encoding="utf-8") as uptime_file:
+                uptime = float(uptime_file.read().split()[0])
+            start_ticks = int(fields[19])
+            return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+        except (OSError, ValueError, IndexError):
+            return None
+
+
+profiler = Profiler()
@@ -0,0 +1,206 @@
+#!/usr/bin/python3
+"""
+Progress model shared between worker threads and the progress dialog.
+
+Workers record progress in a ProgressModel without taking any lock: every
+update is a single dict or set operation, which is atomic in CPython, and
+bumps a revision number. The GTK side reads the model through a
+ProgressDisplay, called from the dialog's periodic timeout, which pushes
+values to the widgets only when they changed and at most ``max_fps`` times
+per second, whatever the number of jobs or the timeout frequency.
+
+This module does not import GTK: the display only needs an object with a
+``progressbar`` (``set_fraction``/``pulse``) and a ``set_message`` method,
+such as ProgressbarDialogWindow.
+"""
+
+import itertools
+import time
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Set, Tuple
+
+
+class ProgressSnapshot(NamedTuple):
+    """Progress values to display.
+
+    Attributes:
+        fraction: Overall progress between 0.0 and 1.0.
+        message: Message of the most recently started running job, or None.
+        finished: Number of finished jobs.
+        total: Total number of jobs.
+    """
+
+    fraction: float
+    message: Optional[str]
+    finished: int
+    total: int
+
+
+class ProgressModel:
+    """Progress of one or more jobs, updated by workers without locks.
+
+    Attributes:
+        total: Total number of jobs.
+        revision: Changes on every update; readers compare it with the value
+                 they last saw to skip unchanged models.
+
+    Examples:
+        >>> model = ProgressModel(total=2)
+        >>> model.start_job(0, "Converting a.jpg")
+        >>> model.update_job(0, 0.5)
+        >>> model.snapshot().fraction
+        0.25
+    """
+
+    def __init__(self, total: int = 1) -> None:
+        """Initialize an empty model.
+
+        Args:
+            total: Total number of jobs (at least 1).
+        """
+        self.total = max(total, 1)
+        self._revisions = itertools.count(1)
+        self.revision = 0
+        # job id -> (fraction, message); insertion order is start order
+        self._running: Dict[Hashable, Tuple[float, Optional[str]]] = {}
+        self._finished: Set[Hashable] = set()
+
+    def start_job(self, job_id: Hashable, message: Optional[str] = None) -> None:
+        """Mark a job as running.
+
+        Args:
+            job_id: Identifier of the job, unique within the model.
+            message: Message to display while the job runs.
+        """
+        self._running[job_id] = (0.0, message)
+        self.revision = next(self._revisions)
+
+    def update_job(
+        self, job_id: Hashable, fraction: float, message: Optional[str] = None
+    ) -> None:
+        """Record the progress of a running job.
+
+        Args:
+            job_id: Identifier given to start_job.
+            fraction: Progress of the job between 0.0 and 1.0.
+            message: New message, or None to keep the current one.
+        """
+        current = self._running.get(job_id)
+        if current is None:
+            return
+        self._running[job_id] = (fraction, message or current[1])
+        self.revision = next(self._revisions)
+
+    def finish_job(self, job_id: Hashable) -> None:
+        """Mark a job as finished, whatever its outcome.
+
+        Args:
+            job_id: Identifier given to start_job.
+        """
+        self._finished.add(job_id)
+        self._running.pop(job_id, None)
+        self.revision = next(self._revisions)
+
+    def snapshot(self) -> ProgressSnapshot:
+        """Get the current progress values.
+
+        Returns:
+            ProgressSnapshot: Overall fraction, message and job counts.
+        """
+        running = self._running.copy()
+        finished = len(self._finished)
+        partial = sum(fraction for fraction, _ in running.values())
+        message = next(
+            (message for _, message in reversed(running.values()) if message), None
+        )
+        return ProgressSnapshot(
+            min((finished + partial) / self.total, 1.0),
+            message,
+            finished,
+            self.total,
+        )
+
+
+class ProgressDisplay:
+    """Pushes a ProgressModel to a progress window at a capped rate.
+
+    Must be called from the GTK main thread (typically the progress dialog's
+    timeout callback). Only changed values are sent to the widgets.
+
+    Attributes:
+        MAX_FPS: Default maximum number of refreshes per second.
+        FRACTION_STEP: Smallest fraction change worth redrawing the bar.
+        updates: Number of widget calls made so far.
+
+    Examples:
+        >>> display = ProgressDisplay(window, model)
+        >>> display.refresh()  # From the dialog timeout
+    """
+
+    MAX_FPS = 20
+    FRACTION_STEP = 0.001
+
+    def __init__(
+        self,
+        window: Any,
+        model: Optional[ProgressModel] = None,
+        max_fps: Optional[float] = None,
+    ) -> None:
+        """Initialize the display.
+
+        Args:
+            window: Object with ``progressbar`` and ``set_message``.
+            model: Model to display; None for pulse-only progress.
+            max_fps: Maximum refreshes per second (default: MAX_FPS).
+        """
+        self.window = window
+        self.model = model
+        self.updates = 0
+        self._interval = 1.0 / (max_fps or self.MAX_FPS)
+        self._last_refresh = 0.0
+        self._last_pulse = 0.0
+        self._revision = -1
+        self._fraction: Optional[float] = None
+        self._message: Optional[str] = None
+
+    def refresh(
+        self, format_message: Optional[Callable[[ProgressSnapshot], str]] = None
+    ) -> None:
+        """Push the model's values to the window if they changed.
+
+        Args:
+            format_message: Optional callable turning a ProgressSnapshot into
+                           the displayed message; by default the message of
+                           the running job is shown as is.
+        """
+        now = time.monotonic()
+        if self.model is None or now - self._last_refresh < self._interval:
+            return
+        revision = self.model.revision
+        if revision == self._revision:
+            return
+        self._last_refresh = now
+        self._revision = revision
+
+        snapshot = self.model.snapshot()
+        if (
+            self._fraction is None
+            or abs(snapshot.fraction - self._fraction) >= self.FRACTION_STEP
+        ):
+            self._fraction = snapshot.fraction
+            self.window.progressbar.set_fraction(snapshot.fraction)
+            self.updates += 1
+
+        message = format_message(snapshot) if format_message else snapshot.message
+        if message is not None and message != self._message:
+            self._message = message
+            self.window.set_message(message)
+            self.updates += 1
+
+    def pulse(self) -> None:
+        """Pulse the progress bar, at most ``max_fps`` times per second."""
+        now = time.monotonic()
+        if now - self._last_pulse < self._interval:
+            return
+        self._last_pulse = now
+        self.window.progressbar.pulse()
+        self.updates += 1
@@ -0,0 +1,240 @@
+#!/usr/bin/python3
+"""
+Recorded conversion timings and per-rule cost model.
+
+Every successful conversion records an ``(input size, wall time)`` sample
+for the rule that performed it (see RuleCandidate.key). A linear model
+``time = fixed + per_byte * size`` is fitted per rule on its most recent
+samples, and, when ``rule_timings.select_fastest`` is enabled, the rule with
+the lowest predicted time is used for each file among the rules able to do
+the conversion. Rules with too few samples are tried first, so every rule
+gets measured on this machine. Failed conversions are recorded too, as
+samples without a time: a rule that failed more often than it succeeded in
+its recent samples is no longer selected.
+
+Samples are kept in memory and written like usage statistics, a few seconds
+later or at exit (see JsonStore).
+"""
+
+from typing import Dict, List, Optional, Sequence, TypeVar
+
+from simplyconvertfile.config import settings_manager
+from simplyconvertfile.utils.json_store import JsonStore
+from simplyconvertfile.utils.logging import logger
+
+# [input size in bytes, wall time in seconds or None for a failed conversion]
+Sample = List[Optional[float]]
+Candidate = TypeVar("Candidate")
+
+
+def fit_cost_model(samples: Sequence[Sample]) -> Optional[tuple]:
+    """Fit ``time = fixed + per_byte * size`` by least squares.
+
+    Args:
+        samples: [size, seconds] pairs of successful conversions.
+
+    Returns:
+        Optional[tuple]: (fixed, per_byte), both non-negative, or None
+                        without samples. With a single input size, the
+                        model is the mean time.
+    """
+    if not samples:
+        return None
+    count = len(samples)
+    mean_size = sum(size for size, _ in samples) / count
+    mean_time = sum(seconds for _, seconds in samples) / count
+    variance = sum((size - mean_size) ** 2 for size, _ in samples)
+    if not variance:
+        return mean_time, 0.0
+    covariance = sum(
+        (size - mean_size) * (seconds - mean_time) for size, seconds in samples
+    )
+    per_byte = max(covariance / variance, 0.0)
+    fixed = max(mean_time - per_byte * mean_size, 0.0)
+    return fixed, per_byte
+
+
+class RuleTimings:
+    """Recorded conversion timings per rule.
+
+    The timings file maps rule keys to their most recent samples:
+    {
+        "DOCX>TXT:pandoc": [[input_size, seconds], [input_size, null], ...],
+        ...
+    }
+
+    A null time marks a failed conversion.
+
+    Attributes:
+        _store: The timings JSON file and its samples by rule key, loaded on
+               first use.
+
+    Class Attributes:
+        FLUSH_DELAY: Seconds between a recorded sample and the write.
+
+    Examples:
+        >>> rule_timings.record("DOCX>TXT:pandoc", 48213, 0.42)
+        >>> rule_timings.predict("DOCX>TXT:pandoc", 100000)
+        0.61
+    """
+
+    FLUSH_DELAY = 5.0
+
+    def __init__(self) -> None:
+        """Initialize the store; the file is read on first use."""
+        self._store = JsonStore(
+            "rule_timings.json",
+            self._merge_samples,
+            "rule timings",
+            flush_delay=self.FLUSH_DELAY,
+        )
+
+    @property
+    def settings(self) -> dict:
+        """The ``rule_timings`` settings section."""
+        return settings_manager.get("rule_timings", {})
+
+    @property
+    def max_samples(self) -> int:
+        """Number of most recent samples kept per rule."""
+        return max(int(self.settings.get("max_samples", 50)), 1)
+
+    def _get_samples(self) -> Dict[str, List[Sample]]:
+        """Get the samples, reading the timings file on first use."""
+        return self._store.data
+
+    def flush(self) -> None:
+        """Write the pending samples to the timings file.
+
+        Returns:
+            None
+        """
+        self._store.flush()
+
+    def _merge_samples(
+        self, timings: Dict[str, List[Sample]], samples: Dict[str, List[Sample]]
+    ) -> None:
+        """Append samples to timings in place, keeping the most recent ones."""
+        for key, rule_samples in samples.items():
+            merged = timings.get(key, []) + rule_samples
+            timings[key] = merged[-self.max_samples :]
+
+    def record(self, key: str, input_size: int, seconds: float) -> None:
+        """Record the wall time of a successful conversion.
+
+        Args:
+            key: Key of the rule that performed the conversion.
+            input_size: Size of the input file in bytes.
+            seconds: Wall time of the conversion command.
+        """
+        if not self.settings.get("enabled", True):
+            return
+        logger.debug("Recording {:.3f}s for {} ({} bytes)", seconds, key, input_size)
+        self._add_sample(key, [input_size, round(seconds, 4)])
+
+    def record_failure(self, key: str, input_size: int) -> None:
+        """Record a failed conversion, so a failing rule stops being selected.
+
+        Args:
+            key: Key of the rule that failed.
+            input_size: Size of the input file in bytes.
+        """
+        if not self.settings.get("enabled", True):
+            return
+        logger.debug("Recording failure of {} ({} bytes)", key, input_size)
+        self._add_sample(key, [input_size, None])
+
+    def _add_sample(self, key: str, rule_sample: Sample) -> None:
+        """Add a sample to the loaded and pending samples, scheduling a flush."""
+        self._store.add({key: [rule_sample]})
+
+    def _get_timed_samples(self, key: str) -> List[Sample]:
+        """Get the samples of a rule's successful conversions."""
+        samples = self._get_samples().get(key, ())
+        return [sample for sample in samples if sample[1] is not None]
+
+    def get_sample_count(self, key: str) -> int:
+        """Get the number of successful conversions recorded for a rule."""
+        return len(self._get_timed_samples(key))
+
+    def get_failure_count(self, key: str) -> int:
+        """Get the number of failed conversions recorded for a rule."""
+        samples = self._get_samples().get(key, ())
+        return sum(1 for sample in samples if sample[1] is None)
+
+    def predict(self, key: str, input_size: int) -> Optional[float]:
+        """Predict the wall time of a rule for an input size.
+
+        Args:
+            key: Rule key.
+            input_size: Size of the input file in bytes.
+
+        Returns:
+            Optional[float]: Predicted seconds, or None without samples.
+        """
+        model = fit_cost_model(self._get_timed_samples(key))
+        if model is None:
+            return None
+        fixed, per_byte = model
+        return fixed + per_byte * input_size
+
+    def select_rule(
+        self, candidates: Sequence[Candidate], input_size: int
+    ) -> Candidate:
+        """Choose the rule to use for a file among valid candidates.
+
+        Without ``rule_timings.select_fastest``, the first candidate is used.
+        Otherwise candidates that failed more often than they succeeded are
+        left out (the first candidate is used if all of them are), candidates
+        with fewer than ``min_samples`` samples are tried first (the least
+        measured one), then the candidate with the lowest predicted time wins.
+
+        Args:
+            candidates: Non-empty sequence of objects with a ``key`` attribute,
+                       in default order.
+            input_size: Size of the input file in bytes.
+
+        Returns:
+            Candidate: The chosen candidate.
+        """
+        settings = self.settings
+        if len(candidates) == 1 or not settings.get("select_fastest", False):
+            return candidates[0]
+
+        failing = [
+            candidate
+            for candidate in candidates
+            if self.get_failure_count(candidate.key)
+            > self.get_sample_count(candidate.key)
+        ]
+        if failing:
+            logger.debug(
+                "Skipping failing rules: {}", [candidate.key for candidate in failing]
+            )
+            candidates = [
+                candidate for candidate in candidates if candidate not in failing
+            ] or failing[:1]
+            if len(candidates) == 1:
+                return candidates[0]
+
+        min_samples = int(settings.get("min_samples", 3))
+        counts = [self.get_sample_count(candidate.key) for candidate in candidates]
+        if min(counts) < min_samples:
+            chosen = candidates[counts.index(min(counts))]
+            logger.debug("Measuring rule {} ({} samples)", chosen.key, min(counts))
+            return chosen
+
+        predictions = [
+            self.predict(candidate.key, input_size) for candidate in candidates
+        ]
+        chosen = candidates[predictions.index(min(predictions))]
+        logger.debug(
+            "Fastest rule for {} bytes: {} ({:.3f}s predicted)",
+            input_size,
+            chosen.key,
+            min(predictions),
+        )
+        return chosen
+
+
+rule_timings = RuleTimings()
@@ -0,0 +1,421 @@
+#!/usr/bin/python3
+"""
+Content sniffing (magic bytes) for format detection.
+
+This module recognizes the real format of a file from the first few KB of
+its content, so files with a misleading extension (a ``.jpg`` that is really
+WebP, an ``.mp4`` that is really Matroska) can be rerouted to the right
+conversion rule or rejected before any tool runs.
+
+Only binary formats with a reliable signature are recognized. Text formats
+(the DATA and MARKUP groups, CSV and SVG) and formats without a signature
+near the start of the file (ISO, DMG, generic RAW) are never sniffed, so
+their extension is always trusted. MPEG audio without an ID3 tag is only
+recognized from two consecutive valid frame headers.
+"""
+
+import os
+import stat
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from simplyconvertfile.config import format_config
+from simplyconvertfile.utils.logging import logger
+
+# Bytes read from the start of each file
+HEADER_SIZE = 8192
+
+# Extensions whose content is never sniffed: no usable signature at offset 0,
+# or text that can start with any bytes (a UTF-16 byte order mark looks like
+# an MPEG audio frame sync)
+UNSNIFFED_FORMATS = frozenset({"CSV", "DMG", "ISO", "RAW", "SVG"})
+UNSNIFFED_GROUPS = frozenset({"DATA", "MARKUP"})
+
+
+class SniffResult(NamedTuple):
+    """Format recognized from a file's content.
+
+    Attributes:
+        format: Detected format, or None if the content is ambiguous
+               (e.g. an OLE2 container can be DOC, XLS or PPT).
+        family: Extensions consistent with the content.
+    """
+
+    format: Optional[str]
+    family: FrozenSet[str]
+
+
+def _result(format_name: Optional[str], *family: str) -> SniffResult:
+    """Build a SniffResult whose family includes the detected format."""
+    members = set(family)
+    if format_name:
+        members.add(format_name)
+    return SniffResult(format_name, frozenset(members))
+
+
+ISO_MEDIA_FAMILY = ("MP4", "M4V", "M4A", "MOV", "ALAC")
+ZIP_FAMILY = ("ZIP", "DOCX", "XLSX", "PPTX", "EPUB", "ODT", "ODS", "ODP")
+OPEN_DOCUMENT_TYPES = {
+    b"application/epub+zip": "EPUB",
+    b"application/vnd.oasis.opendocument.text": "ODT",
+    b"application/vnd.oasis.opendocument.spreadsheet": "ODS",
+    b"application/vnd.oasis.opendocument.presentation": "ODP",
+}
+HEIF_BRANDS = {b"heic", b"heix", b"hevc", b"heim", b"heis", b"hevm", b"hevs"}
+BMP_HEADER_SIZES = {12, 40, 52, 56, 64, 108, 124}
+
+
+def _sniff_iso_media(header: bytes) -> Optional[SniffResult]:
+    """Recognize ISO base media files (MP4, MOV, M4A, HEIC, AVIF)."""
+    if header[4:8] != b"ftyp":
+        return None
+    box_size = int.from_bytes(header[0:4], "big")
+    major_brand = header[8:12]
+    compatible_brands = {
+        header[offset : offset + 4]
+        for offset in range(16, min(box_size, len(header)) - 3, 4)
+    }
+    brands = {major_brand} | compatible_brands
+
+    if major_brand in (b"avif", b"avis"):
+        return _result("AVIF")
+    if brands & HEIF_BRANDS:
+        return _result("HEIC", "HEIF")
+    if major_brand in (b"mif1", b"msf1"):
+        return _result("HEIF", "HEIC", "AVIF")
+    if major_brand == b"qt  ":
+        return _result("MOV", *ISO_MEDIA_FAMILY)
+    if major_brand in (b"M4A ", b"M4B "):
+        return _result("M4A", *ISO_MEDIA_FAMILY)
+    return _result("MP4", *ISO_MEDIA_FAMILY)
+
+
+def _sniff_riff(header: bytes) -> Optional[SniffResult]:
+    """Recognize RIFF containers (WAV, AVI, WEBP)."""
+    if header[:4] != b"RIFF":
+        return None
+    return {
+        b"WAVE": _result("WAV"),
+        b"AVI ": _result("AVI"),
+        b"WEBP": _result("WEBP"),
+    }.get(header[8:12])
+
+
+def _sniff_matroska(header: bytes) -> Optional[SniffResult]:
+    """Recognize Matroska and WebM from the EBML DocType."""
+    if header[:4] != b"\x1a\x45\xdf\xa3":
+        return None
+    if b"webm" in header[:64]:
+        return _result("WEBM", "MKV", "MKA")
+    return _result("MKV", "MKA", "WEBM")
+
+
+def _sniff_zip(header: bytes) -> Optional[SniffResult]:
+    """Recognize ZIP and the document formats stored as ZIP containers."""
+    if header[:4] != b"PK\x03\x04":
+        return None
+    # OpenDocument and EPUB store an uncompressed "mimetype" entry first
+    name_length = int.from_bytes(header[26:28], "little")
+    extra_length = int.from_bytes(header[28:30], "little")
+    if header[30 : 30 + name_length] == b"mimetype":
+        start = 30 + name_length + extra_length
+        content = header[start : start + 64]
+        for mime_type, format_name in OPEN_DOCUMENT_TYPES.items():
+            if content.startswith(mime_type):
+                return _result(format_name)
+    return _result("ZIP", *ZIP_FAMILY)
+
+
+# MPEG audio bitrates (kbit/s) by (MPEG-1, layer), index 1-14
+MPEG_BITRATES = {
+    (True, 1): (32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+MPEG_BITRATES[(False, 3)] = MPEG_BITRATES[(False, 2)]
+# Sample rates by version bits (0: MPEG-2.5, 2: MPEG-2, 3: MPEG-1)
+MPEG_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+
+def _get_mpeg_frame_length(header: bytes, offset: int) -> Optional[int]:
+    """Get the length of the MP3 frame at an offset, if its header is valid.
+
+    Args:
+        header: Leading bytes of the file.
+        offset: Offset of the frame header.
+
+    Returns:
+        Optional[int]: Frame length in bytes, or None if the bytes are not a
+                      valid frame header (reserved or free-format values).
+    """
+    frame = header[offset : offset + 4]
+    if len(frame) < 4 or frame[0] != 0xFF or frame[1] & 0xE0 != 0xE0:
+        return None
+    version = (frame[1] >> 3) & 0x03
+    layer = 4 - ((frame[1] >> 1) & 0x03)
+    bitrate_index = frame[2] >> 4
+    rate_index = (frame[2] >> 2) & 0x03
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = MPEG_BITRATES[(mpeg1, layer)][bitrate_index - 1] * 1000
+    sample_rate = MPEG_SAMPLE_RATES[version][rate_index]
+    padding = (frame[2] >> 1) & 0x01
+    if layer == 1:
+        return (12 * bitrate // sample_rate + padding) * 4
+    if layer == 3 and not mpeg1:
+        return 72 * bitrate // sample_rate + padding
+    return 144 * bitrate // sample_rate + padding
+
+
+def _get_adts_frame_length(header: bytes, offset: int) -> Optional[int]:
+    """Get the length of the ADTS (AAC) frame at an offset, if valid.
+
+    Args:
+        header: Leading bytes of the file.
+        offset: Offset of the frame header.
+
+    Returns:
+        Optional[int]: Frame length in bytes, or None if the bytes are not a
+                      valid ADTS header.
+    """
+    frame = header[offset : offset + 7]
+    if len(frame) < 7 or frame[0] != 0xFF or frame[1] & 0xF6 != 0xF0:
+        return None
+    if (frame[2] >> 2) & 0x0F > 12:
+        return None
+    length = (frame[3] & 0x03) << 11 | frame[4] << 3 | frame[5] >> 5
+    return length if length >= 7 else None
+
+
+def _sniff_mpeg_audio(header: bytes) -> Optional[SniffResult]:
+    """Recognize MP3 (optionally behind an ID3v2 tag) and ADTS AAC."""
+    if header[:3] == b"ID3" and len(header) >= 10:
+        tag_size = 10 + (
+            (header[6] & 0x7F) << 21
+            | (header[7] & 0x7F) << 14
+            | (header[8] & 0x7F) << 7
+            | (header[9] & 0x7F)
+        )
+        if tag_size + 4 <= len(header):
+            inner = sniff_header(header[tag_size:])
+            if inner:
+                return inner
+        # Tag larger than the header: ID3v2 is almost always MP3
+        return _result("MP3", "AAC", "FLAC")
+
+    # A frame sync alone also matches text (UTF-16 byte order mark), so the
+    # next frame must start where the first one ends
+    for get_frame_length, format_name in (
+        (_get_adts_frame_length, "AAC"),
+        (_get_mpeg_frame_length, "MP3"),
+    ):
+        length = get_frame_length(header, 0)
+        if length and get_frame_length(header, length):
+            return _result(format_name)
+    return None
+
+
+def _sniff_transport_stream(header: bytes) -> Optional[SniffResult]:
+    """Recognize MPEG transport streams (TS, and M2TS/MTS with timecodes)."""
+    if len(header) >= 377 and header[0] == header[188] == header[376] == 0x47:
+        return _result("TS", "MTS")
+    if len(header) >= 393 and header[4] == header[196] == header[388] == 0x47:
+        return _result("MTS", "TS")
+    return None
+
+
+def _sniff_other(header: bytes) -> Optional[SniffResult]:
+    """Recognize formats with a simple fixed signature."""
+    if header[:3] == b"\xff\xd8\xff":
+        return _result("JPEG", "JPG")
+    if header[:4] in (b"II*\x00", b"MM\x00*"):
+        if header[8:10] == b"CR":
+            return _result("CR2", "RAW", "TIFF", "TIF")
+        return _result("TIFF", "TIF", "RAW", "CR2")
+    if (
+        header[:2] == b"BM"
+        and int.from_bytes(header[14:18], "little") in BMP_HEADER_SIZES
+    ):
+        return _result("BMP")
+    if header[:4] == b"\x00\x00\x01\x00" and header[4:6] != b"\x00\x00":
+        return _result("ICO")
+    if header[:4] == b"FORM" and header[8:12] in (b"AIFF", b"AIFC"):
+        return _result("AIFF")
+    if header[:4] == b"OggS":
+        if b"OpusHead" in header[:128]:
+            return _result("OPUS", "OGG")
+        return _result("OGG", "OPUS")
+    if len(header) >= 262 and header[257:262] == b"ustar":
+        return _result("TAR")
+    if len(header) >= 68 and header[60:68] == b"BOOKMOBI":
+        return _result("MOBI")
+    return None
+
+
+# Signatures checked in order: (prefix, result) pairs first, then functions
+_PREFIX_SIGNATURES: List[Tuple[bytes, SniffResult]] = [
+    (b"\x89PNG\r\n\x1a\n", _result("PNG")),
+    (b"GIF87a", _result("GIF")),
+    (b"GIF89a", _result("GIF")),
+    (b"fLaC", _result("FLAC")),
+    (b"caff", _result("CAF")),
+    (b"\x0b\x77", _result("AC3")),
+    (b"\x30\x26\xb2\x75\x8e\x66\xcf\x11", _result(None, "WMV", "WMA")),
+    (b"\x00\x00\x01\xba", _result("MPEG", "MPG")),
+    (b"%PDF-", _result("PDF")),
+    (b"{\\rtf", _result("RTF")),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", _result(None, "DOC", "XLS", "PPT")),
+    (b"7z\xbc\xaf\x27\x1c", _result("7Z")),
+    (b"Rar!\x1a\x07", _result("RAR")),
+    (b"\x1f\x8b", _result("TAR.GZ", "TGZ")),
+    (b"BZh", _result("TAR.BZ2")),
+    (b"\xfd7zXZ\x00", _result("TAR.XZ")),
+    (b"\x89LZO\x00\r\n\x1a\n", _result("TAR.LZO")),
+    (b"]\x00\x00", _result("TAR.LZMA")),
+    (b"!<arch>\ndebian-binary", _result("DEB")),
+    (b"\xed\xab\xee\xdb", _result("RPM")),
+]
+
+_SNIFFERS: List[Callable[[bytes], Optional[SniffResult]]] = [
+    _sniff_iso_media,
+    _sniff_riff,
+    _sniff_matroska,
+    _sniff_zip,
+    _sniff_other,
+    _sniff_mpeg_audio,
+    _sniff_transport_stream,
+]
+
+
+def sniff_header(header: bytes) -> Optional[SniffResult]:
+    """Recognize a format from the first bytes of a file.
+
+    Args:
+        header: Leading bytes of the file (up to HEADER_SIZE).
+
+    Returns:
+        Optional[SniffResult]: The recognized format, or None if the content
+                              has no known signature.
+
+    Examples:
+        >>> sniff_header(b"RIFF\\x00\\x00\\x00\\x00WEBPVP8 ").format
+        'WEBP'
+    """
+    for prefix, result in _PREFIX_SIGNATURES:
+        if header.startswith(prefix):
+            return result
+    for sniffer in _SNIFFERS:
+        result = sniffer(header)
+        if result:
+            return result
+    return None
+
+
+class ContentSniffer:
+    """Sniffs file formats with a cache keyed by file identity.
+
+    Results are cached by (st_dev, st_ino, st_mtime_ns), so a file is read
+    at most once until it is modified, whatever path it is reached through.
+
+    Attributes:
+        CACHE_SIZE: Maximum number of cached results.
+
+    Examples:
+        >>> content_sniffer.get_mismatch(Path("photo.jpg"), "JPG")
+        SniffResult(format='WEBP', family=frozenset({'WEBP'}))
+    """
+
+    CACHE_SIZE = 4096
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._cache: "OrderedDict[Tuple[int, int, int], Optional[SniffResult]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def sniff(self, file_path: Path) -> Optional[SniffResult]:
+        """Recognize the format of a file from its content.
+
+        Args:
+            file_path: File to sniff.
+
+        Returns:
+            Optional[SniffResult]: The recognized format, or None if the file
+                                  is unreadable, not a regular file or has
+                                  no known signature.
+        """
+        try:
+            file_stat = os.stat(file_path)
+        except (OSError, ValueError):
+            return None
+        # Opening a FIFO would block until a writer appears
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+
+        key = (file_stat.st_dev, file_stat.st_ino, file_stat.st_mtime_ns)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        try:
+            fd = os.open(file_path, os.O_RDONLY | os.O_CLOEXEC)
+            try:
+                result = sniff_header(os.pread(fd, HEADER_SIZE, 0))
+            finally:
+                os.close(fd)
+        except OSError:
+            return None
+
+        with self._lock:
+            self._cache[key] = result
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    def get_mismatch(
+        self, file_path: Path, extension_format: str
+    ) -> Optional[SniffResult]:
+        """Check whether a file's content contradicts its extension.
+
+        Args:
+            file_path: File to check.
+            extension_format: Format derived from the file extension.
+
+        Returns:
+            Optional[SniffResult]: The recognized format when it does not match
+                                  the extension, None when it matches or the
+                                  content is not recognized.
+        """
+        if (
+            not extension_format
+            or extension_format in UNSNIFFED_FORMATS
+            or format_config.get_format_group(extension_format) in UNSNIFFED_GROUPS
+        ):
+            return None
+
+        result = self.sniff(file_path)
+        if result is None or extension_format in result.family:
+            return None
+
+        logger.debug(
+            "Content of {} does not match its extension: {} (detected {})",
+            file_path,
+            extension_format,
+            result.format or "/".join(sorted(result.family)),
+        )
+        return result
+
+
+content_sniffer = ContentSniffer()
@@ -147,6 +147,10 @@ class Text:
             "Add an extension (e.g., .jpg, .mp4, .pdf) to determine the format."
         )
         UNSUPPORTED_FORMAT_ERROR_MESSAGE = _("Unsupported file format: {extension}")
+        CONTENT_MISMATCH_MESSAGE = _(
+            "Content does not match the file extension:\n{path}\n\n"
+            "The file is named as {extension} but contains {detected} data."
+        )
         UNSUPPORTED_FORMAT_DETAILS_MESSAGE = _(
             "The file '{filename}' has an unsupported format ({extension}).\n\n"
             "This format is not recognized by the converter or the required "
@@ -226,6 +230,18 @@ class Text:
         TEMP_DIR_NOT_AVAILABLE_MESSAGE = _("Temporary directory not available")
         TEMP_DIR_DOES_NOT_EXIST_MESSAGE = _("Temporary directory does not exist")
         NO_ARCHIVE_TEMPLATE_MESSAGE = _("No archive template available in settings")
+        PREVIEW_UNSUPPORTED_SOURCE_MESSAGE = _(
+            "Previews can only be generated from images and videos, not {format} files"
+        )
+        PREVIEW_MISSING_OUTPUT_MESSAGE = _(
+            "The preview {file} was not created (is the video shorter than "
+            "previews.video_position?)"
+        )
+        LIBREOFFICE_OUTPUT_MISSING_MESSAGE = _(
+            "LibreOffice did not convert {file} (the file may be damaged, "
+            "password-protected or of another type than its extension)"
+        )
+        FAN_OUT_OUTPUT_MISSING_MESSAGE = _("ffmpeg finished without writing {file}")
         NO_CONTENTS_IN_ARCHIVE_MESSAGE = _("No contents found in extracted archive")
 
     class Operations:
@@ -236,6 +252,10 @@ class Text:
         CHAINED_COMMAND_STEP_FAILED_MESSAGE = _(
             "Step {step}/{total} failed.\n\nError: {error}\n\nCommand: {command}"
         )
+        PIPELINE_STAGE_FAILED_MESSAGE = _(
+            "Pipeline stage {stage}/{total} failed: {command}\n\n{error}"
+        )
+        CHANGE_DIRECTORY_FAILED_MESSAGE = _("Directory not found: {directory}")
         FILE_VALIDATION_FAILED_MESSAGE = _(
             "File validation failed: {file}\n\n"
             "The previous conversion step likely failed.\n\n"
@@ -274,6 +294,10 @@ class Text:
         BATCH_STEP_CONVERSION_STARTED_MESSAGE = _(
             "Converting {filename} to {extension}"
         )
+        BATCH_PROGRESS_TITLE = _("Converting to {extension}")
+        BATCH_PROGRESS_MESSAGE = _(
+            "{processed}/{total} done, {failed} failed, {rate} files/min"
+        )
         BATCH_CONVERSION_CANCELLED_TITLE = _("Batch Conversion Cancelled")
         BATCH_CONVERSION_CANCELLED_MESSAGE = _(
             "Conversion cancelled after processing {completed} of {total} files to {extension}"
@@ -350,6 +374,60 @@ class Text:
         FILES_ARGUMENT_HELP = _(
             "File paths to convert (optional; opens picker if none)"
         )
+        PROFILE_ARGUMENT_HELP = _(
+            "Write a cProfile dump and startup timings to PATH "
+            "(also enabled by the SCF_PROFILE environment variable)"
+        )
+        WATCH_DESCRIPTION = _(
+            "Watch a directory and convert every new file dropped into it."
+        )
+        WATCH_DIRECTORY_HELP = _("Directory to watch (including subdirectories)")
+        TARGET_FORMAT_ARGUMENT_HELP = _("Target format (e.g. PDF, PNG, MP3)")
+        TARGET_FORMATS_ARGUMENT_HELP = _(
+            "Target format, or several comma-separated formats converted from a single decode (e.g. MP4,WEBM,GIF)"
+        )
+        OUTPUT_DIRECTORY_ARGUMENT_HELP = _(
+            "Directory receiving the converted files, mirroring the watched tree"
+        )
+        WORKERS_ARGUMENT_HELP = _("Number of parallel conversions")
+        NOT_A_DIRECTORY_MESSAGE = _("Not a directory: {path}")
+        WATCH_STARTED_MESSAGE = _(
+            "Watching {source} for new files, converting to {extension} into {output}. Press Ctrl+C to stop."
+        )
+        WATCH_CONVERTED_MESSAGE = _("Converted: {file} -> {output}")
+        WATCH_FAILED_MESSAGE = _("Failed: {file}: {error}")
+        WATCH_STOPPED_MESSAGE = _(
+            "Stopped watching. {converted} converted, {failed} failed."
+        )
+        CONVERT_DESCRIPTION = _(
+            "Convert files without dialogs through the background conversion service."
+        )
+        CONVERT_FILES_ARGUMENT_HELP = _("File paths to convert")
+        CONVERT_OUTPUT_ARGUMENT_HELP = _(
+            "Directory receiving the converted files (default: next to each file)"
+        )
+        SERVICE_UNAVAILABLE_MESSAGE = _(
+            "The conversion service is not available: {error}"
+        )
+        CONVERT_SIZE_ARGUMENT_HELP = _(
+            "Downscale images to fit within WIDTHxHEIGHT (e.g. 1920x1080), decoding JPEG files at a reduced size"
+        )
+        PREVIEWS_DESCRIPTION = _(
+            "Generate previews of images and videos at several sizes, decoding each file once."
+        )
+        PREVIEWS_FILES_ARGUMENT_HELP = _("Image or video files")
+        PREVIEW_SIZES_ARGUMENT_HELP = _(
+            "Comma-separated preview sizes, as a box side or WIDTHxHEIGHT (e.g. 1024,512,320x180)"
+        )
+        PREVIEW_FORMAT_ARGUMENT_HELP = _("Preview format: JPEG, PNG or WEBP")
+        PREVIEW_UNSUPPORTED_MESSAGE = _("not an image or video file")
+        SERVE_DESCRIPTION = _(
+            "Run the background conversion service used by the convert command."
+        )
+        SOCKET_ARGUMENT_HELP = _("Unix socket to listen on")
+        IDLE_TIMEOUT_ARGUMENT_HELP = _(
+            "Exit after this many seconds without requests (0 to never exit)"
+        )
         GITHUB_LINK_MESSAGE = _("For more info, visit {url}").format(
             url="https://github.com/ThigSchuch/SimplyConvertFile"
         )
@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+"""
+CPU core budget shared by the conversions running in parallel.
+
+FFmpeg encoders, ImageMagick (OpenMP), 7-Zip and xz each start one thread
+per core by default, so N conversions running side by side (watch workers,
+concurrent service clients) would run N times more threads than there are
+cores and lose time to context switches. The budget divides the cores among
+the conversions expected to run at the same time: the jobs reserved by a
+parallel engine (e.g. the watch workers) or, without reservation, the jobs
+actually running.
+
+Each conversion gets its share through the ``{threads}`` placeholder and,
+when the share is smaller than the whole machine, through the FFmpeg and
+7-Zip thread options added to its template (see inject_thread_options) and
+the ``MAGICK_THREAD_LIMIT``, ``OMP_NUM_THREADS`` and ``XZ_DEFAULTS``
+environment variables of its command (see ProcessLimits).
+"""
+
+import contextlib
+import os
+import threading
+from typing import Iterator
+
+from simplyconvertfile.config import settings_manager
+
+
+class ThreadBudget:
+    """Division of the CPU cores among parallel conversions.
+
+    Attributes:
+        _running: Conversions currently running in this process.
+        _reserved: Parallel jobs announced by running engines.
+
+    Examples:
+        >>> with thread_budget.reserve(4):
+        ...     thread_budget.get_share()  # on 8 cores
+        2
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty budget."""
+        self._lock = threading.Lock()
+        self._running = 0
+        self._reserved = 0
+
+    @property
+    def settings(self) -> dict:
+        """The ``thread_budget`` settings section."""
+        return settings_manager.get("thread_budget", {})
+
+    @property
+    def cores(self) -> int:
+        """Number of cores to divide: ``thread_budget.cores`` or the usable CPUs."""
+        cores = self.settings.get("cores")
+        if cores:
+            return max(int(cores), 1)
+        with contextlib.suppress(AttributeError, OSError):
+            return len(os.sched_getaffinity(0))
+        return os.cpu_count() or 1
+
+    def get_share(self) -> int:
+        """Get the number of threads for a conversion about to start.
+
+        Returns:
+            int: The cores divided by the reserved jobs, or by the running
+                jobs plus this one, at least 1. All cores when the budget is
+                disabled.
+        """
+        cores = self.cores
+        if not self.settings.get("enabled", True):
+            return cores
+        with self._lock:
+            jobs = max(self._reserved, self._running + 1)
+        return max(cores // jobs, 1)
+
+    @contextlib.contextmanager
+    def reserve(self, jobs: int) -> Iterator[None]:
+        """Announce jobs that will run in parallel until the context exits.
+
+        Args:
+            jobs: Number of parallel jobs (e.g. worker threads).
+        """
+        with self._lock:
+            self._reserved += jobs
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._reserved -= jobs
+
+    @contextlib.contextmanager
+    def job(self) -> Iterator[None]:
+        """Count a conversion as running until the context exits."""
+        with self._lock:
+            self._running += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._running -= 1
+
+
+thread_budget = ThreadBudget()
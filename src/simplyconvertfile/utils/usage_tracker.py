@@ -4,12 +4,14 @@ Usage tracking for format conversions.
 
 This module tracks which format conversions users perform most frequently,
 enabling intelligent pre-selection of target formats based on historical usage.
+
+Recorded conversions are kept in memory and written in one go, a few seconds
+later or when the process exits (see JsonStore).
 """
 
-import json
-from pathlib import Path
 from typing import Dict, Optional
 
+from simplyconvertfile.utils.json_store import JsonStore
 from simplyconvertfile.utils.logging import logger
 
 
@@ -30,8 +32,11 @@ class UsageTracker:
     }
 
     Attributes:
-        _usage_file: Path to the usage tracking JSON file.
-        _usage_data: In-memory cache of usage statistics.
+        _store: The usage tracking JSON file and its in-memory content.
+
+    Class Attributes:
+        FLUSH_DELAY: Seconds between a recorded conversion and the write,
+                    so conversions recorded in the meantime share one write.
 
     Examples:
         >>> tracker = UsageTracker()
@@ -41,6 +46,8 @@ class UsageTracker:
         'PNG'
     """
 
+    FLUSH_DELAY = 5.0
+
     def __init__(self) -> None:
         """Initialize the usage tracker.
 
@@ -49,60 +56,58 @@ class UsageTracker:
         Returns:
             None
         """
-        self._usage_file = (
-            Path.home() / ".config" / "simplyconvertfile" / "usage_stats.json"
+        self._store = JsonStore(
+            "usage_stats.json",
+            self._merge_counts,
+            "usage statistics",
+            flush_delay=self.FLUSH_DELAY,
+            indent=2,
         )
-        self._usage_data: Dict[str, Dict[str, int]] = {}
         self._load_usage_data()
 
+    @property
+    def _usage_data(self) -> Dict[str, Dict[str, int]]:
+        """Usage statistics, including counts not yet written."""
+        return self._store.data
+
     def _load_usage_data(self) -> None:
         """Load usage statistics from the tracking file.
 
         Reads the usage tracking file and loads data into memory.
-        Creates an empty tracking file if it doesn't exist.
+        A missing file is created on the first flush.
 
         Returns:
             None
         """
-        logger.debug("Loading usage statistics from: {}", self._usage_file)
-        if not self._usage_file.exists():
-            logger.debug("Usage file does not exist, creating new tracking file")
-            self._usage_data = {}
-            self._save_usage_data()
-            return
-
-        try:
-            with open(self._usage_file, "r", encoding="utf-8") as file:
-                self._usage_data = json.load(file)
-            logger.debug(
-                "Usage statistics loaded successfully: {} source formats tracked",
-                len(self._usage_data),
-            )
-        except (json.JSONDecodeError, IOError) as e:
-            logger.error("Failed to load usage statistics: {}", str(e))
-            self._usage_data = {}
-
-    def _save_usage_data(self) -> None:
-        """Save usage statistics to the tracking file.
-
-        Writes the current usage data to disk, creating directories if needed.
+        logger.debug(
+            "Usage statistics loaded: {} source formats tracked",
+            len(self._usage_data),
+        )
+
+    def flush(self) -> None:
+        """Write the pending counts to the tracking file.
 
         Returns:
             None
         """
-        logger.debug("Saving usage statistics to: {}", self._usage_file)
-        try:
-            self._usage_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._usage_file, "w", encoding="utf-8") as file:
-                json.dump(self._usage_data, file, indent=2)
-            logger.debug("Usage statistics saved successfully")
-        except IOError as e:
-            logger.error("Failed to save usage statistics: {}", str(e))
+        self._store.flush()
+
+    @staticmethod
+    def _merge_counts(
+        usage_data: Dict[str, Dict[str, int]], counts: Dict[str, Dict[str, int]]
+    ) -> None:
+        """Add counts to usage data in place."""
+        for source, targets in counts.items():
+            source_stats = usage_data.setdefault(source, {})
+            for target, count in targets.items():
+                source_stats[target] = source_stats.get(target, 0) + count
 
     def record_conversion(self, source_format: str, target_format: str) -> None:
         """Record a conversion in the usage statistics.
 
         Increments the usage count for the given source→target conversion pair.
+        The count is written by the next flush, FLUSH_DELAY seconds later or
+        at exit.
 
         Args:
             source_format: Source format of the conversion (case-insensitive).
@@ -120,20 +125,7 @@ class UsageTracker:
 
         logger.debug("Recording conversion: {} -> {}", source_upper, target_upper)
 
-        if source_upper not in self._usage_data:
-            self._usage_data[source_upper] = {}
-
-        current_count = self._usage_data[source_upper].get(target_upper, 0)
-        self._usage_data[source_upper][target_upper] = current_count + 1
-
-        logger.debug(
-            "Conversion count updated: {} -> {} = {}",
-            source_upper,
-            target_upper,
-            current_count + 1,
-        )
-
-        self._save_usage_data()
+        self._store.add({source_upper: {target_upper: 1}})
 
     def get_most_used_format(self, source_format: str) -> Optional[str]:
         """Get the most frequently used target format for a source format.
@@ -6,13 +6,71 @@ This module provides centralized file validation logic used across
 single and batch conversion operations.
 """
 
+import os
+import stat
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
-from simplyconvertfile.config import format_config
+from simplyconvertfile.config import format_config, settings_manager
 from simplyconvertfile.utils import text
 from simplyconvertfile.utils.logging import logger
+from simplyconvertfile.utils.sniffer import content_sniffer
+
+# Filesystem types whose metadata calls need a server round trip
+NETWORK_FILESYSTEMS = frozenset(
+    {
+        "9p",
+        "afs",
+        "ceph",
+        "cifs",
+        "fuse.gvfsd-fuse",
+        "fuse.rclone",
+        "fuse.sshfs",
+        "glusterfs",
+        "nfs",
+        "nfs4",
+        "smb3",
+        "smbfs",
+    }
+)
+
+
+@lru_cache(maxsize=1)
+def _get_mount_types() -> Dict[int, str]:
+    """Get the filesystem type of each mounted device from /proc.
+
+    Returns:
+        Dict[int, str]: Filesystem type keyed by device number.
+    """
+    mount_types = {}
+    try:
+        with open("/proc/self/mountinfo", encoding="utf-8") as mountinfo:
+            for line in mountinfo:
+                fields, _, filesystem = line.partition(" - ")
+                major, minor = fields.split()[2].split(":")
+                mount_types[os.makedev(int(major), int(minor))] = filesystem.split()[0]
+    except (OSError, ValueError, IndexError):
+        pass
+    return mount_types
+
+
+def _is_network_directory(directory: str) -> bool:
+    """Whether a directory is located on a network filesystem.
+
+    Args:
+        directory: Directory path ("" for the current directory).
+
+    Returns:
+        bool: True for NFS, SMB, sshfs and similar mounts.
+    """
+    try:
+        device = os.stat(directory or ".").st_dev
+    except (OSError, ValueError):
+        return False
+    return _get_mount_types().get(device) in NETWORK_FILESYSTEMS
 
 
 class FileValidator:
@@ -24,6 +82,17 @@ class FileValidator:
 
     All methods are static and can be called without instantiating the class.
 
+    Content sniffing (the ``content_sniffing`` setting) compares the first
+    bytes of each file with its extension: ``"reroute"`` uses the detected
+    format instead, ``"fail"`` rejects mismatched files, ``"off"`` (default)
+    trusts the extension.
+
+    Class Attributes:
+        SCANDIR_MIN_FILES: Selected files in one directory from which the
+                          directory is listed once instead of stat'ing each file.
+        MAX_STAT_WORKERS: Maximum threads used to check directories in
+                         parallel (stat calls block on network filesystems).
+
     Examples:
         >>> from pathlib import Path
         >>> file_path = Path("/tmp/test.jpg")
@@ -32,6 +101,9 @@ class FileValidator:
         ...     print(f"Error: {error}")
     """
 
+    SCANDIR_MIN_FILES = 32
+    MAX_STAT_WORKERS = 16
+
     @staticmethod
     def validate_single_file(file_path: Path) -> Tuple[bool, Optional[str]]:
         """Validate that a single file exists and is convertible.
@@ -57,39 +129,66 @@ class FileValidator:
             ...     print(f"Validation failed: {error}")
         """
         logger.debug("Validating single file: {}", file_path)
-        if not file_path.exists():
+        try:
+            file_mode: Optional[int] = os.stat(file_path).st_mode
+        except (OSError, ValueError):
+            file_mode = None
+        format_group, error_msg = FileValidator._check_file_mode(file_path, file_mode)
+        return format_group is not None, error_msg
+
+    @staticmethod
+    def _check_file_mode(
+        file_path: Path, file_mode: Optional[int]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Validate a file from its already known stat mode.
+
+        Args:
+            file_path: Path to the file to validate.
+            file_mode: The file's st_mode, or None if it does not exist.
+
+        Returns:
+            Tuple[Optional[str], Optional[str]]: The file's format group if it
+                is valid for conversion, otherwise None and an error message.
+        """
+        if file_mode is None:
             logger.debug("File does not exist: {}", file_path)
-            return False, text.Validation.FILE_NOT_FOUND_MESSAGE.format(path=file_path)
+            return None, text.Validation.FILE_NOT_FOUND_MESSAGE.format(path=file_path)
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(file_mode):
             logger.debug("Path is not a file: {}", file_path)
-            return False, text.Validation.INVALID_FILE_MESSAGE.format(path=file_path)
+            return None, text.Validation.INVALID_FILE_MESSAGE.format(path=file_path)
 
-        if not file_path.suffix:
+        file_format = FileValidator.get_file_format(file_path)
+        if not file_format:
             logger.debug("File has no extension: {}", file_path)
-            return False, text.Validation.MISSING_EXTENSION_MESSAGE.format(
+            return None, text.Validation.MISSING_EXTENSION_MESSAGE.format(
                 path=file_path
             )
 
-        file_format = FileValidator.get_file_format(file_path)
-
         format_group = format_config.get_format_group(file_format)
         if not format_group:
             logger.debug("Unsupported format: {}", file_format)
-            return False, text.Validation.UNSUPPORTED_FORMAT_ERROR_MESSAGE.format(
+            return None, text.Validation.UNSUPPORTED_FORMAT_ERROR_MESSAGE.format(
                 extension=file_format
             )
 
+        content_error = FileValidator.check_file_content(file_path)
+        if content_error:
+            return None, content_error
+
         logger.debug(
             "File validation successful: {} (group: {})", file_path, format_group
         )
-        return True, None
+        return format_group, None
 
     @staticmethod
-    @lru_cache(maxsize=512)
     def get_file_format(file_path: Path) -> str:
         """Get the format of a file based on its extension.
 
+        With ``content_sniffing`` set to ``"reroute"``, a file whose content
+        clearly belongs to another format (e.g. a ``.jpg`` holding WebP data)
+        gets the detected format instead, so the matching rule is used.
+
         Extracts the file extension and validates it against known format groups.
         Dynamically handles compound extensions (like .tar.bz2) by checking all
         registered formats in the configuration. Falls back to simple extension
@@ -116,29 +215,96 @@ class FileValidator:
             >>> print(fmt)
             ''
         """
+        extension_format = FileValidator._get_extension_format(file_path)
+        if FileValidator._get_sniffing_mode() == "reroute":
+            mismatch = content_sniffer.get_mismatch(file_path, extension_format)
+            if mismatch and mismatch.format:
+                logger.info(
+                    "Treating {} as {} based on its content",
+                    file_path.name,
+                    mismatch.format,
+                )
+                return mismatch.format
+        return extension_format
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _get_extension_format(file_path: Path) -> str:
+        """Get the format of a file from its extension only (see get_file_format)."""
         logger.debug("Getting file format for: {}", file_path)
         if not file_path.suffix:
             logger.debug("File has no extension")
             return ""
 
         filename_lower = file_path.name.lower()
+        extension_formats = FileValidator._get_extension_formats()
 
-        all_formats = set()
-        for group in format_config._format_groups.values():
-            all_formats.update(group.formats)
-
-        sorted_formats = sorted(all_formats, key=len, reverse=True)
-
-        for format_name in sorted_formats:
-            extension_pattern = "." + format_name.lower()
-            if filename_lower.endswith(extension_pattern):
+        # Leftmost dot first, so compound extensions win (.tar.bz2 over .bz2)
+        dot_index = filename_lower.find(".")
+        while dot_index != -1:
+            format_name = extension_formats.get(filename_lower[dot_index:])
+            if format_name:
                 logger.debug("Format recognized: {}", format_name)
                 return format_name
+            dot_index = filename_lower.find(".", dot_index + 1)
 
         fallback_format = file_path.suffix[1:].upper()
         logger.debug("Using fallback format: {}", fallback_format)
         return fallback_format
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_extension_formats() -> Dict[str, str]:
+        """Get the registered formats keyed by their lowercase extension.
+
+        Returns:
+            Dict[str, str]: Format names keyed by extension (e.g. ".tar.bz2").
+        """
+        extension_formats = {}
+        for group in format_config._format_groups.values():
+            for format_name in group.formats:
+                extension_formats["." + format_name.lower()] = format_name
+        return extension_formats
+
+    @staticmethod
+    def check_file_content(file_path: Path) -> Optional[str]:
+        """Reject a file whose content does not match its extension.
+
+        Only active with ``content_sniffing`` set to ``"fail"``, so mislabeled
+        files fail before any conversion tool is started. Files whose content
+        has no known signature (text formats, unknown data) always pass.
+
+        Args:
+            file_path: Path to the file to check.
+
+        Returns:
+            Optional[str]: Error message if the content contradicts the
+                          extension, None otherwise.
+
+        Examples:
+            >>> FileValidator.check_file_content(Path("/tmp/photo.jpg"))
+            'Content does not match the file extension: ...'
+        """
+        if FileValidator._get_sniffing_mode() != "fail":
+            return None
+
+        extension_format = FileValidator._get_extension_format(file_path)
+        mismatch = content_sniffer.get_mismatch(file_path, extension_format)
+        if not mismatch:
+            return None
+
+        logger.debug("Rejecting mislabeled file: {}", file_path)
+        return text.Validation.CONTENT_MISMATCH_MESSAGE.format(
+            path=file_path,
+            extension=extension_format,
+            detected=mismatch.format or "/".join(sorted(mismatch.family)),
+        )
+
+    @staticmethod
+    def _get_sniffing_mode() -> str:
+        """Get the content sniffing mode ("off", "reroute" or "fail")."""
+        return str(settings_manager.get("content_sniffing", "off")).lower()
+
     @staticmethod
     @lru_cache(maxsize=512)
     def get_base_name_and_extension(file_path: Path) -> tuple[str, str]:
@@ -163,7 +329,7 @@ class FileValidator:
             >>> FileValidator.get_base_name_and_extension(Path("noext"))
             ('noext', '')
         """
-        file_format = FileValidator.get_file_format(file_path)
+        file_format = FileValidator._get_extension_format(file_path)
 
         if file_format:
             extension = "." + file_format.lower()
@@ -185,6 +351,12 @@ class FileValidator:
         Groups valid files by their format groups and collects all error messages.
         Handles compound extensions like .tar.bz2 properly.
 
+        Each file costs at most one stat call: files are grouped by parent
+        directory and directories holding many of the selected files are
+        listed once with os.scandir. Directories on network filesystems are
+        checked in parallel threads so large selections do not stall on
+        latency; local directories are checked serially.
+
         Args:
             file_paths: List of file paths to validate.
 
@@ -200,21 +372,21 @@ class FileValidator:
             >>> print(f"Valid files: {len(valid)}, Groups: {groups}")
         """
         logger.debug("Validating file list with {} files", len(file_paths))
+        file_modes = FileValidator._get_file_modes(file_paths)
+
         valid_files = []
         detected_groups = set()
         error_messages = []
 
-        for file_path in file_paths:
-            is_valid, error_msg = FileValidator.validate_single_file(file_path)
-            if not is_valid:
-                error_messages.append(error_msg)
-                continue
-
-            file_format = FileValidator.get_file_format(file_path)
-            format_group = format_config.get_format_group(file_format)
+        for file_path, file_mode in zip(file_paths, file_modes):
+            format_group, error_msg = FileValidator._check_file_mode(
+                file_path, file_mode
+            )
             if format_group:
                 valid_files.append(file_path)
                 detected_groups.add(format_group)
+            else:
+                error_messages.append(error_msg)
 
         logger.debug(
             "File list validation complete: {} valid files, {} groups, {} errors",
@@ -224,12 +396,106 @@ class FileValidator:
         )
         return valid_files, detected_groups, error_messages
 
+    @staticmethod
+    def _get_file_modes(file_paths: List[Path]) -> List[Optional[int]]:
+        """Get the stat mode of every file, checking one directory per task.
+
+        Directories on network filesystems are checked in parallel threads,
+        since each stat call there waits for a server round trip. Local
+        directories are checked serially, where threads only add overhead.
+
+        Args:
+            file_paths: Files to check.
+
+        Returns:
+            List[Optional[int]]: st_mode of each path (symlinks followed), in
+                                the same order, or None if it does not exist.
+        """
+        by_directory: Dict[str, List[int]] = defaultdict(list)
+        paths = [os.fspath(file_path) for file_path in file_paths]
+        for index, path in enumerate(paths):
+            by_directory[os.path.dirname(path)].append(index)
+
+        file_modes: List[Optional[int]] = [None] * len(paths)
+
+        def check_directory(directory: str) -> None:
+            indexes = by_directory[directory]
+            modes = FileValidator._get_directory_file_modes(
+                directory, [paths[index] for index in indexes]
+            )
+            for index, mode in zip(indexes, modes):
+                file_modes[index] = mode
+
+        remote_directories = [
+            directory for directory in by_directory if _is_network_directory(directory)
+        ]
+        local_directories = by_directory.keys() - set(remote_directories)
+
+        for directory in local_directories:
+            check_directory(directory)
+
+        workers = min(FileValidator.MAX_STAT_WORKERS, len(remote_directories))
+        if workers > 1:
+            logger.debug(
+                "Checking {} network directories with {} threads",
+                len(remote_directories),
+                workers,
+            )
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="validate"
+            ) as executor:
+                list(executor.map(check_directory, remote_directories))
+        else:
+            for directory in remote_directories:
+                check_directory(directory)
+
+        return file_modes
+
+    @staticmethod
+    def _get_directory_file_modes(
+        directory: str, paths: List[str]
+    ) -> List[Optional[int]]:
+        """Get the stat mode of files sharing the same parent directory.
+
+        When many files of the directory are selected, the directory is listed
+        once and regular files are recognized from their directory entry
+        (usually without any stat call); other entries fall back to os.stat.
+
+        Args:
+            directory: Parent directory of all paths ("" for the current one).
+            paths: Files located in the directory.
+
+        Returns:
+            List[Optional[int]]: st_mode of each path, None if missing.
+        """
+        regular_files: Set[str] = set()
+        if len(paths) >= FileValidator.SCANDIR_MIN_FILES:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    regular_files = {
+                        entry.name for entry in entries if entry.is_file()
+                    }
+            except OSError:
+                pass
+
+        modes: List[Optional[int]] = []
+        for path in paths:
+            if os.path.basename(path) in regular_files:
+                modes.append(stat.S_IFREG)
+                continue
+            try:
+                modes.append(os.stat(path).st_mode)
+            except (OSError, ValueError):
+                modes.append(None)
+        return modes
+
     @staticmethod
     def get_available_formats(source_format: str) -> Tuple[str, ...]:
         """Get available target formats for a source format.
 
         Retrieves all possible target formats that the given source format
-        can be converted to, respecting format restrictions and special rules.
+        can be converted to, respecting format restrictions and special rules,
+        including formats only reachable through intermediate formats.
 
         Args:
             source_format: The source file format (case-insensitive).
@@ -243,7 +509,7 @@ class FileValidator:
             ('BMP', 'PNG', 'TIFF')
         """
         formats = (
-            format_config.get_available_formats(source_format) if source_format else ()
+            format_config.get_reachable_formats(source_format) if source_format else ()
         )
         logger.debug(
             "Available formats for {}: {} formats", source_format, len(formats)
@@ -0,0 +1,105 @@
+"""Tests for the throttled progress display."""
+
+import pytest
+
+from simplyconvertfile.utils import progress
+from simplyconvertfile.utils.progress import ProgressDisplay, ProgressModel
+
+# Dialog timeout used by BatchStateManager (PROGRESS_UPDATE_TIMEOUT_MS)
+TICK_INTERVAL = 0.01
+
+
+class FakeProgressBar:
+    """Counts the calls a GTK progress bar would receive."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def set_fraction(self, fraction: float) -> None:
+        self.calls += 1
+
+    def pulse(self) -> None:
+        self.calls += 1
+
+
+class FakeWindow:
+    """Minimal stand-in for ProgressbarDialogWindow."""
+
+    def __init__(self) -> None:
+        self.progressbar = FakeProgressBar()
+        self.messages = 0
+
+    def set_message(self, message: str) -> None:
+        self.messages += 1
+
+    @property
+    def calls(self) -> int:
+        return self.progressbar.calls + self.messages
+
+
+class FakeClock:
+    """Replaces time.monotonic with a clock advanced by the test."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake_clock = FakeClock()
+    monkeypatch.setattr(progress.time, "monotonic", fake_clock)
+    return fake_clock
+
+
+@pytest.mark.parametrize("jobs", [1, 8, 64])
+def test_refresh_calls_are_capped_per_second(clock: FakeClock, jobs: int) -> None:
+    model = ProgressModel(total=jobs)
+    window = FakeWindow()
+    display = ProgressDisplay(window, model)
+    for job_id in range(jobs):
+        model.start_job(job_id, f"file{job_id}.mp4")
+
+    for second in range(3):
+        calls_before = window.calls
+        for tick in range(int(1 / TICK_INTERVAL)):
+            # Every job reports progress and a new message between ticks
+            for job_id in range(jobs):
+                model.update_job(
+                    job_id, tick * TICK_INTERVAL, f"file{job_id}.mp4 {tick}"
+                )
+            display.refresh()
+            clock.now += TICK_INTERVAL
+
+        assert window.calls - calls_before <= 2 * ProgressDisplay.MAX_FPS
+    assert display.updates == window.calls
+
+
+def test_unchanged_revision_makes_no_calls(clock: FakeClock) -> None:
+    model = ProgressModel(total=2)
+    window = FakeWindow()
+    display = ProgressDisplay(window, model)
+    model.start_job(0, "a.jpg")
+    model.update_job(0, 0.5)
+    display.refresh()
+    calls = window.calls
+    assert calls == 2
+
+    for _ in range(100):
+        clock.now += 1.0
+        display.refresh()
+
+    assert window.calls == calls
+    assert display.updates == calls
+
+
+def test_pulse_is_capped_per_second(clock: FakeClock) -> None:
+    window = FakeWindow()
+    display = ProgressDisplay(window)
+    for _ in range(int(1 / TICK_INTERVAL)):
+        display.pulse()
+        clock.now += TICK_INTERVAL
+
+    assert window.progressbar.calls <= ProgressDisplay.MAX_FPS